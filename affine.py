@@ -0,0 +1,131 @@
+# --- Mesin Transformasi Affine ---
+# Semua transformasi (translasi, rotasi, skala) dinyatakan sebagai satu matriks affine
+# 3x3. Matriks disimpan sebagai tuple 6 angka (a, b, c, d, e, f) yang mewakili:
+#     | a  b  c |       x' = a*x + b*y + c
+#     | d  e  f |       y' = d*x + e*y + f
+#     | 0  0  1 |
+# Jika NumPy tersedia, titik-titik objek disimpan sebagai array (N, 2) dan matriks
+# diterapkan sekaligus lewat satu perkalian matriks. Tanpa NumPy, dipakai jalur
+# Python murni yang menghasilkan list tuple (x, y).
+import math
+
+try:
+    import numpy as np
+except ImportError:  # NumPy bersifat opsional.
+    np = None
+
+# Penanda apakah jalur NumPy aktif. Bisa dimatikan secara manual (misalnya untuk benchmark).
+HAVE_NUMPY = np is not None
+
+# Matriks identitas.
+IDENTITY = (1.0, 0.0, 0.0, 0.0, 1.0, 0.0)
+
+
+# --- Pembuat Matriks ---
+# Matriks translasi sebesar (dx, dy).
+def translation(dx, dy):
+    return (1.0, 0.0, dx, 0.0, 1.0, dy)
+
+# Matriks rotasi sebesar 'angle' radian mengelilingi titik 'center'.
+def rotation(angle, center=(0.0, 0.0)):
+    cx, cy = center
+    cos_a, sin_a = math.cos(angle), math.sin(angle)
+    return (cos_a, -sin_a, cx - cos_a * cx + sin_a * cy,
+            sin_a, cos_a, cy - sin_a * cx - cos_a * cy)
+
+# Matriks skala seragam sebesar 'factor' terhadap titik 'center'.
+def scaling(factor, center=(0.0, 0.0)):
+    cx, cy = center
+    return (factor, 0.0, cx - factor * cx, 0.0, factor, cy - factor * cy)
+
+# Menggabungkan dua matriks: hasilnya sama dengan menerapkan 'first' lalu 'second'.
+def compose(second, first):
+    a2, b2, c2, d2, e2, f2 = second
+    a1, b1, c1, d1, e1, f1 = first
+    return (a2 * a1 + b2 * d1, a2 * b1 + b2 * e1, a2 * c1 + b2 * f1 + c2,
+            d2 * a1 + e2 * d1, d2 * b1 + e2 * e1, d2 * c1 + e2 * f1 + f2)
+
+# Menghitung invers matriks affine.
+def invert(m):
+    a, b, c, d, e, f = m
+    det = a * e - b * d
+    if det == 0: raise ZeroDivisionError("matriks affine tidak bisa diinvers")
+    ia, ib, id_, ie = e / det, -b / det, -d / det, a / det
+    return (ia, ib, -(ia * c + ib * f), id_, ie, -(id_ * c + ie * f))
+
+# Faktor skala rata-rata dari sebuah matriks (akar determinan), dipakai untuk ketebalan garis.
+def matrix_scale(m):
+    return math.sqrt(abs(m[0] * m[4] - m[1] * m[3]))
+
+# Mengubah tuple matriks menjadi array NumPy 3x3.
+def to_numpy(m):
+    a, b, c, d, e, f = m
+    return np.array([[a, b, c], [d, e, f], [0.0, 0.0, 1.0]])
+
+
+# --- Helper Kumpulan Titik ---
+# Kumpulan titik bisa berupa list tuple (x, y) atau array NumPy (N, 2).
+# Fungsi-fungsi berikut menangani keduanya.
+
+# Mengecek apakah kumpulan titik berupa array NumPy.
+def is_array(points):
+    return np is not None and isinstance(points, np.ndarray)
+
+# Mengubah kumpulan titik menjadi array (N, 2) bertipe float.
+def as_array(points):
+    if is_array(points): return points
+    return np.asarray(points, dtype=float).reshape(-1, 2)
+
+# Mengubah kumpulan titik menjadi list tuple (x, y).
+def as_list(points):
+    if is_array(points): return [tuple(p) for p in points.tolist()]
+    return list(points)
+
+# Meratakan kumpulan titik menjadi [x1, y1, x2, y2, ...] (format yang diterima kanvas).
+def flatten(points):
+    if is_array(points): return points.ravel().tolist()
+    return [c for p in points for c in p]
+
+# Menerapkan matriks affine pada kumpulan titik dan mengembalikan kumpulan titik baru.
+def apply(m, points):
+    if HAVE_NUMPY:
+        # Satu perkalian matriks untuk semua titik. Baris terakhir matriks selalu
+        # [0 0 1], jadi [x y 1] @ M^T cukup dihitung sebagai bagian linear + translasi
+        # tanpa membuat kolom homogen tambahan.
+        matrix = to_numpy(m)
+        return as_array(points) @ matrix[:2, :2].T + matrix[:2, 2]
+    a, b, c, d, e, f = m
+    return [(a * x + b * y + c, d * x + e * y + f) for x, y in points]
+
+# Menerapkan matriks affine pada satu titik.
+def apply_point(m, point):
+    x, y = point
+    return (m[0] * x + m[1] * y + m[2], m[3] * x + m[4] * y + m[5])
+
+# Menerapkan matriks affine pada bounding box. Hasilnya tepat untuk matriks tanpa
+# rotasi/shear; untuk matriks umum hasilnya adalah bounding box yang melingkupinya.
+def transform_bbox(m, box):
+    if box is None: return None
+    xmin, ymin, xmax, ymax = box
+    corners = [apply_point(m, p) for p in ((xmin, ymin), (xmax, ymin), (xmax, ymax), (xmin, ymax))]
+    xs = [p[0] for p in corners]; ys = [p[1] for p in corners]
+    return (min(xs), min(ys), max(xs), max(ys))
+
+# Menghitung titik tengah (rata-rata) kumpulan titik.
+def centroid(points):
+    if len(points) == 0: return 0, 0
+    if is_array(points):
+        cx, cy = points.mean(axis=0)
+        return float(cx), float(cy)
+    xs = [p[0] for p in points]; ys = [p[1] for p in points]
+    return sum(xs) / len(xs), sum(ys) / len(ys)
+
+# Menghitung bounding box (xmin, ymin, xmax, ymax) kumpulan titik.
+def bbox(points):
+    if len(points) == 0: return None
+    if is_array(points):
+        (xmin, ymin), (xmax, ymax) = points.min(axis=0), points.max(axis=0)
+        return (float(xmin), float(ymin), float(xmax), float(ymax))
+    xs = [p[0] for p in points]
+    ys = [p[1] for p in points]
+    return (min(xs), min(ys), max(xs), max(ys))
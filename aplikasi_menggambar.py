@@ -3,8 +3,54 @@
 import tkinter as tk
 # Mengimpor modul colorchooser dari tkinter, yang menyediakan dialog untuk memilih warna.
 from tkinter import colorchooser
-# Mengimpor library math untuk operasi matematika, seperti sinus dan kosinus yang digunakan dalam rotasi.
-import math
+# Mengimpor dialog file dan kotak pesan untuk menyimpan dan membuka adegan.
+from tkinter import filedialog, messagebox
+# Mengimpor model adegan dan logika geometri yang tidak bergantung pada tkinter.
+from scene import Scene, Shape, rect_corners, ellipse_shape, COMPACT_BATCH
+import clipping
+# Mengimpor clipping paralel multi-proses untuk adegan yang sangat besar.
+import parallel_clipping
+import transforms
+import windowing
+# Mengimpor renderer retained-mode yang hanya memperbarui item kanvas yang berubah.
+from renderer import CanvasRenderer
+# Mengimpor renderer berbasis tile untuk kanvas yang besar dan padat.
+from tile_renderer import TileRenderer
+# Mengimpor indeks spasial untuk query window, clipping, dan persinggungan.
+from spatial_index import GridIndex
+# Mengimpor hit-testing geometris untuk memilih objek yang tepat di bawah kursor.
+from hit_test import HitTester
+# Mengimpor viewport (zoom/pan) yang memetakan koordinat dunia ke layar.
+from viewport import Viewport, ZOOM_STEP
+import affine
+# Mengimpor penyederhanaan goresan (Ramer-Douglas-Peucker).
+import simplify
+# Mengimpor penyimpanan adegan (format biner dan JSON).
+import scene_io
+# Mengimpor pemuat bertahap agar adegan besar tidak membekukan antarmuka.
+from progressive import ProgressiveLoader
+# Mengimpor riwayat undo/redo berbasis log perintah.
+from history import History
+# Mengimpor penjadwal render yang membatasi penggambaran paling banyak sekali per frame.
+from scheduler import RenderScheduler, DEFAULT_FPS
+# Mengimpor instrumentasi latensi opsional (histogram, FPS, ekspor trace).
+from profiling import Profiler, FRAME
+
+# Jenis file adegan untuk dialog simpan/buka.
+SCENE_FILETYPES = [("Adegan biner", "*.drw"), ("JSON", "*.json"), ("Semua file", "*.*")]
+# Metode DrawingApp yang diukur saat instrumentasi aktif, beserta nama tahapnya.
+PROFILED_METHODS = {
+    '_on_mouse_down': 'event.mouse_down', '_on_mouse_move': 'event.mouse_move',
+    '_on_mouse_up': 'event.mouse_up', '_apply_pending_motion': 'motion',
+    'redraw_all': 'redraw', '_apply_windowing_effect': 'windowing',
+    '_perform_clipping': 'clipping', '_select_object': 'select',
+}
+# Selang minimum (detik) antara dua pembaruan angka waktu frame/FPS di status bar.
+PROFILE_STATUS_INTERVAL = 0.25
+# Bit tombol Shift pada event.state Tk (Shift-klik menambah/mengurangi seleksi).
+SHIFT_MASK = 0x0001
+# Toleransi klik saat memilih objek, dalam piksel layar (sama pada setiap zoom).
+HIT_TOLERANCE = 5
 
 # --- Definisi Kelas Utama Aplikasi ---
 # Mendefinisikan kelas DrawingApp yang akan menampung semua komponen dan logika aplikasi.
@@ -13,7 +59,9 @@ class DrawingApp:
     # Fungsi __init__ adalah metode khusus yang dijalankan saat sebuah objek dari kelas ini dibuat.
     # Tujuannya adalah untuk menyiapkan jendela utama dan semua variabel yang dibutuhkan aplikasi.
     # 'self' merujuk pada objek itu sendiri, dan 'root' adalah jendela utama dari tkinter.
-    def __init__(self, root):
+    # 'render_mode' memilih renderer kanvas: 'items' (satu item kanvas per objek) atau
+    # 'tiles' (gambar offscreen per tile yang hanya digambar ulang di area kotor).
+    def __init__(self, root, render_mode='items'):
         # Menyimpan referensi ke jendela utama (root) agar bisa diakses di seluruh kelas.
         self.root = root
         # Mengatur judul jendela aplikasi.
@@ -38,14 +86,23 @@ class DrawingApp:
         self.fill_shape = False
 
         # --- Inisialisasi Variabel Transformasi ---
-        # Variabel untuk menyimpan objek yang sedang dipilih untuk transformasi.
-        self.selected_object = None
+        # List objek yang sedang dipilih untuk transformasi (urut sesuai waktu dipilih).
+        # Transformasi pada lebih dari satu objek dijalankan sebagai satu operasi grup.
+        self.selected_objects = []
         # Variabel untuk menyimpan mode transformasi yang aktif (misalnya 'Translate', 'Rotate').
         self.transform_mode = None
         # Variabel untuk menyimpan posisi awal mouse saat memulai transformasi.
         self.transform_start_mouse_pos = None
+        # Sesi drag transformasi yang sedang berlangsung (transforms.DragTransform).
+        self.active_drag = None
         # Variabel untuk menyimpan ID dari kotak seleksi yang ditampilkan di sekitar objek.
         self.selection_box_id = None
+        # Variabel boolean untuk menandakan apakah pengguna sedang menarik persegi seleksi (marquee).
+        self.is_drawing_marquee = False
+        # Apakah hasil marquee ditambahkan ke seleksi yang ada (Shift ditahan).
+        self.marquee_extends = False
+        # Variabel untuk menyimpan ID dari persegi pratinjau marquee.
+        self.marquee_rect_id = None
 
         # --- Inisialisasi Variabel Menggambar ---
         # Variabel untuk menyimpan koordinat x awal saat mulai menggambar.
@@ -54,12 +111,46 @@ class DrawingApp:
         self.start_y = None
         # Variabel boolean untuk menandakan apakah proses menggambar (menahan mouse) sedang berlangsung.
         self.is_drawing = False
-        # List (daftar) untuk menyimpan semua data objek yang telah digambar di kanvas.
-        self.drawn_objects = []
+        # Adegan (Scene) yang menyimpan semua objek yang telah digambar di kanvas.
+        self.scene = Scene()
+        # Indeks spasial grid atas bounding box objek; diperbarui otomatis saat adegan berubah.
+        GridIndex().attach(self.scene)
+        # Hit-tester geometris untuk pemilihan objek (memakai indeks spasial di atas).
+        self.hit_tester = HitTester(self.scene)
+        # Riwayat undo/redo; setiap entri hanya menyimpan objek yang disentuh operasinya.
+        self.history = History(self.scene)
+        # Pemuatan bertahap yang sedang berjalan (progressive.ProgressiveLoader) atau None.
+        self.loader = None
         # Variabel untuk menyimpan ID dari bentuk pratinjau yang ditampilkan saat menggambar.
         self.current_preview_id = None
         # List untuk menyimpan titik-titik dari garis yang digambar dengan alat 'Pencil'.
         self.active_line_points = []
+        # Tag kanvas untuk segmen-segmen pratinjau goresan pensil.
+        self.pencil_preview_tag = "pencil_preview"
+        # Toleransi penyederhanaan goresan pensil dalam piksel (0 = tidak disederhanakan).
+        self.stroke_tolerance = simplify.DEFAULT_TOLERANCE
+        # Jumlah titik goresan pensil yang sudah tampil di pratinjau.
+        self.preview_point_count = 0
+
+        # --- Inisialisasi Penjadwal Render ---
+        # Jenis renderer kanvas ('items' atau 'tiles').
+        self.render_mode = render_mode
+        # Posisi mouse terbaru yang belum diproses (gerakan-gerakan di antara dua frame digabung).
+        self.pending_motion = None
+        # Penjadwal yang menggambar paling banyak sekali per frame sesuai target FPS.
+        self.render_scheduler = RenderScheduler(self.root, self._render_frame, DEFAULT_FPS)
+        # --- Inisialisasi Viewport ---
+        # Transformasi tampilan: objek disimpan dalam koordinat dunia, kanvas menampilkan
+        # hasil zoom/pan-nya. Event mouse dipetakan kembali ke dunia lewat to_world().
+        self.viewport = Viewport()
+        # Posisi layar terakhir saat menggeser tampilan (pan) dengan tombol tengah/kanan.
+        self.pan_anchor = None
+
+        # Instrumentasi latensi (nonaktif secara default; F12 untuk mengaktifkan).
+        self.profiler = Profiler()
+        self.profiler.on_frame = self._on_profiled_frame
+        # Waktu terakhir angka waktu frame/FPS di status bar diperbarui.
+        self._profile_status_time = 0.0
 
         # --- Inisialisasi Variabel Windowing & Clipping ---
         # Variabel untuk menyimpan koordinat dari jendela windowing/clipping (xmin, ymin, xmax, ymax).
@@ -68,6 +159,8 @@ class DrawingApp:
         self.is_drawing_window = False
         # Variabel untuk menyimpan ID dari persegi panjang pratinjau saat menggambar window.
         self.window_rect_id = None
+        # Algoritma clipping garis: 'cohen-sutherland' atau 'liang-barsky'.
+        self.clip_algorithm = clipping.DEFAULT_LINE_ALGORITHM
 
         # --- Palet Warna ---
         # List yang berisi string nama-nama warna standar untuk palet cepat.
@@ -77,7 +170,10 @@ class DrawingApp:
         ]
         
         # Variabel untuk menyimpan warna yang digunakan untuk menyorot objek saat windowing.
-        self.window_highlight_color = "red"
+        self.window_highlight_color = windowing.DEFAULT_HIGHLIGHT_COLOR
+        # Keanggotaan window yang dipelihara inkremental; objek yang disorot ada di
+        # self.window_highlighter.members.
+        self.window_highlighter = windowing.WindowHighlighter(self.scene, self.window_highlight_color)
 
         # --- Memanggil Fungsi Pembuat UI dan Status Bar ---
         # Memanggil metode _create_ui untuk membangun semua elemen antarmuka.
@@ -187,6 +283,22 @@ class DrawingApp:
                  bd=2, relief=tk.RAISED, bg="#C0C0C0",
                  command=self._clear_window).pack(pady=5)
 
+        # Membuat tombol untuk menyimpan dan membuka adegan.
+        file_frame = tk.Frame(left_toolbar, bg="#C0C0C0")
+        file_frame.pack(pady=5)
+        tk.Button(file_frame, text="Simpan", font=("Segoe UI", 9), bd=2, relief=tk.RAISED,
+                  bg="#C0C0C0", command=self.save_scene).pack(side="left", padx=2)
+        tk.Button(file_frame, text="Buka", font=("Segoe UI", 9), bd=2, relief=tk.RAISED,
+                  bg="#C0C0C0", command=self.open_scene).pack(side="left", padx=2)
+
+        # Membuat tombol Undo dan Redo.
+        history_frame = tk.Frame(left_toolbar, bg="#C0C0C0")
+        history_frame.pack(pady=5)
+        tk.Button(history_frame, text="Undo", font=("Segoe UI", 9), bd=2, relief=tk.RAISED,
+                  bg="#C0C0C0", command=self.undo).pack(side="left", padx=2)
+        tk.Button(history_frame, text="Redo", font=("Segoe UI", 9), bd=2, relief=tk.RAISED,
+                  bg="#C0C0C0", command=self.redo).pack(side="left", padx=2)
+
         # Membuat frame kontainer untuk kanvas dengan efek 'sunken' (tenggelam).
         canvas_container = tk.Frame(main_frame, bg="#808080", bd=2, relief=tk.SUNKEN)
         # Menempatkan kontainer kanvas.
@@ -195,6 +307,16 @@ class DrawingApp:
         self.canvas = tk.Canvas(canvas_container, bg=self.bg_color, bd=0, highlightthickness=0)
         # Menempatkan kanvas agar mengisi seluruh area kontainernya.
         self.canvas.pack(fill="both", expand=True)
+        # Renderer yang hanya memperbarui bagian kanvas yang berubah: item kanvas per objek,
+        # atau tile gambar offscreen yang digambar ulang hanya di area kotor.
+        # Keduanya hanya menggambar objek di area yang terlihat melalui viewport.
+        if self.render_mode == 'tiles':
+            self.renderer = TileRenderer(self.canvas, self.scene, tk.PhotoImage,
+                                         background=self.bg_color, viewport=self.viewport)
+        else:
+            self.renderer = CanvasRenderer(self.canvas, self.scene, viewport=self.viewport)
+        # Area yang baru terlihat setelah ukuran kanvas berubah perlu digambar.
+        self.canvas.bind("<Configure>", self._on_canvas_resize)
 
         # Membuat widget Label yang berfungsi sebagai status bar di bagian bawah.
         self.status_bar = tk.Label(main_frame, text="Siap", bd=1, relief=tk.SUNKEN,
@@ -203,12 +325,18 @@ class DrawingApp:
         self.status_bar.pack(fill="x", padx=2, pady=(0,2))
 
         # --- Binding Event Mouse ke Kanvas ---
-        # Mengikat event "klik tombol kiri mouse" ke fungsi _on_mouse_down.
-        self.canvas.bind("<Button-1>", self._on_mouse_down)
-        # Mengikat event "gerakan mouse sambil menahan tombol kiri" ke fungsi _on_mouse_move.
-        self.canvas.bind("<B1-Motion>", self._on_mouse_move)
-        # Mengikat event "melepas tombol kiri mouse" ke fungsi _on_mouse_up.
-        self.canvas.bind("<ButtonRelease-1>", self._on_mouse_up)
+        self._bind_mouse_events()
+        # Pintasan keyboard untuk undo (Ctrl+Z) dan redo (Ctrl+Y / Ctrl+Shift+Z).
+        self.root.bind("<Control-z>", lambda event: self.undo())
+        self.root.bind("<Control-y>", lambda event: self.redo())
+        self.root.bind("<Control-Z>", lambda event: self.redo())
+        # Esc membatalkan pemuatan adegan yang sedang berjalan.
+        self.root.bind("<Escape>", lambda event: self.cancel_loading())
+        # F12 menyalakan/mematikan instrumentasi latensi; Shift+F12 mengekspor trace-nya.
+        self.root.bind("<F12>", lambda event: self.toggle_profiling())
+        self.root.bind("<Shift-F12>", lambda event: self.export_profile())
+        # Ctrl+0 mengembalikan tampilan ke skala 1 tanpa pergeseran.
+        self.root.bind("<Control-0>", lambda event: self.reset_view())
 
         # Mengatur alat default saat aplikasi pertama kali dijalankan.
         self.set_tool("Pencil")
@@ -230,6 +358,24 @@ class DrawingApp:
             # Menempatkan tombol dalam layout grid.
             btn.grid(row=0, column=i, padx=1, pady=1)
 
+    # Fungsi untuk mengikat event mouse kanvas ke handler-nya. Dipanggil ulang saat
+    # instrumentasi dinyalakan/dimatikan agar binding memakai handler yang berlaku.
+    def _bind_mouse_events(self):
+        # Mengikat event "klik tombol kiri mouse" ke fungsi _on_mouse_down.
+        self.canvas.bind("<Button-1>", self._on_mouse_down)
+        # Mengikat event "gerakan mouse sambil menahan tombol kiri" ke fungsi _on_mouse_move.
+        self.canvas.bind("<B1-Motion>", self._on_mouse_move)
+        # Mengikat event "melepas tombol kiri mouse" ke fungsi _on_mouse_up.
+        self.canvas.bind("<ButtonRelease-1>", self._on_mouse_up)
+        # Menggeser tampilan dengan menyeret tombol tengah atau kanan.
+        for button in (2, 3):
+            self.canvas.bind(f"<Button-{button}>", self._on_pan_start)
+            self.canvas.bind(f"<B{button}-Motion>", self._on_pan_move)
+        # Zoom dengan roda mouse (Windows/macOS memakai <MouseWheel>, X11 memakai tombol 4/5).
+        self.canvas.bind("<MouseWheel>", self._on_mouse_wheel)
+        self.canvas.bind("<Button-4>", self._on_mouse_wheel)
+        self.canvas.bind("<Button-5>", self._on_mouse_wheel)
+
     # --- Fungsi untuk Mengatur Alat Gambar ---
     def set_tool(self, tool):
         # Mengatur variabel current_tool dengan alat yang dipilih.
@@ -242,6 +388,8 @@ class DrawingApp:
         if self.window_rect_id: 
             self.canvas.delete(self.window_rect_id)
             self.window_rect_id = None
+        # Batalkan marquee yang mungkin sedang ditarik.
+        self._cancel_marquee()
         # Mengembalikan semua tombol alat ke gaya 'raised' (tidak ditekan).
         for btn in self.tool_buttons.values(): btn.config(relief="raised")
         # Mengubah gaya tombol yang dipilih menjadi 'sunken' (ditekan).
@@ -265,6 +413,8 @@ class DrawingApp:
         if self.window_rect_id: 
             self.canvas.delete(self.window_rect_id)
             self.window_rect_id = None
+        # Batalkan marquee yang mungkin sedang ditarik.
+        self._cancel_marquee()
         # Mengembalikan semua tombol alat ke gaya 'raised'.
         for btn in self.tool_buttons.values(): btn.config(relief="raised")
         # Mengembalikan semua tombol transformasi ke gaya 'raised'.
@@ -281,15 +431,23 @@ class DrawingApp:
     # --- Fungsi Penanganan Event: Mouse Ditekan ---
     # Fungsi ini dieksekusi ketika pengguna menekan tombol kiri mouse di atas kanvas.
     def _on_mouse_down(self, event):
-        # Mengambil koordinat x dan y dari event mouse.
-        x, y = event.x, event.y
+        # Mengambil koordinat x dan y dari event mouse (dipetakan ke koordinat dunia).
+        x, y = self.viewport.to_world(event.x, event.y)
         # Memeriksa apakah sedang dalam mode transformasi.
         if self.transform_mode:
             # Menyimpan posisi awal mouse untuk perhitungan transformasi.
             self.transform_start_mouse_pos = (x, y)
-            # Jika modenya 'Select', panggil fungsi untuk memilih objek.
+            # Jika modenya 'Select', pilih objek di bawah kursor (Shift: tambah/kurangi seleksi).
             if self.transform_mode == "Select":
-                self._select_object(x, y)
+                extend = bool(getattr(event, 'state', 0) & SHIFT_MASK)
+                # Klik di area kosong memulai persegi seleksi (marquee).
+                if self._select_object(x, y, extend) is None:
+                    self.is_drawing_marquee = True
+                    self.marquee_extends = extend
+                    self.start_x, self.start_y = x, y
+            # Jika modenya translasi/rotasi/skala, mulai sesi drag pada objek terpilih.
+            elif self.transform_mode in ["Translate", "Rotate", "Scale"]:
+                self._begin_drag_transform(x, y)
             # Jika modenya 'Window' atau 'Clip', mulai proses menggambar window.
             elif self.transform_mode in ["Window", "Clip"]:
                 self.is_drawing_window = True
@@ -303,85 +461,127 @@ class DrawingApp:
             # Jika alatnya 'Pencil', inisialisasi daftar titik.
             if self.current_tool == 'Pencil':
                 self.active_line_points = [(x, y)]
+                self.preview_point_count = 1
 
 
             # INI POINT
             elif self.current_tool == 'Point':
-                # Tambahkan data objek titik ke dalam daftar drawn_objects.
-                self.drawn_objects.append({
-                    'type': 'point', 'points': [(x, y)], 'color': self.draw_color,
-                    'width': self.brush_size, 'rotation_angle': 0.0,
-                    'original_color': self.draw_color 
-                })
-                # Gambar ulang seluruh kanvas untuk menampilkan titik baru.
-                self.redraw_all()
+                # Tambahkan objek titik ke dalam adegan.
+                point = self.scene.add(Shape('point', [(x, y)], self.draw_color, self.brush_size))
+                self.history.record_add(point)
+                # Minta frame baru untuk menampilkan titik baru.
+                self.render_scheduler.request()
 
     # --- Fungsi Penanganan Event: Mouse Bergerak (sambil ditekan) ---
     # Fungsi ini dieksekusi ketika mouse bergerak sementara tombol kiri ditahan.
+    # Event hanya dicatat; pekerjaan transformasi dan penggambaran dilakukan sekali per
+    # frame oleh penjadwal render, sehingga event yang menumpuk digabung menjadi satu.
     def _on_mouse_move(self, event):
-        # Mengambil koordinat x dan y dari event mouse.
-        x, y = event.x, event.y
+        # Mengambil koordinat x dan y dari event mouse (dipetakan ke koordinat dunia).
+        x, y = self.viewport.to_world(event.x, event.y)
+        # Titik goresan pensil tetap direkam semua agar bentuk goresan tidak berubah.
+        if self.is_drawing and self.current_tool == 'Pencil':
+            self.active_line_points.append((x, y))
+        # Simpan posisi terbaru dan minta frame baru.
+        self.pending_motion = (x, y)
+        self.render_scheduler.request()
+
+    # Fungsi yang dipanggil penjadwal sekali per frame.
+    def _render_frame(self):
+        self._apply_pending_motion()
+        self.redraw_all()
+
+    # Fungsi untuk menerapkan gerakan mouse terbaru yang belum diproses. Semua gerakan
+    # sejak frame sebelumnya terlipat menjadi satu transformasi ke posisi terakhir.
+    def _apply_pending_motion(self):
+        if self.pending_motion is None: return
+        x, y = self.pending_motion
+        self.pending_motion = None
         # Jika dalam mode transformasi dan ada objek yang dipilih.
-        if self.transform_mode and self.transform_start_mouse_pos and self.selected_object:
-            # Dapatkan posisi mouse sebelumnya.
-            prev_x, prev_y = self.transform_start_mouse_pos
-            # Hitung perubahan posisi (delta x, delta y).
-            dx, dy = x - prev_x, y - prev_y
-            # Panggil fungsi transformasi yang sesuai berdasarkan mode.
-            if self.transform_mode == "Translate": self._translate_object(dx, dy)
-            elif self.transform_mode == "Rotate": self._rotate_object(x, y)
-            elif self.transform_mode == "Scale": self._scale_object(dy)
-            # Perbarui posisi mouse untuk gerakan selanjutnya.
-            self.transform_start_mouse_pos = (x, y)
-            # Gambar ulang kanvas untuk menunjukkan perubahan.
-            self.redraw_all()
+        if self.transform_mode and self.active_drag:
+            # Perbarui matriks transformasi objek (tanpa menulis ulang titik-titiknya).
+            self._update_drag_transform(x, y)
+        # Pratinjau digambar dalam koordinat layar: titik awal dan posisi mouse dipetakan balik.
+        elif self.is_drawing_marquee or self.is_drawing_window or self.is_drawing:
+            x0, y0 = self.viewport.to_screen(self.start_x, self.start_y)
+            x1, y1 = self.viewport.to_screen(x, y)
+            self._draw_preview(x0, y0, x1, y1)
+
+    # Fungsi untuk menggambar pratinjau (marquee, window, atau bentuk yang sedang digambar)
+    # dari titik layar (x0, y0) ke (x1, y1).
+    def _draw_preview(self, x0, y0, x1, y1):
+        # Jika sedang menarik persegi seleksi, pindahkan pratinjaunya atau buat jika belum ada.
+        if self.is_drawing_marquee:
+            if self.marquee_rect_id:
+                self.canvas.coords(self.marquee_rect_id, x0, y0, x1, y1)
+            else:
+                self.marquee_rect_id = self.canvas.create_rectangle(
+                    x0, y0, x1, y1, outline="red", dash=(2, 2), width=1
+                )
         # Jika sedang dalam proses menggambar window.
-        elif self.is_drawing_window: 
-            # Hapus pratinjau window sebelumnya.
-            if self.window_rect_id: self.canvas.delete(self.window_rect_id)
+        elif self.is_drawing_window:
             # Tentukan warna garis pratinjau (hijau untuk Clip, biru untuk Window).
             outline_color = "green" if self.transform_mode == "Clip" else "blue"
-            # Buat persegi panjang pratinjau baru.
-            self.window_rect_id = self.canvas.create_rectangle(
-                self.start_x, self.start_y, x, y, outline=outline_color, dash=(5, 2), width=2
-            )
+            # Pindahkan pratinjau window yang ada, atau buat jika belum ada.
+            if self.window_rect_id:
+                self.canvas.coords(self.window_rect_id, x0, y0, x1, y1)
+            else:
+                self.window_rect_id = self.canvas.create_rectangle(
+                    x0, y0, x1, y1, outline=outline_color, dash=(5, 2), width=2
+                )
         # Jika sedang dalam mode menggambar biasa.
         elif self.is_drawing:
             # Hapus bentuk pratinjau sebelumnya jika ada.
             if self.current_preview_id:
                 self.canvas.delete(self.current_preview_id)
                 self.current_preview_id = None
+            # Ketebalan kuas dalam satuan dunia, jadi pratinjaunya ikut skala tampilan.
+            width = self.brush_size * self.viewport.scale
             # Siapkan opsi untuk bentuk pratinjau.
             options = {
                 'fill': self.draw_color if self.fill_shape else '',
-                'outline': self.draw_color, 'width': self.brush_size
+                'outline': self.draw_color, 'width': width
             }
             # Buat pratinjau sesuai dengan alat yang aktif.
             if self.current_tool == 'Pencil':
-                # Tambahkan titik baru ke daftar.
-                self.active_line_points.append((x, y))
-                # Jika sudah ada lebih dari satu titik, gambar garis pratinjau.
-                if len(self.active_line_points) > 1:
-                    self.current_preview_id = self.canvas.create_line(
-                        self.active_line_points, fill=self.draw_color,
-                        width=self.brush_size, capstyle=tk.ROUND, joinstyle=tk.ROUND
+                # Pratinjau hanya menambahkan potongan baru sejak frame sebelumnya (satu item
+                # kanvas per frame), berapa pun panjang goresannya.
+                new_points = self.active_line_points[max(0, self.preview_point_count - 1):]
+                if len(new_points) > 1:
+                    self.canvas.create_line(
+                        affine.flatten(self.viewport.points_to_screen(new_points)),
+                        fill=self.draw_color, width=width,
+                        capstyle=tk.ROUND, joinstyle=tk.ROUND, tags=self.pencil_preview_tag
                     )
+                self.preview_point_count = len(self.active_line_points)
             elif self.current_tool == 'Line':
-                self.current_preview_id = self.canvas.create_line(self.start_x, self.start_y, x, y, **options)
+                self.current_preview_id = self.canvas.create_line(x0, y0, x1, y1, **options)
             elif self.current_tool == 'Rectangle':
-                self.current_preview_id = self.canvas.create_rectangle(self.start_x, self.start_y, x, y, **options)
+                self.current_preview_id = self.canvas.create_rectangle(x0, y0, x1, y1, **options)
             elif self.current_tool == 'Ellipse':
-                self.current_preview_id = self.canvas.create_oval(self.start_x, self.start_y, x, y, **options)
+                self.current_preview_id = self.canvas.create_oval(x0, y0, x1, y1, **options)
 
     # --- Fungsi Penanganan Event: Mouse Dilepas ---
     # Fungsi ini dieksekusi ketika pengguna melepas tombol kiri mouse.
     def _on_mouse_up(self, event):
-        # Mengambil koordinat x dan y dari event mouse.
-        x, y = event.x, event.y
+        # Mengambil koordinat x dan y dari event mouse (dipetakan ke koordinat dunia).
+        x, y = self.viewport.to_world(event.x, event.y)
+        # Terapkan dulu gerakan mouse terakhir yang belum sempat digambar.
+        self._apply_pending_motion()
         # Jika sedang dalam mode transformasi.
         if self.transform_mode:
             # Reset posisi awal mouse.
             self.transform_start_mouse_pos = None
+            # Jika drag transformasi baru saja selesai, bake matriksnya ke titik objek.
+            if self.active_drag:
+                self._end_drag_transform()
+            # Jika persegi seleksi baru saja selesai ditarik, pilih objek di dalamnya.
+            if self.is_drawing_marquee:
+                rect = (min(self.start_x, x), min(self.start_y, y),
+                        max(self.start_x, x), max(self.start_y, y))
+                extend = self.marquee_extends
+                self._cancel_marquee()
+                self._select_in_rect(rect, extend)
             # Jika proses menggambar window baru saja selesai.
             if self.is_drawing_window:
                 # Nonaktifkan flag.
@@ -402,9 +602,8 @@ class DrawingApp:
                 # Jika modenya 'Clip', lakukan operasi clipping.
                 elif self.transform_mode == "Clip":
                     self._perform_clipping(clip_window)
-                
-                # Gambar ulang kanvas untuk menampilkan hasil.
-                self.redraw_all()
+            # Gambar hasil akhir segera (frame yang masih terjadwal dibatalkan).
+            self.render_scheduler.flush_now()
         # Jika sedang dalam mode menggambar biasa.
         elif self.is_drawing:
             # Nonaktifkan flag menggambar.
@@ -413,296 +612,150 @@ class DrawingApp:
             if self.current_preview_id:
                 self.canvas.delete(self.current_preview_id)
                 self.current_preview_id = None
-            
-            # Siapkan dictionary untuk data objek baru.
-            new_object_data = {
-                'color': self.draw_color, 'width': self.brush_size,
-                'fill': self.fill_shape, 'rotation_angle': 0.0,
-                'original_color': self.draw_color 
-            }
+            # Hapus semua segmen pratinjau pensil sekaligus lewat tag-nya.
+            if self.current_tool == 'Pencil':
+                self.canvas.delete(self.pencil_preview_tag)
 
-        
-            # Tambahkan data spesifik bentuk ke dictionary.
+            # Tentukan jenis dan titik-titik bentuk baru sesuai alat yang aktif.
+            shape_type, points, shape = None, None, None
             if self.current_tool == 'Pencil' and len(self.active_line_points) > 1:
-                new_object_data.update({'type': 'line', 'points': self.active_line_points.copy()})
+                # Sederhanakan goresan agar hanya titik yang penting yang disimpan. Toleransi
+                # dalam piksel layar, sedangkan titik goresan dalam koordinat dunia.
+                shape_type = 'line'
+                points = simplify.simplify_rdp(self.active_line_points,
+                                               self.stroke_tolerance / self.viewport.scale)
             elif self.current_tool == 'Line':
-                new_object_data.update({'type': 'line', 'points': [(self.start_x, self.start_y), (x, y)]})
+                shape_type, points = 'line', [(self.start_x, self.start_y), (x, y)]
             elif self.current_tool == 'Rectangle':
-                rect_corners = self._get_rect_corners(self.start_x, self.start_y, x, y)
-                new_object_data.update({'type': 'rectangle', 'points': rect_corners})
+                shape_type, points = 'rectangle', rect_corners(self.start_x, self.start_y, x, y)
             elif self.current_tool == 'Ellipse':
-
-                # Elips disimulasikan sebagai poligon dengan banyak sisi.
-                num_segments = 60 
-                center_x, center_y = (self.start_x + x) / 2, (self.start_y + y) / 2
-                radius_x, radius_y = abs(x - self.start_x) / 2, abs(y - self.start_y) / 2
-                if radius_x == 0: radius_x = 0.01 # Hindari pembagian dengan nol
-                if radius_y == 0: radius_y = 0.01 # Hindari pembagian dengan nol
-                ellipse_points = []
-                # Hitung posisi titik-titik di sekeliling elips.
-                for i in range(num_segments + 1): 
-                    angle = (i / num_segments) * 2 * math.pi
-                    point_x = center_x + radius_x * math.cos(angle)
-                    point_y = center_y + radius_y * math.sin(angle)
-                    ellipse_points.append((point_x, point_y))
-                new_object_data.update({'type': 'ellipse', 'points': ellipse_points})
-            
-            # Jika objek berhasil dibuat, tambahkan ke daftar objek.
-            if 'type' in new_object_data:
-                self.drawn_objects.append(new_object_data)
-            # Gambar ulang kanvas.
-            self.redraw_all()
-
+                # Elips disimpan secara analitik; poligonnya dibuat sesuai ukuran di layar.
+                shape = ellipse_shape(self.start_x, self.start_y, x, y, self.draw_color,
+                                      self.brush_size, self.fill_shape)
+            # Bentuk lain dibuat langsung dari jenis dan titik-titiknya.
+            if shape_type:
+                shape = Shape(shape_type, points, self.draw_color, self.brush_size,
+                              fill=self.fill_shape)
+
+            # Jika objek berhasil dibuat, tambahkan ke adegan.
+            if shape is not None:
+                self.scene.add(shape)
+                self.history.record_add(shape)
+            # Gambar hasil akhir segera (frame yang masih terjadwal dibatalkan).
+            self.render_scheduler.flush_now()
+
+
+    # Fungsi yang dipanggil saat ukuran kanvas berubah: area terlihat ikut berubah, jadi
+    # renderer (item kanvas maupun tile) menyesuaikan objek yang digambar pada frame berikutnya.
+    def _on_canvas_resize(self, event):
+        self.renderer.view_changed()
+        self.render_scheduler.request()
+
+    # --- Zoom dan Pan ---
+    # Fungsi yang dipanggil setelah viewport berubah: renderer menyesuaikan objek yang
+    # terlihat pada frame berikutnya (beberapa event zoom/pan dalam satu frame digabung).
+    def _on_view_changed(self):
+        self.renderer.view_changed()
+        self._update_status_bar()
+        self.render_scheduler.request()
+
+    # Fungsi untuk memulai pan (tombol tengah/kanan ditekan).
+    def _on_pan_start(self, event):
+        self.pan_anchor = (event.x, event.y)
+
+    # Fungsi untuk menggeser tampilan mengikuti gerakan mouse.
+    def _on_pan_move(self, event):
+        if self.pan_anchor is None: return
+        self.viewport.pan(event.x - self.pan_anchor[0], event.y - self.pan_anchor[1])
+        self.pan_anchor = (event.x, event.y)
+        self._on_view_changed()
+
+    # Fungsi untuk zoom masuk/keluar dengan roda mouse di sekitar posisi kursor.
+    def _on_mouse_wheel(self, event):
+        zoom_in = event.num == 4 if event.num in (4, 5) else event.delta > 0
+        factor = ZOOM_STEP if zoom_in else 1 / ZOOM_STEP
+        if self.viewport.zoom_at(factor, event.x, event.y): self._on_view_changed()
+
+    # Fungsi untuk mengembalikan tampilan ke skala 1 tanpa pergeseran.
+    def reset_view(self):
+        self.viewport.reset()
+        self._on_view_changed()
 
     # --- FUNGSI LOGIKA CLIPPING ---
-    # Fungsi ini mengecek apakah sebuah objek (berdasarkan bounding box-nya)
-    # bersinggungan dengan area window yang diberikan.
-    def _object_intersects_window(self, obj, window):
-        # Jika objek tidak punya titik (misalnya, setelah gagal di-clip), anggap tidak bersinggungan.
-        if not obj.get('points'):
-            return False
-        
-        # Dapatkan semua koordinat x dan y dari objek.
-        xs = [p[0] for p in obj['points']]
-        ys = [p[1] for p in obj['points']]
-        # Tentukan bounding box objek (xmin, ymin, xmax, ymax).
-        obj_bbox = (min(xs), min(ys), max(xs), max(ys))
-
-        # Ambil koordinat window.
-        win_xmin, win_ymin, win_xmax, win_ymax = window
-        # Ambil koordinat bounding box objek.
-        obj_xmin, obj_ymin, obj_xmax, obj_ymax = obj_bbox
-
-        # Cek kondisi di mana mereka TIDAK mungkin bersinggungan.
-        # Jika bounding box objek sepenuhnya di kiri, kanan, atas, atau bawah window,
-        # maka tidak ada persinggungan.
-        if obj_xmax < win_xmin or obj_xmin > win_xmax or obj_ymax < win_ymin or obj_ymin > win_ymax:
-            return False
-        # Jika tidak ada kondisi di atas yang terpenuhi, berarti mereka bersinggungan.
-        return True
-
-    # Fungsi utama untuk melakukan operasi clipping.
-    # Cara kerja:
-    # 1. Membuat sebuah list kosong baru (`new_drawn_objects`) untuk menampung hasil.
-    # 2. Melakukan iterasi pada setiap objek yang ada di kanvas (`self.drawn_objects`).
-    # 3. Untuk setiap objek, ia memanggil `_object_intersects_window` untuk memeriksa
-    #    apakah objek tersebut perlu diproses atau tidak.
-    # 4. Jika TIDAK bersinggungan, objek tersebut langsung ditambahkan ke list baru tanpa diubah.
-    # 5. Jika BERSINGGUNGAN, maka algoritma clipping yang sesuai (Cohen-Sutherland untuk garis,
-    #    Sutherland-Hodgman untuk poligon) akan dijalankan pada objek tersebut.
-    # 6. Hasil dari clipping (yang bisa jadi objek yang lebih kecil atau tidak ada sama sekali)
-    #    ditambahkan ke list baru.
-    # 7. Setelah semua objek diproses, list `self.drawn_objects` yang lama diganti dengan
-    #    `new_drawn_objects` yang berisi hasil akhir.
+    # Algoritma clipping berada di modul 'clipping' (tanpa tkinter); metode ini hanya
+    # menjalankannya pada adegan lalu membatalkan seleksi objek. Adegan yang sangat besar
+    # dipotong paralel di beberapa proses, adegan kecil tetap di proses ini.
     def _perform_clipping(self, clip_window):
-        # List sementara untuk menyimpan objek hasil clipping dan objek yang tidak terpengaruh.
-        new_drawn_objects = []
-        # Loop melalui setiap objek yang saat ini ada di kanvas.
-        for obj in self.drawn_objects:
-            # Cek dulu apakah objek ini bersinggungan dengan jendela clipping.
-            if not self._object_intersects_window(obj, clip_window):
-                # Jika tidak, objek ini aman. Langsung tambahkan ke daftar baru.
-                new_drawn_objects.append(obj)
-                # Lanjutkan ke objek berikutnya dalam loop.
-                continue
-
-            # Jika kode sampai di sini, berarti objek bersinggungan dan perlu di-clip.
-            if obj['type'] == 'point':
-                # Untuk titik, cek sederhana apakah ia di dalam persegi panjang.
-                if self._is_point_in_rect(obj['points'][0], clip_window):
-                    new_drawn_objects.append(obj)
-            
-            elif obj['type'] == 'line':
-                # Jika ini adalah polyline (dari alat pensil), proses setiap segmennya.
-                if len(obj['points']) > 2:
-                    for i in range(len(obj['points']) - 1):
-                        p1, p2 = obj['points'][i], obj['points'][i+1]
-                        # Jalankan algoritma clipping Cohen-Sutherland pada segmen.
-                        clipped_segment = self._cohen_sutherland_clip(p1, p2, clip_window)
-                        # Jika ada hasil (garis tidak sepenuhnya di luar),
-                        if clipped_segment:
-                            # Buat objek baru untuk segmen ini agar propertinya (warna, tebal) ikut.
-                            new_obj_segment = obj.copy()
-                            new_obj_segment['points'] = clipped_segment
-                            new_drawn_objects.append(new_obj_segment)
-                else: # Jika ini garis biasa (hanya 2 titik).
-                    # Jalankan algoritma clipping.
-                    clipped_line = self._cohen_sutherland_clip(obj['points'][0], obj['points'][1], clip_window)
-                    # Jika ada hasil.
-                    if clipped_line:
-                        # Perbarui titik-titik pada objek asli.
-                        obj['points'] = clipped_line
-                        # Tambahkan objek yang telah diubah ke daftar baru.
-                        new_drawn_objects.append(obj)
-            
-            elif obj['type'] in ['rectangle', 'ellipse']:
-                # Untuk poligon, jalankan algoritma Sutherland-Hodgman.
-                clipped_polygon = self._sutherland_hodgman_clip(obj['points'], clip_window)
-                # Jika ada poligon hasil clipping.
-                if clipped_polygon:
-                    # Perbarui titik-titik pada objek asli.
-                    obj['points'] = clipped_polygon
-                    # Tambahkan objek yang telah diubah ke daftar baru.
-                    new_drawn_objects.append(obj)
-
-        # Ganti daftar objek lama dengan daftar baru yang sudah final.
-        self.drawn_objects = new_drawn_objects
+        # Catat geometri objek yang bersinggungan dengan window agar clipping bisa di-undo.
+        edit = self.history.begin_edit('Clip', self.scene.query(clip_window))
+        parallel_clipping.perform_clipping(self.scene, clip_window, self.clip_algorithm)
+        self.history.commit_edit(edit)
         # Batalkan seleksi objek.
         self._unselect_object()
 
-    # --- Implementasi Algoritma Cohen-Sutherland ---
-    # Variabel konstanta untuk merepresentasikan 4-bit 'outcode'.
-    INSIDE, LEFT, RIGHT, BOTTOM, TOP = 0, 1, 2, 4, 8
-
-    # Fungsi untuk menghitung outcode sebuah titik terhadap clip_window.
-    def _compute_outcode(self, p, clip_window):
-        x, y = p
-        xmin, ymin, xmax, ymax = clip_window
-        code = self.INSIDE  # Awalnya anggap di dalam.
-        if x < xmin: code |= self.LEFT    # Jika di kiri, set bit pertama.
-        elif x > xmax: code |= self.RIGHT # Jika di kanan, set bit kedua.
-        if y < ymin: code |= self.BOTTOM  # Jika di bawah, set bit ketiga.
-        elif y > ymax: code |= self.TOP   # Jika di atas, set bit keempat.
-        return code
-
-    # Fungsi clipping garis Cohen-Sutherland.
-    # Cara kerja:
-    # 1. Hitung 'outcode' untuk kedua titik ujung garis (p1, p2).
-    # 2. Masuk ke loop yang akan berhenti jika garis diterima atau ditolak.
-    # 3. Cek Trivial Accept: Jika outcode p1 DAN p2 adalah 0 (keduanya INSIDE),
-    #    maka seluruh garis ada di dalam. Terima dan kembalikan garis asli.
-    # 4. Cek Trivial Reject: Jika hasil operasi bitwise AND dari outcode p1 dan p2 tidak nol,
-    #    artinya kedua titik berada di luar pada sisi yang sama (misal, keduanya di atas).
-    #    Garis pasti di luar. Tolak dan kembalikan None.
-    # 5. Jika bukan keduanya, garis perlu dipotong. Pilih satu titik yang di luar.
-    # 6. Hitung titik potong (interseksi) antara garis dan batas window.
-    # 7. Ganti titik yang di luar tadi dengan titik potong yang baru dihitung.
-    # 8. Ulangi loop dengan segmen garis yang sudah diperbarui.
-    def _cohen_sutherland_clip(self, p1, p2, clip_window):
-        x1, y1 = p1; x2, y2 = p2
-        xmin, ymin, xmax, ymax = clip_window
-        outcode1 = self._compute_outcode(p1, clip_window)
-        outcode2 = self._compute_outcode(p2, clip_window)
-        while True:
-            if not (outcode1 | outcode2): return [(x1, y1), (x2, y2)] # Trivial accept
-            elif outcode1 & outcode2: return None # Trivial reject
-            else:
-                x, y = 0, 0
-                outcode_out = outcode1 if outcode1 else outcode2
-                # Hitung titik potong berdasarkan sisi mana titik itu berada.
-                if outcode_out & self.TOP:
-                    x = x1 + (x2 - x1) * (ymax - y1) / (y2 - y1)
-                    y = ymax
-                elif outcode_out & self.BOTTOM:
-                    x = x1 + (x2 - x1) * (ymin - y1) / (y2 - y1)
-                    y = ymin
-                elif outcode_out & self.RIGHT:
-                    y = y1 + (y2 - y1) * (xmax - x1) / (x2 - x1)
-                    x = xmax
-                elif outcode_out & self.LEFT:
-                    y = y1 + (y2 - y1) * (xmin - x1) / (x2 - x1)
-                    x = xmin
-                # Perbarui koordinat titik yang berada di luar dengan titik potong.
-                if outcode_out == outcode1:
-                    x1, y1 = x, y
-                    outcode1 = self._compute_outcode((x1, y1), clip_window)
-                else:
-                    x2, y2 = x, y
-                    outcode2 = self._compute_outcode((x2, y2), clip_window)
-
-    # Fungsi helper untuk memotong poligon pada satu sisi (edge) dari clip window.
-    def _clip_polygon_edge(self, subject_polygon, edge, is_vertical, value, is_less_than):
-        input_list = subject_polygon
-        output_list = []
-        if not input_list: return output_list
-        p1 = input_list[-1]
-        for p2 in input_list:
-            p1_coord = p1[1] if is_vertical else p1[0]
-            p2_coord = p2[1] if is_vertical else p2[0]
-            p1_inside = p1_coord <= value if is_less_than else p1_coord >= value
-            p2_inside = p2_coord <= value if is_less_than else p2_coord >= value
-            # Terapkan 4 aturan Sutherland-Hodgman
-            if p1_inside and p2_inside: output_list.append(p2) # Aturan 1
-            elif p1_inside and not p2_inside: # Aturan 2
-                if p2_coord != p1_coord:
-                    if is_vertical:
-                        ix = p1[0] + (p2[0] - p1[0]) * (value - p1_coord) / (p2_coord - p1_coord)
-                        output_list.append((ix, value))
-                    else:
-                        iy = p1[1] + (p2[1] - p1[1]) * (value - p1_coord) / (p2_coord - p1_coord)
-                        output_list.append((value, iy))
-            elif not p1_inside and p2_inside: # Aturan 3
-                if p2_coord != p1_coord:
-                    if is_vertical:
-                        ix = p1[0] + (p2[0] - p1[0]) * (value - p1_coord) / (p2_coord - p1_coord)
-                        output_list.append((ix, value))
-                    else:
-                        iy = p1[1] + (p2[1] - p1[1]) * (value - p1_coord) / (p2_coord - p1_coord)
-                        output_list.append((value, iy))
-                output_list.append(p2)
-            # Aturan 4 (keduanya di luar) tidak melakukan apa-apa.
-            p1 = p2
-        return output_list
-
-    # Fungsi clipping poligon Sutherland-Hodgman.
-    # Cara kerja:
-    # 1. Mengambil daftar titik poligon sebagai input.
-    # 2. Memproses poligon secara sekuensial terhadap setiap sisi dari clip window (kiri, kanan, bawah, atas).
-    # 3. Untuk setiap sisi, ia memanggil helper `_clip_polygon_edge`.
-    # 4. `_clip_polygon_edge` menerapkan 4 aturan dasar:
-    #    - Jika kedua titik segmen di dalam: simpan titik kedua.
-    #    - Jika titik pertama di dalam dan kedua di luar: hitung & simpan titik potong.
-    #    - Jika titik pertama di luar dan kedua di dalam: hitung & simpan titik potong, lalu simpan titik kedua.
-    #    - Jika kedua titik di luar: tidak ada yang disimpan.
-    # 5. Daftar titik hasil potongan dari satu sisi menjadi input untuk sisi berikutnya.
-    # 6. Hasil akhirnya adalah daftar titik dari poligon yang telah terpotong oleh keempat sisi.
-    def _sutherland_hodgman_clip(self, subject_polygon, clip_window):
-        xmin, ymin, xmax, ymax = clip_window
-        output_list = subject_polygon
-        # Potong terhadap sisi kiri, lalu kanan, lalu bawah, lalu atas.
-        output_list = self._clip_polygon_edge(output_list, 'left', False, xmin, False)
-        output_list = self._clip_polygon_edge(output_list, 'right', False, xmax, True)
-        output_list = self._clip_polygon_edge(output_list, 'bottom', True, ymax, True)
-        output_list = self._clip_polygon_edge(output_list, 'top', True, ymin, False)
-        return output_list
-    
-    # Fungsi untuk memilih objek di kanvas.
-    def _select_object(self, x, y):
-        # Batalkan pilihan sebelumnya.
-        self._unselect_object()
-        # Toleransi piksel untuk klik.
-        tolerance = 5
-        # Temukan ID item kanvas terdekat dengan titik klik.
-        clicked_tk_id = self.canvas.find_closest(x, y, halo=tolerance)
-        # Jika ada item yang ditemukan.
-        if clicked_tk_id:
-            # Ambil ID pertama dari tuple hasil.
-            clicked_tk_id = clicked_tk_id[0] 
-            # Loop melalui objek yang digambar (dari yang terbaru) untuk menemukan data objek yang cocok.
-            for obj in reversed(self.drawn_objects):
-                if 'tk_id' in obj and obj['tk_id'] == clicked_tk_id:
-                    # Jika cocok, set sebagai objek terpilih.
-                    self.selected_object = obj
-                    # Gambar kotak seleksi di sekitarnya.
-                    self._draw_selection_box()
-                    # Hentikan loop karena objek sudah ditemukan.
-                    break
-
-    # Fungsi untuk menggambar kotak seleksi.
+    # Fungsi untuk memilih objek di kanvas. Dengan 'extend', objek yang diklik ditambahkan
+    # ke seleksi (atau dikeluarkan jika sudah terpilih) dan seleksi lain dipertahankan.
+    # Mengembalikan objek yang diklik, atau None.
+    def _select_object(self, x, y, extend=False):
+        # Cari objek teratas yang geometrinya benar-benar mengenai titik klik. Klik di area
+        # kosong tidak memilih apa pun (bukan item kanvas terdekat yang mungkin jauh).
+        # Toleransi klik dalam piksel layar diubah ke satuan dunia sesuai zoom.
+        obj = self.hit_tester.hit(x, y, HIT_TOLERANCE / self.viewport.scale)
+        # Perbarui seleksi lalu gambar kotak seleksinya.
+        if not extend:
+            self.selected_objects = [obj] if obj is not None else []
+        elif obj in self.selected_objects:
+            self.selected_objects.remove(obj)
+        elif obj is not None:
+            self.selected_objects.append(obj)
+        self._draw_selection_box()
+        self._update_status_bar()
+        return obj
+
+    # Fungsi untuk memilih semua objek yang bounding box-nya seluruhnya berada di dalam
+    # persegi 'rect'. Kandidat diambil dari query indeks spasial adegan.
+    def _select_in_rect(self, rect, extend=False):
+        found = [shape for shape in self.scene.query(rect) if clipping.bbox_inside(shape.bbox, rect)]
+        if extend:
+            chosen = set(self.selected_objects)
+            found = self.selected_objects + [shape for shape in found if shape not in chosen]
+        self.selected_objects = found
+        self._draw_selection_box()
+        self._update_status_bar()
+
+    # Fungsi untuk menghapus pratinjau marquee dan mengakhiri penarikannya.
+    def _cancel_marquee(self):
+        self.is_drawing_marquee = False
+        if self.marquee_rect_id: self.canvas.delete(self.marquee_rect_id)
+        self.marquee_rect_id = None
+
+    # Objek terpilih jika tepat satu objek dipilih (None jika tidak ada atau lebih dari satu).
+    @property
+    def selected_object(self):
+        return self.selected_objects[0] if len(self.selected_objects) == 1 else None
+
+    @selected_object.setter
+    def selected_object(self, shape):
+        self.selected_objects = [shape] if shape is not None else []
+
+    # Fungsi untuk menggambar kotak seleksi. Satu kotak melingkupi seluruh objek terpilih.
     def _draw_selection_box(self):
-        # Hapus kotak seleksi lama.
-        if self.selection_box_id: self.canvas.delete(self.selection_box_id)
+        # Hitung bounding box gabungan (xmin, ymin, xmax, ymax) objek-objek terpilih di layar.
+        bbox = self.viewport.screen_bbox(transforms.group_bbox(self.selected_objects))
         # Pastikan ada objek yang dipilih dan objek tersebut punya titik.
-        if not self.selected_object or not self.selected_object.get('points'): return
-        # Dapatkan semua koordinat x dan y untuk mencari bounding box.
-        xs = [p[0] for p in self.selected_object['points']]
-        ys = [p[1] for p in self.selected_object['points']]
-        if not xs or not ys: return 
-        # Hitung bounding box (xmin, ymin, xmax, ymax).
-        bbox = [min(xs), min(ys), max(xs), max(ys)]
+        if bbox is None:
+            # Hapus kotak seleksi lama.
+            if self.selection_box_id: self.canvas.delete(self.selection_box_id)
+            self.selection_box_id = None
+            return
         # Beri sedikit padding (jarak) agar kotak tidak terlalu mepet.
         padding = 5
         bbox = [b - padding if i < 2 else b + padding for i, b in enumerate(bbox)]
+        # Jika kotak seleksi sudah ada, cukup pindahkan dan angkat ke lapisan paling atas.
+        if self.selection_box_id:
+            self.canvas.coords(self.selection_box_id, *bbox)
+            self.canvas.tag_raise(self.selection_box_id)
+            return
         # Buat persegi panjang putus-putus sebagai kotak seleksi.
         self.selection_box_id = self.canvas.create_rectangle(
             bbox, outline="red", dash=(4,2), width=1, tags="selection_box"
@@ -714,101 +767,44 @@ class DrawingApp:
         if self.selection_box_id: self.canvas.delete(self.selection_box_id)
         # Reset variabel.
         self.selection_box_id = None
-        self.selected_object = None
-
-    # Fungsi untuk mendapatkan 4 titik sudut dari sebuah persegi panjang.
-    def _get_rect_corners(self, x1, y1, x2, y2):
-        return [(min(x1,x2), min(y1,y2)), (max(x1,x2), min(y1,y2)), 
-                (max(x1,x2), max(y1,y2)), (min(x1,x2), max(y1,y2))]
-
-    # Fungsi untuk menghitung titik tengah (centroid) dari sebuah bentuk.
-    def _get_shape_center(self, points):
-        if not points: return 0, 0
-        xs = [p[0] for p in points]; ys = [p[1] for p in points]
-        return sum(xs) / len(xs), sum(ys) / len(ys)
-
-    # Fungsi untuk memutar sekumpulan titik mengelilingi sebuah pusat (center).
-    def _rotate_points(self, points, center, angle):
-        cx, cy = center
-        rotated_points = []
-        for x, y in points:
-            # Pindahkan titik ke origin (0,0).
-            temp_x, temp_y = x - cx, y - cy
-            # Terapkan rumus rotasi 2D.
-            rotated_x = temp_x * math.cos(angle) - temp_y * math.sin(angle)
-            rotated_y = temp_x * math.sin(angle) + temp_y * math.cos(angle)
-            # Kembalikan titik ke posisi semula.
-            rotated_points.append((rotated_x + cx, rotated_y + cy))
-        return rotated_points
-
-    # Fungsi untuk menggeser (translasi) objek yang dipilih.
-    def _translate_object(self, dx, dy):
-        if not self.selected_object: return
-        # Tambahkan dx dan dy ke setiap titik dari objek.
-        self.selected_object['points'] = [(x + dx, y + dy) for x, y in self.selected_object['points']]
-
-    # Fungsi untuk memutar objek yang dipilih.
-    def _rotate_object(self, current_mouse_x, current_mouse_y):
-        if not self.selected_object or not self.transform_start_mouse_pos: return
-        prev_mouse_x, prev_mouse_y = self.transform_start_mouse_pos
-        # Dapatkan pusat rotasi objek.
-        cx, cy = self._get_shape_center(self.selected_object['points'])
-        # Hitung sudut dari pusat ke posisi mouse sebelumnya.
-        start_angle = math.atan2(prev_mouse_y - cy, prev_mouse_x - cx)
-        # Hitung sudut dari pusat ke posisi mouse saat ini.
-        current_angle = math.atan2(current_mouse_y - cy, current_mouse_x - cx)
-        # Selisih sudut adalah besar rotasi yang harus diterapkan.
-        delta_angle = current_angle - start_angle
-        # Akumulasi total sudut rotasi.
-        self.selected_object['rotation_angle'] += delta_angle
-        # Putar semua titik objek.
-        self.selected_object['points'] = self._rotate_points(
-            self.selected_object['points'], (cx, cy), delta_angle
-        )
-
-    # Fungsi untuk mengubah skala objek yang dipilih.
-    def _scale_object(self, dy):
-        if not self.selected_object: return
-        # Tentukan faktor skala berdasarkan gerakan vertikal mouse.
-        scale_factor = max(0.01, 1.0 + dy / 100.0)
-        # Jika objek adalah titik, ubah saja lebarnya.
-        if self.selected_object['type'] == 'point':
-            self.selected_object['width'] = max(1, self.selected_object['width'] * scale_factor)
-            return
-        # Dapatkan pusat skala.
-        cx, cy = self._get_shape_center(self.selected_object['points'])
-        new_points = []
-        for x, y in self.selected_object['points']:
-            # Hitung posisi baru setiap titik berdasarkan faktor skala dan pusat.
-            scaled_x = (x - cx) * scale_factor + cx
-            scaled_y = (y - cy) * scale_factor + cy
-            new_points.append((scaled_x, scaled_y))
-        # Perbarui titik-titik objek.
-        self.selected_object['points'] = new_points
-        # Perbarui juga lebar garis/outline objek.
-        if self.selected_object['type'] in ['line', 'rectangle', 'ellipse']:
-            self.selected_object['width'] = max(1, self.selected_object['width'] * scale_factor)
-                
-    # Fungsi sederhana untuk mengecek apakah sebuah titik ada di dalam persegi panjang.
-    def _is_point_in_rect(self, point, rect):
-        px, py = point; rx1, ry1, rx2, ry2 = rect
-        return rx1 <= px <= rx2 and ry1 <= py <= ry2
+        self.selected_objects = []
+
+    # Fungsi untuk memulai drag translasi/rotasi/skala pada objek yang dipilih. Beberapa
+    # objek terpilih ditransformasi bersama sebagai satu grup di sekitar titik tengah grup.
+    def _begin_drag_transform(self, x, y):
+        if not self.selected_objects: return
+        if len(self.selected_objects) == 1:
+            self.active_drag = transforms.DragTransform(self.selected_objects[0], self.transform_mode, (x, y))
+        else:
+            self.active_drag = transforms.GroupDragTransform(self.selected_objects, self.transform_mode, (x, y))
+
+    # Fungsi untuk memperbarui drag transformasi sesuai posisi mouse terbaru.
+    # Objek hanya menerima matriks baru; koordinatnya dihitung saat digambar.
+    def _update_drag_transform(self, x, y):
+        if not self.active_drag: return
+        self.active_drag.update((x, y))
+
+    # Fungsi untuk mengakhiri drag transformasi dan menuliskan hasilnya ke titik objek.
+    def _end_drag_transform(self):
+        if not self.active_drag: return
+        drag = self.active_drag
+        delta = drag.commit()
+        # Simpan hanya matriks delta drag ke riwayat (satu entri untuk seluruh grup).
+        if isinstance(drag, transforms.GroupDragTransform):
+            self.history.record_group_transform(drag.shapes, delta, drag.angle)
+        else:
+            self.history.record_transform(drag.shape, delta, drag.shape.rotation_angle - drag.start_rotation)
+        self.active_drag = None
 
-    # Fungsi untuk menerapkan efek windowing (mengubah warna objek).
+    # Fungsi untuk menerapkan efek windowing (mengubah warna objek) setelah window berganti.
+    # Keanggotaan dihitung ulang penuh; hanya objek yang keanggotaannya berubah diwarnai ulang.
     def _apply_windowing_effect(self):
-        # Jika tidak ada window aktif, kembalikan semua warna ke aslinya.
-        if not self.window_coords:
-            for obj in self.drawn_objects: obj['color'] = obj['original_color']
-            return
-        # Loop melalui setiap objek.
-        for obj in self.drawn_objects:
-            # Jika objek bersinggungan dengan window.
-            if self._object_intersects_window(obj, self.window_coords):
-                # Ubah warnanya menjadi warna sorotan.
-                obj['color'] = self.window_highlight_color
-            else:
-                # Jika tidak, kembalikan ke warna asli.
-                obj['color'] = obj['original_color'] 
+        self.window_highlighter.set_window(self.window_coords)
+
+    # Kumpulan objek yang sedang disorot oleh efek windowing.
+    @property
+    def highlighted_objects(self):
+        return self.window_highlighter.members
 
     # Fungsi untuk menghapus window aktif.
     def _clear_window(self):
@@ -820,44 +816,29 @@ class DrawingApp:
         self.redraw_all() 
         self._update_status_bar()
 
-    # Fungsi untuk menggambar ulang seluruh isi kanvas.
+    # Fungsi untuk memperbarui isi kanvas.
+    # Kanvas tidak lagi dihapus dan dibangun ulang; renderer hanya menerapkan perubahan
+    # pada objek yang ditambahkan, dihapus, dipindah, atau berganti warna.
     def redraw_all(self):
-        # Hapus semua item yang ada di kanvas.
-        self.canvas.delete("all")
-        # Jika ada window aktif, terapkan efek warnanya terlebih dahulu.
-        if self.window_coords: self._apply_windowing_effect()
-        # Loop melalui setiap objek dalam daftar data.
-        for obj in self.drawn_objects:
-            # Lewati objek yang tidak memiliki titik (misalnya hasil clip yang kosong).
-            if not obj.get('points'): continue
-            # Siapkan opsi visual untuk item kanvas.
-            obj_options = {
-                'fill': obj['color'] if obj.get('fill', False) else '',
-                'outline': obj['color'], 'width': obj['width']
-            }
-            tk_id = None
-            # Buat item kanvas berdasarkan tipe objek.
-            if obj['type'] == 'point':
-                x, y = obj['points'][0]
-                r = obj['width'] 
-                tk_id = self.canvas.create_oval(x - r, y - r, x + r, y + r, fill=obj['color'], outline=obj['color'])
-            elif obj['type'] == 'line' and len(obj['points']) >= 2:
-                tk_id = self.canvas.create_line(obj['points'], fill=obj['color'], width=obj['width'],
-                                                 capstyle=tk.ROUND, joinstyle=tk.ROUND)
-            elif obj['type'] in ['rectangle', 'ellipse'] and len(obj['points']) >= 3:
-                flat_points = [c for p in obj['points'] for c in p]
-                tk_id = self.canvas.create_polygon(flat_points, **obj_options)
-            # Simpan ID item kanvas ke dalam data objek untuk referensi nanti (misal, untuk diseleksi).
-            if tk_id: obj['tk_id'] = tk_id
+        # Pindahkan titik objek-objek baru ke buffer koordinat bersama setelah cukup banyak.
+        self.scene.compact(COMPACT_BATCH)
+        # Jika ada window aktif, uji ulang hanya objek yang masuk atau berubah sejak frame sebelumnya.
+        if self.window_coords: self.window_highlighter.update()
+        # Terapkan perubahan yang tertunda ke item kanvas.
+        self.renderer.flush()
         # Jika ada objek yang dipilih, gambar ulang kotak seleksinya.
-        if self.selected_object: self._draw_selection_box()
+        if self.selected_objects: self._draw_selection_box()
         # Jika sedang menggambar window, pastikan pratinjaunya ada di lapisan paling atas.
         if self.is_drawing_window and self.window_rect_id: self.canvas.lift(self.window_rect_id)
+        # Begitu juga pratinjau marquee.
+        if self.is_drawing_marquee and self.marquee_rect_id: self.canvas.lift(self.marquee_rect_id)
 
     # Fungsi untuk membersihkan seluruh kanvas.
     def clear_canvas(self):
-        # Kosongkan daftar objek.
-        self.drawn_objects = []
+        # Kosongkan adegan (objek yang dihapus disimpan di riwayat agar bisa di-undo).
+        edit = self.history.begin_edit('Bersihkan', self.scene)
+        self.scene.clear()
+        self.history.commit_edit(edit)
         # Batalkan pilihan objek.
         self._unselect_object()
         # Hapus window aktif.
@@ -865,6 +846,121 @@ class DrawingApp:
         # Gambar ulang kanvas yang kini kosong.
         self.redraw_all()
 
+    # Fungsi untuk menyimpan adegan ke file (.drw biner atau .json).
+    def save_scene(self):
+        path = filedialog.asksaveasfilename(defaultextension=".drw", filetypes=SCENE_FILETYPES)
+        if not path: return
+        try:
+            scene_io.save(self.scene, path)
+        except OSError as e:
+            messagebox.showerror("Gagal menyimpan", str(e))
+
+    # Fungsi untuk membuka adegan dari file dan mengganti isi kanvas.
+    def open_scene(self):
+        path = filedialog.askopenfilename(filetypes=SCENE_FILETYPES)
+        if not path: return
+        try:
+            shapes = scene_io.load(path)
+        except (OSError, ValueError) as e:
+            messagebox.showerror("Gagal membuka", str(e))
+            return
+        self.cancel_loading()
+        self._unselect_object()
+        self._clear_window()
+        self.scene.clear()
+        # Riwayat lama tidak berlaku lagi untuk adegan yang baru dibuka.
+        self.history.clear()
+        self.load_shapes(shapes, total=len(shapes))
+
+    # Fungsi untuk memasukkan objek dari list atau generator secara bertahap: objek
+    # dimasukkan dalam potongan berbatas waktu lewat root.after (yang terdekat ke area
+    # terlihat lebih dulu), sehingga antarmuka tetap responsif dan bisa dibatalkan.
+    def load_shapes(self, source, total=None):
+        self.cancel_loading()
+        visible = self.viewport.world_rect(self.canvas.winfo_width(), self.canvas.winfo_height())
+        self.loader = ProgressiveLoader(self.root, self.scene, source, visible_rect=visible,
+                                        total=total, on_chunk=self.redraw_all,
+                                        on_progress=self._show_progress,
+                                        on_done=self._on_loading_done).start()
+
+    # Fungsi untuk membatalkan pemuatan bertahap (objek yang sudah masuk tetap ada).
+    def cancel_loading(self):
+        if self.loader is not None: self.loader.cancel()
+
+    # Fungsi untuk menampilkan kemajuan pemuatan di status bar.
+    def _show_progress(self, text):
+        self.status_bar.config(text=text)
+
+    # Fungsi yang dipanggil saat pemuatan selesai atau dibatalkan.
+    def _on_loading_done(self, cancelled):
+        self.loader = None
+        self._update_status_bar()
+        if cancelled:
+            self.status_bar.config(text=f"Pemuatan dibatalkan ({len(self.scene)} objek) | "
+                                        + self.status_bar.cget("text"))
+
+    # Fungsi untuk membatalkan operasi terakhir.
+    def undo(self):
+        self._apply_history(self.history.undo())
+
+    # Fungsi untuk menjalankan ulang operasi yang terakhir dibatalkan.
+    def redo(self):
+        self._apply_history(self.history.redo())
+
+    # Fungsi untuk menampilkan hasil undo/redo.
+    def _apply_history(self, command):
+        if command is None: return
+        # Objek terpilih mungkin sudah tidak ada di adegan; yang masih ada tetap terpilih.
+        if any(shape._scene is not self.scene for shape in self.selected_objects):
+            self.selected_objects = [shape for shape in self.selected_objects if shape._scene is self.scene]
+            self._draw_selection_box()
+        self._update_status_bar()
+        self.render_scheduler.request()
+
+    # --- Instrumentasi Latensi ---
+    # Fungsi untuk menyalakan/mematikan pengukuran waktu handler event dan tahap render.
+    # Saat mati, metode asli dipakai langsung sehingga tidak ada biaya tambahan.
+    def set_profiling(self, enabled):
+        profiler = self.profiler
+        if enabled == profiler.enabled: return
+        if enabled:
+            profiler.reset()
+            profiler.instrument(self, PROFILED_METHODS)
+            # Pembuatan/perubahan item kanvas (atau tile) diukur sebagai tahap tersendiri.
+            profiler.instrument(self.renderer, {'flush': 'render.flush'})
+            # Setiap flush penjadwal adalah satu frame.
+            profiler.instrument(self.render_scheduler, {'_flush': FRAME})
+        else:
+            profiler.uninstrument()
+        profiler.enabled = enabled
+        self._bind_mouse_events()
+        self._update_status_bar()
+
+    # Fungsi untuk membalik status instrumentasi (tombol F12).
+    def toggle_profiling(self):
+        self.set_profiling(not self.profiler.enabled)
+
+    # Fungsi yang dipanggil setelah setiap frame terukur; status bar diperbarui paling
+    # banyak sekali per PROFILE_STATUS_INTERVAL agar tidak menambah beban frame.
+    def _on_profiled_frame(self):
+        now = self.profiler.clock()
+        if now - self._profile_status_time < PROFILE_STATUS_INTERVAL: return
+        self._profile_status_time = now
+        self._update_status_bar()
+
+    # Fungsi untuk menyimpan hasil pengukuran sebagai Chrome trace JSON dan mencetak
+    # ringkasan histogram latensi ke konsol.
+    def export_profile(self):
+        path = filedialog.asksaveasfilename(defaultextension=".json",
+                                            filetypes=[("Chrome trace", "*.json")])
+        if not path: return
+        try:
+            self.profiler.export_chrome_trace(path)
+        except OSError as e:
+            messagebox.showerror("Gagal menyimpan trace", str(e))
+            return
+        print(self.profiler.report())
+
     # Fungsi untuk mengatur warna gambar.
     def set_draw_color(self, color):
         self.draw_color = color
@@ -887,9 +983,18 @@ class DrawingApp:
         win_status = "Windowing: Aktif" if self.window_coords else "Windowing: Nonaktif"
         color_status = f"Warna: {self.draw_color} | Ukuran: {self.brush_size}"
         fill_status = "Isi: Aktif" if self.fill_shape else "Isi: Nonaktif"
-        selection_status = f" | Objek dipilih: {self.selected_object['type']}" if self.selected_object else ""
+        zoom_status = f" | Zoom: {self.viewport.scale * 100:.0f}%" if self.viewport.scale != 1.0 else ""
+        selection_status = ""
+        if len(self.selected_objects) == 1: selection_status = f" | Objek dipilih: {self.selected_objects[0].type}"
+        elif self.selected_objects: selection_status = f" | Objek dipilih: {len(self.selected_objects)} objek"
+        # Waktu frame rata-rata dan FPS terkini saat instrumentasi aktif.
+        profile_status = ""
+        if self.profiler.enabled:
+            frame_time, fps = self.profiler.recent_frame_stats()
+            profile_status = f" | Frame: {frame_time * 1000:.1f} ms | {fps:.0f} FPS"
         # Atur teks pada widget status bar.
-        self.status_bar.config(text=f"{mode} | {win_status} | {color_status} | {fill_status}{selection_status}")
+        self.status_bar.config(text=f"{mode} | {win_status} | {color_status} | {fill_status}"
+                                    f"{zoom_status}{selection_status}{profile_status}")
 
 # --- Titik Masuk Utama Program ---
 # Blok ini hanya akan dieksekusi jika file ini dijalankan sebagai script utama.
@@ -0,0 +1,278 @@
+# --- Mode Batch Tanpa GUI ---
+# Memproses banyak file adegan dari baris perintah tanpa Tk: setiap file dimuat, dijalankan
+# melalui pipeline operasi (pilih objek, translasi/rotasi/skala, sorotan window, clipping),
+# lalu disimpan/diekspor. File diproses bersamaan oleh beberapa proses pekerja dan
+# kemajuan dicetak per file begitu selesai.
+#
+# Operasi dijalankan sesuai urutan di baris perintah:
+#     --select SPEC            memilih objek untuk transformasi berikutnya; SPEC berupa
+#                              'all' atau gabungan 'type=line|ellipse', 'color=red',
+#                              'window=XMIN:YMIN:XMAX:YMAX' dipisah koma
+#     --translate DX,DY        menggeser objek terpilih
+#     --rotate DEG[,CX,CY]     memutar objek terpilih (default terhadap pusat masing-masing)
+#     --scale F[,CX,CY]        mengubah skala objek terpilih (default terhadap pusat masing-masing)
+#     --window X1,Y1,X2,Y2     menyorot objek yang bersinggungan dengan window (hanya terlihat
+#                              pada gambar png/ppm; file adegan selalu menyimpan warna asli)
+#     --clip X1,Y1,X2,Y2       memotong objek yang bersinggungan dengan window (sama seperti
+#                              alat Clip di aplikasi; objek lain tidak diubah)
+#
+# Contoh (dari direktori root repositori):
+#     python batch.py arsip/ --clip 0,0,800,600 --export drw --export png -o hasil/ -j 8
+#     python batch.py a.drw --select type=line --rotate 90 --translate 10,0 --export json -o out/
+import argparse
+import math
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import affine
+import clipping
+import raster
+import scene_io
+import transforms
+import windowing
+from scene import Scene
+from spatial_index import GridIndex
+
+# Format keluaran yang didukung: adegan (drw, json) dan gambar (png, ppm).
+EXPORT_FORMATS = ('drw', 'json', 'png', 'ppm')
+IMAGE_FORMATS = ('png', 'ppm')
+# Ekstensi file adegan yang diambil saat input berupa direktori.
+SCENE_EXTENSIONS = ('.drw', '.json')
+
+
+# --- Parsing Argumen ---
+# Mengubah teks "a,b,c" menjadi tuple angka dengan jumlah yang diizinkan.
+def _numbers(text, counts):
+    try:
+        values = tuple(float(v) for v in text.split(','))
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"angka tidak valid: {text!r}")
+    if len(values) not in counts:
+        raise argparse.ArgumentTypeError(f"diharapkan {' atau '.join(map(str, counts))} angka: {text!r}")
+    return values
+
+# Mengubah teks window "x1,y1,x2,y2" menjadi (xmin, ymin, xmax, ymax).
+def _rect(text, separator=','):
+    x1, y1, x2, y2 = _numbers(text.replace(separator, ','), (4,))
+    return (min(x1, x2), min(y1, y2), max(x1, x2), max(y1, y2))
+
+# Mengubah SPEC --select menjadi dictionary filter (None = semua objek).
+def parse_selection(text):
+    if text.strip() == 'all': return None
+    spec = {}
+    for part in text.split(','):
+        key, _, value = part.partition('=')
+        key = key.strip()
+        if key in ('type', 'color'): spec[key] = set(value.split('|'))
+        elif key == 'window': spec[key] = _rect(value, ':')
+        else: raise argparse.ArgumentTypeError(f"filter tidak dikenal: {key!r}")
+    return spec
+
+# Parser untuk setiap operasi pipeline.
+OPERATIONS = {
+    'select': parse_selection,
+    'translate': lambda text: _numbers(text, (2,)),
+    'rotate': lambda text: _numbers(text, (1, 3)),
+    'scale': lambda text: _numbers(text, (1, 3)),
+    'window': _rect,
+    'clip': _rect,
+}
+
+# Metavar dan teks bantuan setiap operasi.
+OPERATION_HELP = {
+    'select': ('SPEC', "pilih objek untuk transformasi berikutnya: 'all' atau type=..,color=..,window=X1:Y1:X2:Y2"),
+    'translate': ('DX,DY', "geser objek terpilih"),
+    'rotate': ('DEG[,CX,CY]', "putar objek terpilih (default terhadap pusat masing-masing)"),
+    'scale': ('F[,CX,CY]', "ubah skala objek terpilih (default terhadap pusat masing-masing)"),
+    'window': ('X1,Y1,X2,Y2', "sorot objek yang bersinggungan dengan window (hanya untuk ekspor png/ppm)"),
+    'clip': ('X1,Y1,X2,Y2', "potong objek yang bersinggungan dengan window"),
+}
+
+# Action argparse yang menambahkan (operasi, nilai) ke satu list agar urutannya terjaga.
+class _PipelineAction(argparse.Action):
+    def __call__(self, parser, namespace, values, option_string=None):
+        pipeline = getattr(namespace, self.dest, None) or []
+        pipeline.append((option_string.lstrip('-'), values))
+        setattr(namespace, self.dest, pipeline)
+
+# Mengubah teks "WxH" menjadi (lebar, tinggi).
+def _size(text):
+    try:
+        width, height = (int(v) for v in text.lower().split('x'))
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"ukuran tidak valid: {text!r} (contoh: 1920x1080)")
+    if width <= 0 or height <= 0: raise argparse.ArgumentTypeError("ukuran harus positif")
+    return width, height
+
+
+# --- Pipeline ---
+# Mengembalikan objek adegan yang cocok dengan filter 'spec' (urut sesuai urutan gambar).
+def select_shapes(scene, spec):
+    if spec is None: return list(scene)
+    candidates = set(scene.query(spec['window'])) if 'window' in spec else None
+    return [shape for shape in scene
+            if (candidates is None or shape in candidates)
+            and ('type' not in spec or shape.type in spec['type'])
+            and ('color' not in spec or shape.color in spec['color'])]
+
+# Menjalankan pipeline operasi pada adegan.
+def run_pipeline(scene, pipeline, highlight_color=windowing.DEFAULT_HIGHLIGHT_COLOR,
+                 algorithm=clipping.DEFAULT_LINE_ALGORITHM):
+    selection = None
+    for operation, value in pipeline:
+        if operation == 'select':
+            selection = value
+        elif operation == 'translate':
+            for shape in select_shapes(scene, selection): transforms.translate_shape(shape, *value)
+        elif operation == 'rotate':
+            angle, center = math.radians(value[0]), value[1:] or None
+            for shape in select_shapes(scene, selection): transforms.rotate_shape(shape, angle, center)
+        elif operation == 'scale':
+            factor, center = value[0], value[1:] or None
+            for shape in select_shapes(scene, selection):
+                transforms.transform_shape(shape, affine.scaling(factor, center or shape.center))
+        elif operation == 'window':
+            windowing.apply_windowing_effect(scene, value, highlight_color)
+        elif operation == 'clip':
+            clipping.perform_clipping(scene, value, algorithm)
+    return scene
+
+# Ukuran gambar default: cukup untuk memuat seluruh objek (koordinat mulai dari 0).
+def scene_extent(scene):
+    width = height = 1
+    for shape in scene:
+        box = shape.bbox
+        if box is None: continue
+        width = max(width, math.ceil(box[2]) + 1)
+        height = max(height, math.ceil(box[3]) + 1)
+    return width, height
+
+# Memproses satu file: muat, jalankan pipeline, lalu tulis semua keluaran.
+# 'name' adalah path keluaran relatif tanpa ekstensi. Dijalankan di proses pekerja.
+def process_file(path, name, pipeline, options):
+    start = time.perf_counter()
+    scene = Scene()
+    GridIndex().attach(scene)
+    for shape in scene_io.load(path): scene.add(shape)
+    # Titik dari file JSON dipindahkan ke satu buffer koordinat bersama.
+    scene.compact()
+    count_before = len(scene)
+    run_pipeline(scene, pipeline, options['highlight_color'], options['algorithm'])
+    outputs = []
+    for export in options['exports']:
+        target = os.path.join(options['output_dir'], f"{name}.{export}")
+        os.makedirs(os.path.dirname(target) or '.', exist_ok=True)
+        if export in ('drw', 'json'):
+            # Target boleh sama dengan file input yang masih dibaca lewat mmap; scene_io
+            # menulis ke file sementara lalu menggantinya, jadi input tidak pernah terpotong.
+            scene_io.save(scene, target)
+        else:
+            width, height = options['size'] or scene_extent(scene)
+            raster.render_scene(scene, width, height, options['background']).save(target)
+        outputs.append(target)
+    return {'path': path, 'outputs': outputs, 'shapes_before': count_before,
+            'shapes_after': len(scene), 'seconds': time.perf_counter() - start}
+
+# Mengumpulkan file input. Direktori diperluas menjadi file adegan di dalamnya; nama
+# keluaran mempertahankan sub-direktori relatif terhadap direktori input.
+def collect_inputs(paths, recursive=False):
+    inputs = []
+    for path in paths:
+        if not os.path.isdir(path):
+            inputs.append((path, os.path.splitext(os.path.basename(path))[0]))
+            continue
+        for folder, subdirs, files in os.walk(path):
+            subdirs.sort()
+            if not recursive: subdirs.clear()
+            for file_name in sorted(files):
+                if file_name.lower().endswith(SCENE_EXTENSIONS):
+                    full = os.path.join(folder, file_name)
+                    inputs.append((full, os.path.splitext(os.path.relpath(full, path))[0]))
+    return inputs
+
+# Menjalankan process_file untuk semua input, secara paralel jika jobs > 1. Hasil setiap
+# file (atau errornya) diteruskan ke 'report' begitu file tersebut selesai; file yang
+# gagal tidak menghentikan file lainnya.
+def run_batch(inputs, pipeline, options, jobs=1, report=None):
+    failures = 0
+
+    def finish(path, result, error):
+        nonlocal failures
+        if error is not None: failures += 1
+        if report: report(path, result, error)
+
+    if jobs <= 1:
+        for path, name in inputs:
+            try:
+                finish(path, process_file(path, name, pipeline, options), None)
+            except Exception as e:
+                finish(path, None, e)
+        return failures
+    with ProcessPoolExecutor(jobs) as executor:
+        futures = {executor.submit(process_file, path, name, pipeline, options): path
+                   for path, name in inputs}
+        for future in as_completed(futures):
+            try:
+                finish(futures[future], future.result(), None)
+            except Exception as e:
+                finish(futures[future], None, e)
+    return failures
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Memproses file adegan tanpa GUI: transformasi, sorotan window, clipping, dan ekspor.")
+    parser.add_argument('inputs', nargs='+', help="file adegan (.drw/.json) atau direktori")
+    parser.add_argument('-r', '--recursive', action='store_true', help="telusuri sub-direktori input")
+    for operation, parse in OPERATIONS.items():
+        metavar, help_text = OPERATION_HELP[operation]
+        parser.add_argument(f'--{operation}', type=parse, action=_PipelineAction, dest='pipeline',
+                            metavar=metavar, help=help_text)
+    parser.add_argument('--export', action='append', choices=EXPORT_FORMATS,
+                        help="format keluaran (boleh diulang; default drw)")
+    parser.add_argument('-o', '--output-dir', required=True, help="direktori keluaran")
+    parser.add_argument('--size', type=_size, help="ukuran gambar WxH (default: seluas adegan)")
+    parser.add_argument('--background', default='white', help="warna latar gambar")
+    parser.add_argument('--highlight-color', default=windowing.DEFAULT_HIGHLIGHT_COLOR)
+    parser.add_argument('--algorithm', choices=sorted(clipping.LINE_ALGORITHMS),
+                        default=clipping.DEFAULT_LINE_ALGORITHM, help="algoritma clipping garis")
+    parser.add_argument('-j', '--jobs', type=int, default=os.cpu_count() or 1,
+                        help="jumlah proses pekerja (default: jumlah CPU)")
+    args = parser.parse_args(argv)
+    exports = args.export or ['drw']
+    # Sorotan window hanya tampilan: file adegan menyimpan warna asli, jadi tanpa ekspor
+    # gambar --window tidak berpengaruh apa pun.
+    if (any(operation == 'window' for operation, _ in args.pipeline or [])
+            and not any(export in IMAGE_FORMATS for export in exports)):
+        parser.error("--window hanya berpengaruh pada ekspor gambar (--export png/ppm)")
+
+    inputs = collect_inputs(args.inputs, args.recursive)
+    if not inputs:
+        print("tidak ada file adegan yang ditemukan", file=sys.stderr)
+        return 1
+    options = {'exports': exports, 'output_dir': args.output_dir, 'size': args.size,
+               'background': args.background, 'highlight_color': args.highlight_color,
+               'algorithm': args.algorithm}
+    total, done = len(inputs), 0
+    started = time.perf_counter()
+
+    # Mencetak satu baris kemajuan begitu sebuah file selesai.
+    def report(path, result, error):
+        nonlocal done
+        done += 1
+        prefix = f"[{done}/{total}] {path}"
+        if error is not None:
+            print(f"{prefix}: GAGAL: {error}", file=sys.stderr, flush=True)
+        else:
+            print(f"{prefix} -> {', '.join(result['outputs'])} "
+                  f"({result['shapes_before']} -> {result['shapes_after']} objek, "
+                  f"{result['seconds']:.2f} s)", flush=True)
+
+    failures = run_batch(inputs, args.pipeline or [], options, min(args.jobs, total), report)
+    print(f"selesai: {total - failures} berhasil, {failures} gagal, "
+          f"{time.perf_counter() - started:.1f} s", flush=True)
+    return 1 if failures else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,417 @@
+# --- Suite Benchmark Jalur Kritis ---
+# Mengukur jalur-jalur yang kritis untuk kinerja pada adegan sintetis yang dapat diulang:
+# redraw_all (bangun ulang penuh dan inkremental), _perform_clipping,
+# sutherland_hodgman_clip, cohen_sutherland_clip (skalar dan batch), _select_object,
+# _apply_windowing_effect, serta drag translasi/rotasi/skala lewat handler mouse (juga
+# drag translasi dengan window sorotan aktif dan drag grup hasil seleksi marquee), serta
+# pan dan zoom tampilan. scene.compact melaporkan memori per titik sebelum dan sesudah
+# titik dipindahkan ke buffer koordinat bersama.
+#
+# Secara default kanvas diganti dengan StubCanvas (stub_tk.py) sehingga suite berjalan
+# tanpa display; jumlah panggilan API kanvas ikut dilaporkan. Dengan --tk real dipakai Tk
+# sungguhan (jalankan di bawah server X virtual, misalnya xvfb-run).
+#
+# Hasil ditulis sebagai JSON (--output). Dengan --baseline, hasil dibandingkan dengan file
+# JSON sebelumnya; kode keluar 1 jika ada benchmark yang melambat melebihi --threshold.
+#
+# Cara menjalankan (dari direktori root repositori):
+#     python benchmarks/bench_suite.py --objects 5000 --output baseline.json
+#     python benchmarks/bench_suite.py --objects 5000 --baseline baseline.json
+import argparse
+import gc
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+import tracemalloc
+from types import SimpleNamespace
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir))
+
+import affine
+import clipping
+import parallel_clipping
+import transforms
+import synthetic
+from scene import Scene
+from stub_tk import make_stub_app
+
+# Window clipping/windowing yang dipakai (di tengah area adegan sintetis 2000x2000).
+WINDOW = (500, 400, 1500, 1300)
+
+
+# Membuat aplikasi dengan kanvas tiruan atau Tk sungguhan. Mengembalikan (app, root).
+def make_app(tk_kind, render_mode='items'):
+    if tk_kind == 'stub': return make_stub_app(render_mode)
+    import tkinter
+    import aplikasi_menggambar
+    aplikasi_menggambar.tk = tkinter
+    root = tkinter.Tk()
+    app = aplikasi_menggambar.DrawingApp(root, render_mode=render_mode)
+    root.update()
+    return app, root
+
+# Menjalankan callback after() yang tertunda (atau memproses event loop Tk sungguhan).
+def run_pending(root):
+    if hasattr(root, 'run_pending'): root.run_pending()
+    else: root.update()
+
+# Membuat aplikasi yang berisi adegan sintetis yang sudah tergambar.
+def make_loaded_app(args):
+    app, root = make_app(args.tk)
+    for shape in synthetic.iter_shapes(args.objects, args.stroke_length, args.mix, seed=args.seed):
+        app.scene.add(shape)
+    app.redraw_all()
+    return app, root
+
+# Jumlah panggilan API kanvas tiruan (kosong untuk Tk sungguhan).
+def canvas_calls(app):
+    calls = getattr(app.canvas, 'calls', None)
+    return dict(calls) if calls is not None else {}
+
+# Mengosongkan hitungan panggilan API kanvas tiruan.
+def reset_calls(app):
+    calls = getattr(app.canvas, 'calls', None)
+    if calls is not None: calls.clear()
+
+
+# --- Pengukuran ---
+# Menjalankan 'run(state)' sebanyak 'repeat' kali; 'setup()' dipanggil sebelum setiap
+# pengulangan dan tidak ikut diukur. Mengembalikan ringkasan waktu (milidetik).
+def measure(run, repeat, setup=None):
+    times = []
+    info = None
+    for _ in range(repeat):
+        state = setup() if setup else None
+        start = time.perf_counter()
+        info = run(state)
+        times.append((time.perf_counter() - start) * 1000)
+    result = {'best_ms': round(min(times), 3), 'mean_ms': round(statistics.mean(times), 3)}
+    if info: result.update(info)
+    return result
+
+
+# --- Benchmark ---
+# Setiap fungsi menerima argumen CLI dan mengembalikan hasil measure().
+
+# Membangun ulang semua item kanvas dari adegan.
+def bench_redraw_full(args):
+    app, _ = make_loaded_app(args)
+
+    def run(_):
+        reset_calls(app)
+        app.renderer.rebuild()
+        app.redraw_all()
+        return {'canvas_calls': canvas_calls(app)}
+
+    return measure(run, args.repeat)
+
+# Membangun ulang semua item kanvas saat seluruh adegan di-zoom jauh (level of detail).
+# Pengulangan pertama ikut membangun cache level; 'coordinates' adalah jumlah angka
+# koordinat yang dikirim ke kanvas.
+def bench_redraw_zoomed_out(args):
+    app, _ = make_loaded_app(args)
+    app.viewport.zoom_at(0.1, 0, 0)
+    app._on_view_changed()
+
+    def run(_):
+        reset_calls(app)
+        app.renderer.rebuild()
+        app.redraw_all()
+        return {'canvas_calls': canvas_calls(app)}
+
+    return measure(run, args.repeat)
+
+# Memori adegan per titik (byte, termasuk objek Shape dan gayanya) sebelum dan sesudah
+# Scene.compact(), diukur dengan tracemalloc di luar pengukuran waktu.
+def scene_memory_per_vertex(args):
+    tracemalloc.start()
+    try:
+        gc.collect()
+        start = tracemalloc.get_traced_memory()[0]
+        scene = Scene(synthetic.iter_shapes(args.objects, args.stroke_length, args.mix, seed=args.seed))
+        gc.collect()
+        loose = tracemalloc.get_traced_memory()[0] - start
+        scene.compact()
+        gc.collect()
+        compact = tracemalloc.get_traced_memory()[0] - start
+    finally:
+        tracemalloc.stop()
+    vertices = sum(len(shape.points) for shape in scene if shape.ellipse is None) or 1
+    return {'vertices': vertices, 'bytes_per_vertex_loose': round(loose / vertices, 1),
+            'bytes_per_vertex_compact': round(compact / vertices, 1)}
+
+# Memindahkan titik seluruh adegan sintetis ke buffer koordinat bersama.
+def bench_compact(args):
+    memory = scene_memory_per_vertex(args)
+
+    def setup():
+        return Scene(synthetic.iter_shapes(args.objects, args.stroke_length, args.mix, seed=args.seed))
+
+    def run(scene):
+        scene.compact()
+        return memory
+
+    return measure(run, args.repeat, setup)
+
+# redraw_all setelah satu objek berpindah (jalur frame saat drag).
+def bench_redraw_incremental(args):
+    app, _ = make_loaded_app(args)
+    shape = list(app.scene)[len(app.scene) // 2]
+
+    def run(_):
+        reset_calls(app)
+        shape.apply_transform(affine.translation(1, 0))
+        app.redraw_all()
+        return {'canvas_calls': canvas_calls(app)}
+
+    return measure(run, args.repeat)
+
+# Clipping seluruh adegan lewat _perform_clipping (adegan baru setiap pengulangan).
+def bench_perform_clipping(args):
+    def setup():
+        return make_loaded_app(args)[0]
+
+    def run(app):
+        app._perform_clipping(WINDOW)
+        app.redraw_all()
+        return {'shapes_after': len(app.scene)}
+
+    return measure(run, args.repeat, setup)
+
+# Clipping seluruh adegan di beberapa proses pekerja (tanpa ambang ukuran adegan).
+def bench_parallel_clipping(args):
+    def setup():
+        return make_loaded_app(args)[0]
+
+    def run(app):
+        parallel_clipping.perform_clipping(app.scene, WINDOW, workers=args.workers, threshold=0)
+        return {'shapes_after': len(app.scene), 'workers': args.workers}
+
+    # Pool pekerja dinyalakan lebih dulu agar waktu start proses tidak ikut diukur.
+    parallel_clipping.get_executor(args.workers).submit(int).result()
+    return measure(run, args.repeat, setup)
+
+# Sutherland-Hodgman pada semua persegi dan poligon elips di adegan.
+def bench_sutherland_hodgman(args):
+    polygons = [affine.as_list(shape.points)
+                for shape in synthetic.iter_shapes(args.objects, args.stroke_length, args.mix,
+                                                   seed=args.seed)
+                if shape.type in ('rectangle', 'ellipse')]
+
+    def run(_):
+        for polygon in polygons: clipping.sutherland_hodgman_clip(polygon, WINDOW)
+        return {'polygons': len(polygons)}
+
+    return measure(run, args.repeat)
+
+# Semua segmen goresan adegan, dalam bentuk (x1, y1, x2, y2).
+def _stroke_segments(args):
+    segments = []
+    for shape in synthetic.iter_shapes(args.objects, args.stroke_length, args.mix, seed=args.seed):
+        if shape.type != 'line': continue
+        points = affine.as_list(shape.points)
+        segments.extend((a[0], a[1], b[0], b[1]) for a, b in zip(points, points[1:]))
+    return segments
+
+# Cohen-Sutherland skalar, satu panggilan per segmen.
+def bench_cohen_sutherland(args):
+    segments = _stroke_segments(args)
+    clip = clipping.cohen_sutherland_clip
+
+    def run(_):
+        for s in segments: clip((s[0], s[1]), (s[2], s[3]), WINDOW)
+        return {'segments': len(segments)}
+
+    return measure(run, args.repeat)
+
+# Kernel batch clip_segments pada segmen yang sama.
+def bench_clip_segments(args):
+    segments = _stroke_segments(args)
+    packed = affine.np.asarray(segments, dtype=float) if affine.HAVE_NUMPY else segments
+
+    def run(_):
+        clipping.clip_segments(packed, WINDOW)
+        return {'segments': len(segments)}
+
+    return measure(run, args.repeat)
+
+# Klik pemilihan objek di beberapa titik tetap.
+def bench_select_object(args):
+    app, _ = make_loaded_app(args)
+    clicks = [(100 + 173 * i % 1800, 100 + 311 * i % 1800) for i in range(args.clicks)]
+
+    def run(_):
+        for x, y in clicks: app._select_object(x, y)
+        return {'clicks': len(clicks)}
+
+    return measure(run, args.repeat)
+
+# Efek windowing pada adegan (window berpindah setiap pengulangan agar sorotan berubah).
+def bench_windowing(args):
+    app, _ = make_loaded_app(args)
+    offsets = iter(range(0, 10 ** 6, 37))
+
+    def run(_):
+        dx = next(offsets) % 400
+        app.window_coords = (WINDOW[0] - dx, WINDOW[1], WINDOW[2] - dx, WINDOW[3])
+        app._apply_windowing_effect()
+        app.redraw_all()
+        return {'highlighted': len(app.highlighted_objects)}
+
+    return measure(run, args.repeat)
+
+# Drag satu objek lewat handler mouse: setiap langkah adalah satu event gerak dan satu frame.
+# Dengan 'windowed', window sorotan aktif selama drag. Dengan 'group', semua objek di dalam
+# WINDOW dipilih lewat marquee dan diseret sebagai satu grup.
+def bench_drag(args, mode, windowed=False, group=False):
+    def setup():
+        app, root = make_loaded_app(args)
+        if windowed:
+            app.window_coords = WINDOW
+            app._apply_windowing_effect()
+            app.redraw_all()
+        app.set_transform_mode(mode)
+        if group:
+            app._select_in_rect(WINDOW)
+        else:
+            # Goresan terpanjang di adegan sebagai objek yang diseret.
+            app.selected_object = max(app.scene, key=lambda s: len(s.points))
+        return app, root
+
+    def run(state):
+        app, root = state
+        cx, cy = transforms.group_center(app.selected_objects)
+        app._on_mouse_down(SimpleNamespace(x=cx + 50, y=cy))
+        for step in range(1, args.drag_steps + 1):
+            app._on_mouse_move(SimpleNamespace(x=cx + 50 + step, y=cy + step))
+            app.render_scheduler.flush_now()
+        app._on_mouse_up(SimpleNamespace(x=cx + 50 + args.drag_steps, y=cy + args.drag_steps))
+        run_pending(root)
+        return {'steps': args.drag_steps, 'selected': len(app.selected_objects)}
+
+    return measure(run, args.repeat, setup)
+
+# Pan dan zoom tampilan lewat handler mouse: setiap langkah adalah satu event dan satu frame.
+# Pan dilakukan pada zoom 2x sehingga objek terus masuk dan keluar dari area terlihat.
+def bench_view(args, action):
+    def setup():
+        app, root = make_loaded_app(args)
+        if action == 'pan':
+            app.viewport.zoom_at(2.0, 0, 0)
+            app._on_view_changed()
+            app.render_scheduler.flush_now()
+        return app, root
+
+    def run(state):
+        app, root = state
+        if action == 'pan':
+            app._on_pan_start(SimpleNamespace(x=0, y=0))
+            for step in range(1, args.drag_steps + 1):
+                app._on_pan_move(SimpleNamespace(x=-40 * step, y=-25 * step))
+                app.render_scheduler.flush_now()
+        else:
+            for step in range(args.drag_steps):
+                num = 5 if step < args.drag_steps // 2 else 4
+                app._on_mouse_wheel(SimpleNamespace(num=num, delta=0, x=600, y=400))
+                app.render_scheduler.flush_now()
+        return {'steps': args.drag_steps, 'items': len(getattr(app.renderer, 'items', ()))}
+
+    return measure(run, args.repeat, setup)
+
+BENCHMARKS = {
+    'redraw_all.full': bench_redraw_full,
+    'redraw_all.incremental': bench_redraw_incremental,
+    'redraw_all.zoomed_out': bench_redraw_zoomed_out,
+    'perform_clipping': bench_perform_clipping,
+    'perform_clipping.parallel': bench_parallel_clipping,
+    'sutherland_hodgman_clip': bench_sutherland_hodgman,
+    'cohen_sutherland_clip': bench_cohen_sutherland,
+    'clip_segments': bench_clip_segments,
+    'select_object': bench_select_object,
+    'apply_windowing_effect': bench_windowing,
+    'drag.translate': lambda args: bench_drag(args, 'Translate'),
+    'drag.rotate': lambda args: bench_drag(args, 'Rotate'),
+    'drag.scale': lambda args: bench_drag(args, 'Scale'),
+    'drag.translate.windowed': lambda args: bench_drag(args, 'Translate', windowed=True),
+    'drag.group.translate': lambda args: bench_drag(args, 'Translate', group=True),
+    'drag.group.rotate': lambda args: bench_drag(args, 'Rotate', group=True),
+    'view.pan': lambda args: bench_view(args, 'pan'),
+    'view.zoom': lambda args: bench_view(args, 'zoom'),
+    'scene.compact': bench_compact,
+}
+
+
+# --- Perbandingan dengan Baseline ---
+# Mencetak rasio waktu terbaik terhadap baseline. Mengembalikan nama benchmark yang
+# melambat lebih dari 'threshold' (misalnya 0.1 = 10%).
+def compare(results, baseline, threshold):
+    if baseline['meta']['params'] != results['meta']['params']:
+        print("peringatan: parameter baseline berbeda, perbandingan mungkin tidak setara")
+    regressions = []
+    for name, result in results['results'].items():
+        old = baseline['results'].get(name)
+        if old is None:
+            print(f"{name:<26}: (tidak ada di baseline)")
+            continue
+        ratio = result['best_ms'] / old['best_ms'] if old['best_ms'] else float('inf')
+        flag = ""
+        if ratio > 1 + threshold:
+            flag = "  <-- LEBIH LAMBAT"
+            regressions.append(name)
+        print(f"{name:<26}: {old['best_ms']:10.2f} -> {result['best_ms']:10.2f} ms  (x{ratio:5.2f}){flag}")
+    return regressions
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Suite benchmark jalur kritis aplikasi menggambar.")
+    parser.add_argument('--objects', type=int, default=2000, help="jumlah objek adegan sintetis")
+    parser.add_argument('--stroke-length', type=int, default=50, help="jumlah titik per goresan pensil")
+    parser.add_argument('--mix', type=synthetic.parse_mix, default=synthetic.DEFAULT_MIX,
+                        help="campuran jenis objek, misalnya line=0.6,rectangle=0.2,ellipse=0.2")
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--clicks', type=int, default=50, help="jumlah klik untuk select_object")
+    parser.add_argument('--drag-steps', type=int, default=60, help="jumlah event gerak per drag")
+    parser.add_argument('--workers', type=int, default=max(2, parallel_clipping.default_workers()),
+                        help="jumlah proses pekerja untuk perform_clipping.parallel")
+    parser.add_argument('--only', nargs='*', choices=sorted(BENCHMARKS), help="jalankan sebagian benchmark")
+    parser.add_argument('--tk', choices=('stub', 'real'), default='stub')
+    parser.add_argument('--output', help="tulis hasil sebagai JSON ke file ini")
+    parser.add_argument('--baseline', help="bandingkan dengan hasil JSON sebelumnya")
+    parser.add_argument('--threshold', type=float, default=0.10,
+                        help="batas perlambatan relatif terhadap baseline (default 0.10)")
+    args = parser.parse_args(argv)
+
+    params = {'objects': args.objects, 'stroke_length': args.stroke_length, 'mix': args.mix,
+              'seed': args.seed, 'clicks': args.clicks, 'workers': args.workers, 'drag_steps': args.drag_steps, 'tk': args.tk}
+    results = {
+        'meta': {'python': platform.python_version(), 'platform': platform.platform(),
+                 'numpy': affine.np.__version__ if affine.HAVE_NUMPY else None,
+                 'repeat': args.repeat, 'params': params},
+        'results': {},
+    }
+    print(f"objek: {args.objects}  goresan: {args.stroke_length} titik  "
+          f"numpy: {'ya' if affine.HAVE_NUMPY else 'tidak'}  tk: {args.tk}")
+    for name in args.only or BENCHMARKS:
+        result = BENCHMARKS[name](args)
+        results['results'][name] = result
+        print(f"{name:<26}: {result['best_ms']:10.2f} ms  (rata-rata {result['mean_ms']:.2f} ms)")
+        if 'bytes_per_vertex_loose' in result:
+            print(f"{'':<26}  memori per titik: {result['bytes_per_vertex_loose']} -> "
+                  f"{result['bytes_per_vertex_compact']} byte")
+    parallel_clipping.shutdown()
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2)
+    if args.baseline:
+        with open(args.baseline, encoding='utf-8') as f:
+            baseline = json.load(f)
+        print()
+        if compare(results, baseline, args.threshold): return 1
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
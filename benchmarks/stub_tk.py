@@ -0,0 +1,188 @@
+# --- Pengganti Tkinter untuk Benchmark Tanpa Layar ---
+# Modul tiruan 'tk' yang cukup untuk membuat DrawingApp tanpa display. Semua widget
+# kecuali kanvas tidak melakukan apa-apa. StubCanvas menyimpan item beserta koordinat
+# dan opsinya serta menghitung setiap panggilan API kanvas, sehingga benchmark mengukur
+# pekerjaan aplikasi dan jumlah panggilan Tk yang akan dilakukannya.
+# Untuk mengukur dengan Tk sungguhan, jalankan benchmark dengan --tk real di bawah
+# server X virtual (misalnya 'xvfb-run python benchmarks/bench_suite.py --tk real').
+import itertools
+from collections import Counter
+
+
+# Widget tiruan: menerima argumen apa pun dan semua metodenya tidak melakukan apa-apa.
+class StubWidget:
+    def __init__(self, *args, **kwargs):
+        self._options = dict(kwargs)
+
+    def config(self, **kwargs):
+        self._options.update(kwargs)
+
+    configure = config
+
+    def cget(self, name):
+        return self._options.get(name, "")
+
+    def __getattr__(self, name):
+        return lambda *args, **kwargs: None
+
+
+class StubVar:
+    def __init__(self, master=None, value=None):
+        self._value = value
+
+    def get(self):
+        return self._value
+
+    def set(self, value):
+        self._value = value
+
+
+class StubPhotoImage(StubWidget):
+    pass
+
+
+# Root tiruan: callback after() disimpan dan baru dijalankan lewat run_pending().
+class StubRoot(StubWidget):
+    def __init__(self, *args, **kwargs):
+        super().__init__()
+        self._pending = {}
+        self._ids = itertools.count(1)
+
+    def after(self, ms, func=None, *args):
+        after_id = f"after#{next(self._ids)}"
+        self._pending[after_id] = (func, args)
+        return after_id
+
+    def after_idle(self, func, *args):
+        return self.after(0, func, *args)
+
+    def after_cancel(self, after_id):
+        self._pending.pop(after_id, None)
+
+    # Menjalankan semua callback yang tertunda (termasuk yang dijadwalkan selama berjalan).
+    def run_pending(self):
+        while self._pending:
+            after_id = next(iter(self._pending))
+            func, args = self._pending.pop(after_id)
+            if func: func(*args)
+
+
+# Kanvas tiruan yang menyimpan item dan menghitung panggilan API.
+class StubCanvas(StubWidget):
+    def __init__(self, *args, width=1200, height=800, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.width, self.height = width, height
+        # ID item -> [jenis, koordinat datar, opsi].
+        self.items = {}
+        self.calls = Counter()
+        self._ids = itertools.count(1)
+
+    def _flat(self, coords):
+        flat = []
+        for c in coords:
+            if isinstance(c, (list, tuple)):
+                for v in c:
+                    if isinstance(v, (list, tuple)): flat.extend(v)
+                    else: flat.append(v)
+            else:
+                flat.append(c)
+        return flat
+
+    def _create(self, kind, coords, options):
+        self.calls['create'] += 1
+        item = next(self._ids)
+        flat = self._flat(coords)
+        # Jumlah angka koordinat yang dikirim ke kanvas (beban jembatan Tcl).
+        self.calls['coordinates'] += len(flat)
+        self.items[item] = [kind, flat, options]
+        return item
+
+    def create_line(self, *coords, **options): return self._create('line', coords, options)
+    def create_oval(self, *coords, **options): return self._create('oval', coords, options)
+    def create_polygon(self, *coords, **options): return self._create('polygon', coords, options)
+    def create_rectangle(self, *coords, **options): return self._create('rectangle', coords, options)
+    def create_image(self, *coords, **options): return self._create('image', coords, options)
+
+    def coords(self, item, *coords):
+        if not coords: return self.items[item][1]
+        self.calls['coords'] += 1
+        flat = self.items[item][1] = self._flat(coords)
+        self.calls['coordinates'] += len(flat)
+
+    def itemconfig(self, item, **options):
+        self.calls['itemconfig'] += 1
+        self.items[item][2].update(options)
+
+    itemconfigure = itemconfig
+
+    # Menggeser semua item dengan ID atau tag 'item' sebesar (dx, dy).
+    def move(self, item, dx, dy):
+        self.calls['move'] += 1
+        if isinstance(item, str):
+            targets = [v for v in self.items.values() if item in str(v[2].get('tags', ''))]
+        else:
+            targets = [self.items[item]] if item in self.items else []
+        for target in targets:
+            target[1] = [c + (dy if i % 2 else dx) for i, c in enumerate(target[1])]
+
+    def delete(self, *items):
+        for item in items:
+            self.calls['delete'] += 1
+            if item == 'all':
+                self.items.clear()
+            elif isinstance(item, str):
+                for key in [k for k, v in self.items.items() if item in str(v[2].get('tags', ''))]:
+                    del self.items[key]
+            else:
+                self.items.pop(item, None)
+
+    def tag_raise(self, item, above=None):
+        self.calls['tag_raise'] += 1
+
+    lift = tag_raise
+
+    def tag_lower(self, item, below=None):
+        self.calls['tag_lower'] += 1
+
+    # Seperti Tk: pencarian linear item terdekat (jarak ke bounding box koordinat item).
+    def find_closest(self, x, y, halo=0):
+        self.calls['find_closest'] += 1
+        best, best_distance = None, None
+        for item, (_, coords, _) in self.items.items():
+            xs, ys = coords[0::2], coords[1::2]
+            if not xs: continue
+            dx = max(min(xs) - x, 0, x - max(xs))
+            dy = max(min(ys) - y, 0, y - max(ys))
+            distance = dx * dx + dy * dy
+            if best_distance is None or distance <= best_distance:
+                best, best_distance = item, distance
+        return (best,) if best is not None else ()
+
+    def winfo_width(self):
+        return self.width
+
+    def winfo_height(self):
+        return self.height
+
+
+# Namespace pengganti modul tkinter. Konstanta (tk.RAISED, tk.ROUND, ...) bernilai nama
+# kecilnya, sama seperti di tkinter.
+class StubTk:
+    Tk = StubRoot
+    Canvas = StubCanvas
+    BooleanVar = StubVar
+    PhotoImage = StubPhotoImage
+    Frame = Label = Button = Scale = Checkbutton = StubWidget
+
+    def __getattr__(self, name):
+        if name.isupper(): return name.lower()
+        raise AttributeError(name)
+
+
+# Mengganti tkinter di modul aplikasi dengan versi tiruan lalu membuat DrawingApp.
+# Mengembalikan (app, root).
+def make_stub_app(render_mode='items'):
+    import aplikasi_menggambar
+    aplikasi_menggambar.tk = StubTk()
+    root = StubRoot()
+    return aplikasi_menggambar.DrawingApp(root, render_mode=render_mode), root
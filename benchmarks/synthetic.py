@@ -0,0 +1,62 @@
+# --- Generator Adegan Sintetis ---
+# Membuat adegan acak yang dapat diulang (seed tetap) untuk benchmark dan uji beban.
+# Parameter utama: jumlah objek, panjang goresan pensil (jumlah titik per goresan), dan
+# campuran jenis objek.
+import math
+import os
+import random
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir))
+
+from scene import Shape, rect_corners, ellipse_shape
+
+# Campuran jenis objek default (proporsi, tidak harus berjumlah 1).
+DEFAULT_MIX = {'line': 0.6, 'rectangle': 0.15, 'ellipse': 0.15, 'point': 0.1}
+# Warna yang dipakai (sama dengan palet aplikasi).
+COLORS = ["black", "gray", "maroon", "red", "purple", "green", "olive", "navy", "blue", "teal"]
+
+
+# Mengubah teks "line=0.6,rectangle=0.2" menjadi dictionary campuran.
+def parse_mix(text):
+    mix = {}
+    for part in text.split(','):
+        name, _, weight = part.partition('=')
+        mix[name.strip()] = float(weight) if weight else 1.0
+    return mix
+
+# Menghasilkan objek satu per satu (generator), cocok untuk pemuatan bertahap.
+# 'stroke_length' adalah jumlah titik setiap goresan pensil; 'size' adalah lebar/tinggi area.
+def iter_shapes(count, stroke_length=50, mix=None, size=(2000, 2000), seed=0):
+    rng = random.Random(seed)
+    mix = mix or DEFAULT_MIX
+    kinds, weights = list(mix), list(mix.values())
+    width, height = size
+    for _ in range(count):
+        kind = rng.choices(kinds, weights)[0]
+        color = rng.choice(COLORS)
+        brush = rng.choice((1, 2, 3, 5, 8))
+        x, y = rng.uniform(0, width), rng.uniform(0, height)
+        if kind == 'line':
+            # Goresan pensil sebagai jalan acak dengan arah yang berubah perlahan.
+            heading = rng.uniform(0, 2 * math.pi)
+            points = [(x, y)]
+            for _ in range(max(1, stroke_length - 1)):
+                heading += rng.uniform(-0.4, 0.4)
+                step = rng.uniform(1, 6)
+                x, y = x + step * math.cos(heading), y + step * math.sin(heading)
+                points.append((x, y))
+            yield Shape('line', points, color, brush)
+        elif kind == 'rectangle':
+            w, h = rng.uniform(5, 150), rng.uniform(5, 150)
+            yield Shape('rectangle', rect_corners(x, y, x + w, y + h), color, brush,
+                        fill=rng.random() < 0.3)
+        elif kind == 'ellipse':
+            w, h = rng.uniform(5, 150), rng.uniform(5, 150)
+            yield ellipse_shape(x, y, x + w, y + h, color, brush, rng.random() < 0.3)
+        else:
+            yield Shape('point', [(x, y)], color, brush)
+
+# Membuat adegan sintetis sebagai list objek.
+def make_shapes(count, stroke_length=50, mix=None, size=(2000, 2000), seed=0):
+    return list(iter_shapes(count, stroke_length, mix, size, seed))
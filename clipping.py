@@ -0,0 +1,435 @@
+# --- Logika Clipping ---
+# Algoritma Cohen-Sutherland (garis) dan Sutherland-Hodgman (poligon) sebagai fungsi
+# murni di atas Scene/Shape. Tidak bergantung pada tkinter.
+import affine
+from scene import is_point_in_rect
+
+
+# --- Implementasi Algoritma Cohen-Sutherland ---
+# Variabel konstanta untuk merepresentasikan 4-bit 'outcode'.
+INSIDE, LEFT, RIGHT, BOTTOM, TOP = 0, 1, 2, 4, 8
+
+# Fungsi untuk menghitung outcode sebuah titik terhadap clip_window.
+def compute_outcode(p, clip_window):
+    x, y = p
+    xmin, ymin, xmax, ymax = clip_window
+    code = INSIDE  # Awalnya anggap di dalam.
+    if x < xmin: code |= LEFT    # Jika di kiri, set bit pertama.
+    elif x > xmax: code |= RIGHT # Jika di kanan, set bit kedua.
+    if y < ymin: code |= BOTTOM  # Jika di bawah, set bit ketiga.
+    elif y > ymax: code |= TOP   # Jika di atas, set bit keempat.
+    return code
+
+# Fungsi clipping garis Cohen-Sutherland.
+# Cara kerja:
+# 1. Hitung 'outcode' untuk kedua titik ujung garis (p1, p2).
+# 2. Masuk ke loop yang akan berhenti jika garis diterima atau ditolak.
+# 3. Cek Trivial Accept: Jika outcode p1 DAN p2 adalah 0 (keduanya INSIDE),
+#    maka seluruh garis ada di dalam. Terima dan kembalikan garis asli.
+# 4. Cek Trivial Reject: Jika hasil operasi bitwise AND dari outcode p1 dan p2 tidak nol,
+#    artinya kedua titik berada di luar pada sisi yang sama (misal, keduanya di atas).
+#    Garis pasti di luar. Tolak dan kembalikan None.
+# 5. Jika bukan keduanya, garis perlu dipotong. Pilih satu titik yang di luar.
+# 6. Hitung titik potong (interseksi) antara garis dan batas window.
+# 7. Ganti titik yang di luar tadi dengan titik potong yang baru dihitung.
+# 8. Ulangi loop dengan segmen garis yang sudah diperbarui.
+def cohen_sutherland_clip(p1, p2, clip_window):
+    x1, y1 = p1; x2, y2 = p2
+    xmin, ymin, xmax, ymax = clip_window
+    outcode1 = compute_outcode(p1, clip_window)
+    outcode2 = compute_outcode(p2, clip_window)
+    while True:
+        if not (outcode1 | outcode2): return [(x1, y1), (x2, y2)] # Trivial accept
+        elif outcode1 & outcode2: return None # Trivial reject
+        else:
+            x, y = 0, 0
+            outcode_out = outcode1 if outcode1 else outcode2
+            # Hitung titik potong berdasarkan sisi mana titik itu berada.
+            if outcode_out & TOP:
+                x = x1 + (x2 - x1) * (ymax - y1) / (y2 - y1)
+                y = ymax
+            elif outcode_out & BOTTOM:
+                x = x1 + (x2 - x1) * (ymin - y1) / (y2 - y1)
+                y = ymin
+            elif outcode_out & RIGHT:
+                y = y1 + (y2 - y1) * (xmax - x1) / (x2 - x1)
+                x = xmax
+            elif outcode_out & LEFT:
+                y = y1 + (y2 - y1) * (xmin - x1) / (x2 - x1)
+                x = xmin
+            # Perbarui koordinat titik yang berada di luar dengan titik potong.
+            if outcode_out == outcode1:
+                x1, y1 = x, y
+                outcode1 = compute_outcode((x1, y1), clip_window)
+            else:
+                x2, y2 = x, y
+                outcode2 = compute_outcode((x2, y2), clip_window)
+
+
+# --- Implementasi Algoritma Liang-Barsky ---
+# Clipping garis parametrik: segmen ditulis sebagai P(u) = P1 + u * (P2 - P1), 0 <= u <= 1.
+# Setiap sisi window membatasi rentang u; jika rentang masih valid (u1 <= u2), bagian
+# segmen di antara u1 dan u2 berada di dalam window. Hasilnya sama secara geometris
+# dengan Cohen-Sutherland, tetapi pembulatan floating-point-nya bisa sedikit berbeda.
+def liang_barsky_clip(p1, p2, clip_window):
+    x1, y1 = p1; x2, y2 = p2
+    xmin, ymin, xmax, ymax = clip_window
+    dx, dy = x2 - x1, y2 - y1
+    u1, u2 = 0.0, 1.0
+    # Pasangan (p, q) untuk sisi kiri, kanan, bawah, dan atas.
+    for p, q in ((-dx, x1 - xmin), (dx, xmax - x1), (-dy, y1 - ymin), (dy, ymax - y1)):
+        if p == 0:
+            # Segmen sejajar sisi ini; tolak jika berada di luarnya.
+            if q < 0: return None
+        elif p < 0:
+            u1 = max(u1, q / p)
+        else:
+            u2 = min(u2, q / p)
+    if u1 > u2: return None
+    if u1 == 0.0 and u2 == 1.0: return [(x1, y1), (x2, y2)]
+    return [(x1 + u1 * dx, y1 + u1 * dy), (x1 + u2 * dx, y1 + u2 * dy)]
+
+# Nama algoritma clipping garis yang bisa dipilih.
+LINE_ALGORITHMS = {
+    'cohen-sutherland': cohen_sutherland_clip,
+    'liang-barsky': liang_barsky_clip,
+}
+DEFAULT_LINE_ALGORITHM = 'cohen-sutherland'
+
+
+# --- Kernel Clipping Segmen Secara Batch ---
+# Semua segmen diproses sekaligus sebagai array (N, 4) berisi [x1, y1, x2, y2].
+# Dengan NumPy, outcode dan titik potong dihitung untuk semua segmen dalam satu
+# langkah vektor; tanpa NumPy, dipakai loop Python atas fungsi skalar di atas.
+# Mengembalikan (accepted, clipped): penanda segmen yang diterima dan koordinat hasilnya.
+
+# Menghitung outcode Cohen-Sutherland untuk array koordinat x dan y.
+def _outcodes(x, y, xmin, ymin, xmax, ymax):
+    np = affine.np
+    code = np.where(x < xmin, LEFT, np.where(x > xmax, RIGHT, INSIDE))
+    code |= np.where(y < ymin, BOTTOM, np.where(y > ymax, TOP, INSIDE))
+    return code
+
+# Versi vektor Cohen-Sutherland. Urutan operasi floating-point sama persis dengan
+# cohen_sutherland_clip, sehingga hasilnya identik bit per bit.
+def _cohen_sutherland_batch(segments, clip_window):
+    np = affine.np
+    xmin, ymin, xmax, ymax = clip_window
+    x1, y1, x2, y2 = (segments[:, i].copy() for i in range(4))
+    o1 = _outcodes(x1, y1, xmin, ymin, xmax, ymax)
+    o2 = _outcodes(x2, y2, xmin, ymin, xmax, ymax)
+    accepted = np.zeros(len(segments), dtype=bool)
+    pending = np.flatnonzero(np.ones(len(segments), dtype=bool))
+    while pending.size:
+        a, b = o1[pending], o2[pending]
+        # Trivial accept dan trivial reject.
+        accept = (a | b) == 0
+        reject = (a & b) != 0
+        accepted[pending[accept]] = True
+        keep = ~(accept | reject)
+        pending, a, b = pending[keep], a[keep], b[keep]
+        if not pending.size: break
+        # Pilih titik yang berada di luar (titik pertama jika ia di luar).
+        first = a != 0
+        out = np.where(first, a, b)
+        X1, Y1, X2, Y2 = x1[pending], y1[pending], x2[pending], y2[pending]
+        nx = np.empty(pending.size); ny = np.empty(pending.size)
+        # Prioritas sisi sama dengan versi skalar: atas, bawah, kanan, kiri.
+        top = (out & TOP) != 0
+        bottom = ~top & ((out & BOTTOM) != 0)
+        right = ~top & ~bottom & ((out & RIGHT) != 0)
+        left = ~top & ~bottom & ~right
+        for mask, edge, vertical in ((top, ymax, True), (bottom, ymin, True),
+                                     (right, xmax, False), (left, xmin, False)):
+            if not mask.any(): continue
+            x1m, y1m, x2m, y2m = X1[mask], Y1[mask], X2[mask], Y2[mask]
+            if vertical:
+                nx[mask] = x1m + (x2m - x1m) * (edge - y1m) / (y2m - y1m)
+                ny[mask] = edge
+            else:
+                ny[mask] = y1m + (y2m - y1m) * (edge - x1m) / (x2m - x1m)
+                nx[mask] = edge
+        # Ganti titik yang berada di luar dengan titik potong lalu hitung ulang outcode-nya.
+        idx = pending[first]
+        x1[idx], y1[idx] = nx[first], ny[first]
+        o1[idx] = _outcodes(x1[idx], y1[idx], xmin, ymin, xmax, ymax)
+        idx = pending[~first]
+        x2[idx], y2[idx] = nx[~first], ny[~first]
+        o2[idx] = _outcodes(x2[idx], y2[idx], xmin, ymin, xmax, ymax)
+    return accepted, np.column_stack((x1, y1, x2, y2))
+
+# Versi vektor Liang-Barsky.
+def _liang_barsky_batch(segments, clip_window):
+    np = affine.np
+    xmin, ymin, xmax, ymax = clip_window
+    x1, y1, x2, y2 = segments[:, 0], segments[:, 1], segments[:, 2], segments[:, 3]
+    dx, dy = x2 - x1, y2 - y1
+    u1 = np.zeros(len(segments)); u2 = np.ones(len(segments))
+    accepted = np.ones(len(segments), dtype=bool)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        for p, q in ((-dx, x1 - xmin), (dx, xmax - x1), (-dy, y1 - ymin), (dy, ymax - y1)):
+            accepted &= ~((p == 0) & (q < 0))
+            r = q / p
+            u1 = np.where(p < 0, np.maximum(u1, r), u1)
+            u2 = np.where(p > 0, np.minimum(u2, r), u2)
+    accepted &= u1 <= u2
+    # Segmen yang tidak terpotong sama sekali dikembalikan apa adanya.
+    cx1 = np.where(u1 == 0.0, x1, x1 + u1 * dx); cy1 = np.where(u1 == 0.0, y1, y1 + u1 * dy)
+    cx2 = np.where(u2 == 1.0, x2, x1 + u2 * dx); cy2 = np.where(u2 == 1.0, y2, y1 + u2 * dy)
+    return accepted, np.column_stack((cx1, cy1, cx2, cy2))
+
+_BATCH_KERNELS = {
+    'cohen-sutherland': _cohen_sutherland_batch,
+    'liang-barsky': _liang_barsky_batch,
+}
+
+# Fungsi untuk memotong banyak segmen sekaligus terhadap clip_window.
+# 'segments' berupa array (N, 4) atau list tuple (x1, y1, x2, y2).
+def clip_segments(segments, clip_window, algorithm=DEFAULT_LINE_ALGORITHM):
+    if algorithm not in LINE_ALGORITHMS:
+        raise ValueError(f"algoritma clipping tidak dikenal: {algorithm!r}")
+    if affine.HAVE_NUMPY:
+        segments = affine.np.asarray(segments, dtype=float).reshape(-1, 4)
+        if not len(segments):
+            return affine.np.zeros(0, dtype=bool), segments.copy()
+        return _BATCH_KERNELS[algorithm](segments, clip_window)
+    # Jalur Python murni: panggil algoritma skalar untuk setiap segmen.
+    clip = LINE_ALGORITHMS[algorithm]
+    accepted, clipped = [], []
+    for x1, y1, x2, y2 in segments:
+        result = clip((x1, y1), (x2, y2), clip_window)
+        accepted.append(result is not None)
+        clipped.append((result[0][0], result[0][1], result[1][0], result[1][1])
+                       if result else (x1, y1, x2, y2))
+    return accepted, clipped
+
+
+# --- Implementasi Algoritma Sutherland-Hodgman ---
+# Fungsi helper untuk memotong poligon pada satu sisi (edge) dari clip window.
+def clip_polygon_edge(subject_polygon, edge, is_vertical, value, is_less_than):
+    input_list = subject_polygon
+    output_list = []
+    if len(input_list) == 0: return output_list
+    p1 = input_list[-1]
+    for p2 in input_list:
+        p1_coord = p1[1] if is_vertical else p1[0]
+        p2_coord = p2[1] if is_vertical else p2[0]
+        p1_inside = p1_coord <= value if is_less_than else p1_coord >= value
+        p2_inside = p2_coord <= value if is_less_than else p2_coord >= value
+        # Terapkan 4 aturan Sutherland-Hodgman
+        if p1_inside and p2_inside: output_list.append(p2) # Aturan 1
+        elif p1_inside and not p2_inside: # Aturan 2
+            if p2_coord != p1_coord:
+                if is_vertical:
+                    ix = p1[0] + (p2[0] - p1[0]) * (value - p1_coord) / (p2_coord - p1_coord)
+                    output_list.append((ix, value))
+                else:
+                    iy = p1[1] + (p2[1] - p1[1]) * (value - p1_coord) / (p2_coord - p1_coord)
+                    output_list.append((value, iy))
+        elif not p1_inside and p2_inside: # Aturan 3
+            if p2_coord != p1_coord:
+                if is_vertical:
+                    ix = p1[0] + (p2[0] - p1[0]) * (value - p1_coord) / (p2_coord - p1_coord)
+                    output_list.append((ix, value))
+                else:
+                    iy = p1[1] + (p2[1] - p1[1]) * (value - p1_coord) / (p2_coord - p1_coord)
+                    output_list.append((value, iy))
+            output_list.append(p2)
+        # Aturan 4 (keduanya di luar) tidak melakukan apa-apa.
+        p1 = p2
+    return output_list
+
+# Fungsi clipping poligon Sutherland-Hodgman.
+# Cara kerja:
+# 1. Mengambil daftar titik poligon sebagai input.
+# 2. Memproses poligon secara sekuensial terhadap setiap sisi dari clip window (kiri, kanan, bawah, atas).
+# 3. Untuk setiap sisi, ia memanggil helper `clip_polygon_edge`.
+# 4. `clip_polygon_edge` menerapkan 4 aturan dasar:
+#    - Jika kedua titik segmen di dalam: simpan titik kedua.
+#    - Jika titik pertama di dalam dan kedua di luar: hitung & simpan titik potong.
+#    - Jika titik pertama di luar dan kedua di dalam: hitung & simpan titik potong, lalu simpan titik kedua.
+#    - Jika kedua titik di luar: tidak ada yang disimpan.
+# 5. Daftar titik hasil potongan dari satu sisi menjadi input untuk sisi berikutnya.
+# 6. Hasil akhirnya adalah daftar titik dari poligon yang telah terpotong oleh keempat sisi.
+def sutherland_hodgman_clip(subject_polygon, clip_window):
+    xmin, ymin, xmax, ymax = clip_window
+    output_list = subject_polygon
+    # Potong terhadap sisi kiri, lalu kanan, lalu bawah, lalu atas.
+    output_list = clip_polygon_edge(output_list, 'left', False, xmin, False)
+    output_list = clip_polygon_edge(output_list, 'right', False, xmax, True)
+    output_list = clip_polygon_edge(output_list, 'bottom', True, ymax, True)
+    output_list = clip_polygon_edge(output_list, 'top', True, ymin, False)
+    return output_list
+
+
+# --- Clipping Seluruh Adegan ---
+# Mengecek apakah bounding box berada seluruhnya di dalam clip_window.
+def bbox_inside(bbox, clip_window):
+    return (bbox is not None and bbox[0] >= clip_window[0] and bbox[1] >= clip_window[1]
+            and bbox[2] <= clip_window[2] and bbox[3] <= clip_window[3])
+
+# Fungsi untuk melakukan clipping pada satu objek. Mengembalikan list objek hasil
+# (bisa kosong jika objek sepenuhnya di luar window).
+def clip_shape(shape, clip_window, algorithm=DEFAULT_LINE_ALGORITHM):
+    if shape.type == 'line':
+        return _clip_lines([shape], clip_window, algorithm)[id(shape)]
+    if shape.type == 'point':
+        # Untuk titik, cek sederhana apakah ia di dalam persegi panjang.
+        return [shape] if is_point_in_rect(shape.points[0], clip_window) else []
+    if shape.type in ['rectangle', 'ellipse']:
+        # Poligon yang seluruhnya di dalam window tidak berubah (elips analitik tetap analitik).
+        if bbox_inside(shape.bbox, clip_window): return [shape]
+        # Untuk poligon, jalankan algoritma Sutherland-Hodgman (bekerja per titik,
+        # jadi gunakan list tuple, bukan array NumPy).
+        clipped_polygon = sutherland_hodgman_clip(affine.as_list(shape.points), clip_window)
+        if clipped_polygon:
+            shape.points = clipped_polygon
+            return [shape]
+    return []
+
+# Fungsi untuk menyusun semua segmen dari sekumpulan objek garis menjadi satu array
+# (N, 4). Mengembalikan (segments, offsets) dengan offsets[i] = indeks segmen pertama
+# milik objek ke-i (offsets[-1] = jumlah seluruh segmen).
+def pack_segments(shapes):
+    offsets = [0]
+    if affine.HAVE_NUMPY:
+        np = affine.np
+        parts = []
+        for shape in shapes:
+            pts = affine.as_array(shape.points)
+            parts.append(np.hstack((pts[:-1], pts[1:])))
+            offsets.append(offsets[-1] + len(pts) - 1)
+        segments = np.concatenate(parts) if parts else np.zeros((0, 4))
+        return segments, offsets
+    segments = []
+    for shape in shapes:
+        pts = shape.points
+        segments.extend((pts[i][0], pts[i][1], pts[i+1][0], pts[i+1][1])
+                        for i in range(len(pts) - 1))
+        offsets.append(len(segments))
+    return segments, offsets
+
+# Fungsi untuk menggabungkan segmen-segmen hasil clipping menjadi "run": potongan
+# polyline yang berurutan di dalam window. Dua segmen berurutan milik objek yang sama
+# tergabung jika keduanya diterima dan titik sambungnya tidak terpotong (artinya garis
+# tidak keluar dari window di titik itu). Mengembalikan list (indeks objek, titik run,
+# utuh) dengan 'utuh' = True jika run sama persis dengan objek aslinya.
+def coalesce_runs(segments, offsets, accepted, clipped):
+    if affine.HAVE_NUMPY:
+        return _coalesce_runs_numpy(segments, offsets, accepted, clipped)
+    runs = []
+    for i in range(len(offsets) - 1):
+        start, end = offsets[i], offsets[i + 1]
+        current, first_k = None, None
+        for k in range(start, end):
+            if not accepted[k]:
+                current = None
+                continue
+            x1, y1, x2, y2 = clipped[k]
+            # Lanjutkan run jika titik awal segmen ini sama dengan titik asli
+            # (tidak terpotong) dan run sebelumnya berakhir di titik asli yang sama.
+            if current is not None and (x1, y1) == tuple(segments[k][:2]) \
+                    and current[-1] == (segments[k - 1][2], segments[k - 1][3]):
+                current.append((x2, y2))
+            else:
+                current, first_k = [(x1, y1), (x2, y2)], k
+                runs.append([i, current, first_k])
+    # Tandai run yang identik dengan objek aslinya.
+    result = []
+    for i, points, first_k in runs:
+        start, end = offsets[i], offsets[i + 1]
+        intact = (first_k == start and len(points) == end - start + 1
+                  and points[0] == tuple(segments[start][:2])
+                  and points[-1] == tuple(segments[end - 1][2:]))
+        result.append((i, points, intact))
+    return result
+
+# Versi NumPy dari coalesce_runs: penanda sambungan dihitung untuk semua segmen dari
+# semua objek sekaligus, sehingga pekerjaan Python hanya sebanding dengan jumlah run.
+def _coalesce_runs_numpy(segments, offsets, accepted, clipped):
+    np = affine.np
+    count = len(segments)
+    if not count: return []
+    same_start = (clipped[:, 0] == segments[:, 0]) & (clipped[:, 1] == segments[:, 1])
+    same_end = (clipped[:, 2] == segments[:, 2]) & (clipped[:, 3] == segments[:, 3])
+    join = accepted[:-1] & accepted[1:] & same_end[:-1] & same_start[1:]
+    # Segmen terakhir sebuah objek tidak boleh tersambung ke segmen pertama objek berikutnya.
+    boundaries = np.asarray(offsets[1:-1], dtype=np.int64) - 1
+    join[boundaries[boundaries >= 0]] = False
+    no_join = np.zeros(1, dtype=bool)
+    starts = np.flatnonzero(accepted & ~np.concatenate((no_join, join)))
+    ends = np.flatnonzero(accepted & ~np.concatenate((join, no_join)))
+    owners = np.searchsorted(np.asarray(offsets), starts, side='right') - 1
+    result = []
+    for i, k0, k1 in zip(owners.tolist(), starts.tolist(), ends.tolist()):
+        points = np.vstack((clipped[k0, :2], clipped[k0:k1 + 1, 2:4]))
+        intact = (k0 == offsets[i] and k1 == offsets[i + 1] - 1
+                  and bool(same_start[k0]) and bool(same_end[k1]))
+        result.append((i, points, intact))
+    return result
+
+# Fungsi untuk memotong sekumpulan objek garis sekaligus. Semua segmen dari semua
+# objek dipotong dalam satu panggilan clip_segments, lalu segmen yang bersambung di
+# dalam window digabung kembali menjadi satu polyline per run. Jumlah objek hasil
+# sebanding dengan jumlah run yang terlihat, bukan dengan jumlah segmen.
+# Mengembalikan dict id(objek) -> list objek hasil.
+def _clip_lines(shapes, clip_window, algorithm=DEFAULT_LINE_ALGORITHM):
+    segments, offsets = pack_segments(shapes)
+    accepted, clipped = clip_segments(segments, clip_window, algorithm)
+    return runs_to_shapes(shapes, coalesce_runs(segments, offsets, accepted, clipped))
+
+# Fungsi untuk mengubah run hasil coalesce_runs (indeks objek, titik, utuh) menjadi
+# objek hasil clipping. Mengembalikan dict id(objek) -> list objek hasil.
+def runs_to_shapes(shapes, runs):
+    results = {id(shape): [] for shape in shapes}
+    for i, points, intact in runs:
+        shape = shapes[i]
+        result = results[id(shape)]
+        if intact:
+            # Seluruh garis berada di dalam window: objek dibiarkan apa adanya.
+            result.append(shape)
+        elif not result:
+            # Run pertama memakai objek asli agar identitas (dan item kanvasnya) tetap.
+            shape.points = points
+            result.append(shape)
+        else:
+            # Run berikutnya menjadi objek baru dengan properti (warna, tebal) yang sama.
+            result.append(shape.copy(points))
+    return results
+
+# Fungsi utama untuk melakukan operasi clipping pada seluruh adegan.
+# Cara kerja:
+# 1. Meminta Scene daftar objek yang bounding box-nya bersinggungan dengan jendela
+#    clipping (lewat indeks spasial jika terpasang), sehingga objek di luar window
+#    tidak perlu diperiksa satu per satu.
+# 2. Semua segmen dari semua objek garis kandidat dipotong sekaligus oleh kernel
+#    batch (Cohen-Sutherland atau Liang-Barsky sesuai 'algorithm').
+# 3. Poligon dipotong dengan Sutherland-Hodgman, titik dengan uji di-dalam-persegi.
+# 4. Hasil clipping (yang bisa jadi objek yang lebih kecil atau tidak ada sama sekali)
+#    menggantikan objek aslinya di posisi yang sama dalam urutan gambar.
+# 5. Objek yang tidak bersinggungan tetap di tempatnya tanpa diubah.
+def perform_clipping(scene, clip_window, algorithm=DEFAULT_LINE_ALGORITHM):
+    candidates = scene.query(clip_window)
+    if not candidates: return scene
+    return replace_clipped(scene, clip_candidates(candidates, clip_window, algorithm))
+
+# Fungsi untuk memotong sekumpulan objek kandidat. Mengembalikan hasil clipping setiap
+# kandidat sebagai dict id(objek) -> list objek hasil.
+def clip_candidates(candidates, clip_window, algorithm=DEFAULT_LINE_ALGORITHM):
+    lines = [shape for shape in candidates if shape.type == 'line']
+    replacements = _clip_lines(lines, clip_window, algorithm) if lines else {}
+    for shape in candidates:
+        if shape.type != 'line':
+            replacements[id(shape)] = clip_shape(shape, clip_window, algorithm)
+    return replacements
+
+# Fungsi untuk mengganti objek-objek kandidat dengan hasil clipping-nya ('replacements':
+# dict id(objek) -> list objek hasil) di posisi yang sama dalam urutan gambar.
+def replace_clipped(scene, replacements):
+    new_shapes = []
+    for shape in scene:
+        result = replacements.get(id(shape))
+        if result is None: new_shapes.append(shape)
+        else: new_shapes.extend(result)
+    scene.replace_all(new_shapes)
+    return scene
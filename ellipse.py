@@ -0,0 +1,83 @@
+# --- Geometri Elips Analitik ---
+# Elips disimpan secara analitik sebagai (cx, cy, rx, ry, theta): pusat, dua jari-jari,
+# dan sudut rotasi sumbu pertama (radian). Poligon untuk render dan clipping baru dibuat
+# saat dibutuhkan, dengan jumlah sisi yang dipilih dari ukuran elips di layar dan
+# toleransi galat, sehingga elips kecil tidak membawa titik berlebih dan elips besar
+# (atau yang diperbesar) tidak tampak bersudut.
+# Tidak bergantung pada tkinter; memakai NumPy jika tersedia.
+import math
+from functools import lru_cache
+
+import affine
+
+# Galat maksimum (piksel) antara poligon dan elips sebenarnya.
+DEFAULT_TOLERANCE = 0.25
+# Batas bawah dan atas jumlah sisi poligon.
+MIN_SEGMENTS = 8
+MAX_SEGMENTS = 2048
+
+
+# Membuat parameter elips dari dua titik sudut bounding box-nya (elips tanpa rotasi).
+def from_bbox(x1, y1, x2, y2):
+    return ((x1 + x2) / 2, (y1 + y2) / 2, abs(x2 - x1) / 2, abs(y2 - y1) / 2, 0.0)
+
+# Menerapkan matriks affine pada elips. Bayangan elips oleh transformasi affine selalu
+# berupa elips; jari-jari dan rotasinya didapat dari dekomposisi SVD bentuk tertutup
+# atas bagian linear matriks dikali R(theta) * diag(rx, ry).
+def transform(m, params):
+    cx, cy, rx, ry, theta = params
+    if m == affine.IDENTITY: return params
+    cos_t, sin_t = math.cos(theta), math.sin(theta)
+    a, b, _, d, e, _ = m
+    # Bagian linear L = A * R(theta) * diag(rx, ry).
+    p, q = (a * cos_t + b * sin_t) * rx, (b * cos_t - a * sin_t) * ry
+    r, s = (d * cos_t + e * sin_t) * rx, (e * cos_t - d * sin_t) * ry
+    # SVD 2x2: L = R(phi) * diag(sx, sy) * R(psi). Lingkaran satuan tidak berubah oleh
+    # R(psi), jadi elips hasil cukup ditentukan oleh phi, |sx|, dan |sy|.
+    e_, f_ = (p + s) / 2, (p - s) / 2
+    g_, h_ = (r + q) / 2, (r - q) / 2
+    qq, rr = math.hypot(e_, h_), math.hypot(f_, g_)
+    phi = (math.atan2(g_, f_) + math.atan2(h_, e_)) / 2
+    new_cx, new_cy = affine.apply_point(m, (cx, cy))
+    return (new_cx, new_cy, qq + rr, abs(qq - rr), phi)
+
+# Bounding box (xmin, ymin, xmax, ymax) elips yang tepat.
+def bbox(params):
+    cx, cy, rx, ry, theta = params
+    cos_t, sin_t = math.cos(theta), math.sin(theta)
+    half_w = math.hypot(rx * cos_t, ry * sin_t)
+    half_h = math.hypot(rx * sin_t, ry * cos_t)
+    return (cx - half_w, cy - half_h, cx + half_w, cy + half_h)
+
+# Jumlah sisi poligon agar jarak tali busur ke elips tidak melebihi 'tolerance'.
+# Untuk jari-jari r dan n sisi, galat terbesar adalah r * (1 - cos(pi / n)). Hasilnya
+# dibulatkan ke kelipatan 4 agar poligon tetap simetris dan tabel sudut bisa dipakai ulang.
+def segment_count(params, tolerance=DEFAULT_TOLERANCE):
+    radius = max(params[2], params[3])
+    if radius <= tolerance: return MIN_SEGMENTS
+    count = math.ceil(math.pi / math.acos(1.0 - tolerance / radius))
+    count = -(-count // 4) * 4
+    return max(MIN_SEGMENTS, min(MAX_SEGMENTS, count))
+
+# Tabel (cos, sin) untuk n sisi (n + 1 titik, titik terakhir = titik pertama), di-cache
+# karena jumlah sisi yang berbeda hanya sedikit.
+@lru_cache(maxsize=64)
+def _unit_circle(count):
+    step = 2 * math.pi / count
+    table = [(math.cos(i * step), math.sin(i * step)) for i in range(count)]
+    table.append(table[0])
+    if affine.HAVE_NUMPY: return affine.np.array(table)
+    return table
+
+# Membuat poligon tertutup dari elips. Hasilnya array (N, 2) jika NumPy aktif, atau list tuple.
+def tessellate(params, tolerance=DEFAULT_TOLERANCE):
+    cx, cy, rx, ry, theta = params
+    cos_t, sin_t = math.cos(theta), math.sin(theta)
+    # Matriks yang memetakan lingkaran satuan ke elips.
+    m = (rx * cos_t, -ry * sin_t, cx, rx * sin_t, ry * cos_t, cy)
+    table = _unit_circle(segment_count(params, tolerance))
+    if affine.HAVE_NUMPY and not affine.is_array(table):
+        table = affine.as_array(table)
+    elif not affine.HAVE_NUMPY and affine.is_array(table):
+        table = affine.as_list(table)
+    return affine.apply(m, table)
@@ -0,0 +1,238 @@
+# --- Riwayat Undo/Redo ---
+# Riwayat berupa log perintah (command log). Setiap entri hanya menyimpan objek yang
+# disentuh sebuah operasi, bukan salinan seluruh adegan:
+#   AddCommand       - objek yang baru ditambahkan.
+#   TransformCommand - matriks delta hasil drag translasi/rotasi/skala.
+#   GroupTransformCommand - matriks delta yang sama untuk sekelompok objek terpilih.
+#   EditCommand      - geometri sebelum/sesudah objek yang diubah, serta objek yang
+#                      dikeluarkan/dimasukkan beserta posisinya (clipping, hapus kanvas).
+# Snapshot geometri berbagi data titik dengan objeknya (structural sharing) karena data
+# titik tidak pernah diubah di tempat. Undo dan redo hanya menyentuh objek dalam entri,
+# sehingga biayanya sebanding dengan besar perubahan, bukan besar adegan.
+# Perkiraan memori setiap entri dijumlahkan; entri tertua dibuang jika melebihi anggaran.
+# Tidak bergantung pada tkinter.
+from collections import deque
+
+import affine
+import store
+import transforms
+
+# Anggaran memori riwayat default (byte).
+DEFAULT_BUDGET = 64 * 1024 * 1024
+# Perkiraan biaya memori satu objek Shape dan satu titik dalam list tuple.
+SHAPE_BYTES = 200
+LIST_POINT_BYTES = 112
+
+
+# Perkiraan memori kumpulan titik.
+def points_nbytes(points):
+    return store.points_nbytes(points, LIST_POINT_BYTES)
+
+# Perkiraan memori snapshot geometri dari Shape.geometry_state().
+def state_nbytes(state):
+    return points_nbytes(state[0]) + 64
+
+# Perkiraan memori sebuah objek beserta titik-titiknya.
+def shape_nbytes(shape):
+    return SHAPE_BYTES + state_nbytes(shape.geometry_state())
+
+
+# --- Perintah ---
+# Setiap perintah punya 'label', 'nbytes', serta undo(scene) dan redo(scene).
+
+# Penambahan satu objek di lapisan paling atas.
+class AddCommand:
+    label = 'Tambah'
+
+    def __init__(self, shape):
+        self.shape = shape
+        self.nbytes = shape_nbytes(shape)
+
+    def undo(self, scene):
+        scene.remove(self.shape)
+
+    def redo(self, scene):
+        scene.add(self.shape)
+
+
+# Transformasi satu objek sebesar matriks 'delta' (sudut rotasi bertambah 'angle').
+# Undo menerapkan invers matriks, jadi tidak ada titik yang perlu disimpan.
+class TransformCommand:
+    label = 'Transformasi'
+    nbytes = 128
+
+    def __init__(self, shape, delta, angle=0.0):
+        self.shape = shape
+        self.delta = delta
+        self.angle = angle
+
+    def _apply(self, matrix, angle):
+        self.shape.apply_transform(matrix)
+        self.shape.bake()
+        self.shape.rotation_angle += angle
+
+    def undo(self, scene):
+        self._apply(affine.invert(self.delta), -self.angle)
+
+    def redo(self, scene):
+        self._apply(self.delta, self.angle)
+
+
+# Transformasi sekelompok objek sebesar matriks 'delta' yang sama. Undo dan redo
+# menerapkan matriksnya ke seluruh grup dalam satu perkalian (transforms.transform_shapes).
+class GroupTransformCommand:
+    label = 'Transformasi grup'
+
+    def __init__(self, shapes, delta, angle=0.0):
+        self.shapes = list(shapes)
+        self.delta = delta
+        self.angle = angle
+        self.nbytes = 128 + 8 * len(self.shapes)
+
+    def _apply(self, matrix, angle):
+        transforms.transform_shapes(self.shapes, matrix)
+        for shape in self.shapes: shape.rotation_angle += angle
+
+    def undo(self, scene):
+        self._apply(affine.invert(self.delta), -self.angle)
+
+    def redo(self, scene):
+        self._apply(self.delta, self.angle)
+
+
+# Perubahan umum pada sebagian objek adegan. Dibuat lewat History.begin_edit() sebelum
+# operasi dan History.commit_edit() sesudahnya.
+class EditCommand:
+    def __init__(self, label, removed, added, changed):
+        self.label = label
+        # [(indeks lama, objek)] yang dikeluarkan, urut menaik.
+        self.removed = removed
+        # [(indeks baru, objek)] yang dimasukkan, urut menaik.
+        self.added = added
+        # [(objek, geometri sebelum, geometri sesudah)] untuk objek yang geometrinya berubah.
+        self.changed = changed
+        self.nbytes = (sum(shape_nbytes(shape) for _, shape in removed)
+                       + sum(shape_nbytes(shape) for _, shape in added)
+                       + sum(state_nbytes(before) + state_nbytes(after)
+                             for _, before, after in changed))
+
+    # Membalik satu arah perubahan: keluarkan 'take_out', pulihkan geometri, lalu
+    # sisipkan 'put_back' pada posisinya (urut menaik agar indeksnya tepat).
+    @staticmethod
+    def _switch(scene, take_out, put_back, states):
+        for _, shape in reversed(take_out): scene.remove(shape)
+        for shape, state in states: shape.restore_geometry(state)
+        for index, shape in put_back: scene.insert(index, shape)
+
+    def undo(self, scene):
+        self._switch(scene, self.added, self.removed,
+                     [(shape, before) for shape, before, _ in self.changed])
+
+    def redo(self, scene):
+        self._switch(scene, self.removed, self.added,
+                     [(shape, after) for shape, _, after in self.changed])
+
+
+# Catatan sementara sebuah edit yang sedang berlangsung (lihat History.begin_edit).
+class _PendingEdit:
+    def __init__(self, scene, label, shapes):
+        self.label = label
+        shapes = set(shapes)
+        # Posisi dan geometri objek yang mungkin disentuh, sebelum operasi.
+        self.before = {shape: (i, shape.geometry_state())
+                       for i, shape in enumerate(scene) if shape in shapes}
+        # Objek yang masuk/keluar selama operasi, dikumpulkan dari event Scene.
+        self.added = []
+        self.removed = set()
+
+    def on_event(self, event, shape):
+        if event == 'added': self.added.append(shape)
+        elif event == 'removed': self.removed.add(shape)
+
+
+# --- Kelas History ---
+class History:
+    def __init__(self, scene, budget=DEFAULT_BUDGET):
+        self.scene = scene
+        # Anggaran memori (byte) untuk semua entri undo dan redo.
+        self.budget = budget
+        self._undo = deque()
+        self._redo = []
+        # Perkiraan memori yang dipakai saat ini.
+        self.memory = 0
+
+    def can_undo(self):
+        return bool(self._undo)
+
+    def can_redo(self):
+        return bool(self._redo)
+
+    # Menambahkan perintah yang baru saja dijalankan. Riwayat redo dibuang, lalu entri
+    # tertua dibuang selama memori melebihi anggaran (entri terbaru selalu disimpan).
+    def push(self, command):
+        for old in self._redo: self.memory -= old.nbytes
+        self._redo = []
+        self._undo.append(command)
+        self.memory += command.nbytes
+        while self.memory > self.budget and len(self._undo) > 1:
+            self.memory -= self._undo.popleft().nbytes
+
+    # Mencatat objek yang baru ditambahkan ke adegan.
+    def record_add(self, shape):
+        self.push(AddCommand(shape))
+
+    # Mencatat transformasi objek sebesar matriks 'delta'.
+    def record_transform(self, shape, delta, angle=0.0):
+        if delta != affine.IDENTITY: self.push(TransformCommand(shape, delta, angle))
+
+    # Mencatat transformasi sekelompok objek sebesar matriks 'delta' yang sama.
+    def record_group_transform(self, shapes, delta, angle=0.0):
+        if delta != affine.IDENTITY: self.push(GroupTransformCommand(shapes, delta, angle))
+
+    # Memulai pencatatan edit yang mungkin mengubah atau mengeluarkan objek 'shapes'.
+    # Objek yang dikeluarkan selama edit harus termasuk dalam 'shapes'.
+    def begin_edit(self, label, shapes):
+        pending = _PendingEdit(self.scene, label, shapes)
+        self.scene.subscribe(pending.on_event)
+        return pending
+
+    # Menyelesaikan pencatatan edit dan menyimpannya sebagai satu entri riwayat.
+    def commit_edit(self, pending):
+        self.scene.unsubscribe(pending.on_event)
+        removed = sorted(((index, shape) for shape, (index, _) in pending.before.items()
+                          if shape in pending.removed), key=lambda item: item[0])
+        changed = []
+        for shape, (_, state) in pending.before.items():
+            after = shape.geometry_state()
+            if after[0] is not state[0] or after[1:] != state[1:]:
+                changed.append((shape, state, after))
+        added = []
+        if pending.added:
+            new_shapes = set(pending.added)
+            added = [(i, shape) for i, shape in enumerate(self.scene) if shape in new_shapes]
+        if removed or added or changed:
+            self.push(EditCommand(pending.label, removed, added, changed))
+
+    # Membatalkan perintah terakhir. Mengembalikan perintah tersebut (atau None).
+    def undo(self):
+        if not self._undo: return None
+        command = self._undo.pop()
+        command.undo(self.scene)
+        self._redo.append(command)
+        return command
+
+    # Menjalankan ulang perintah yang terakhir dibatalkan. Mengembalikan perintah tersebut.
+    def redo(self):
+        if not self._redo: return None
+        command = self._redo.pop()
+        command.redo(self.scene)
+        self._undo.append(command)
+        return command
+
+    # Mengosongkan seluruh riwayat.
+    def clear(self):
+        self._undo, self._redo = deque(), []
+        self.memory = 0
+
+    def __len__(self):
+        return len(self._undo)
@@ -0,0 +1,137 @@
+# --- Hit-Testing Geometris ---
+# Menentukan objek yang benar-benar berada di bawah kursor, bukan sekadar item kanvas
+# yang bounding box-nya terdekat:
+#   - titik    : jarak ke pusat <= radius (radius titik = ketebalannya),
+#   - garis    : jarak titik ke segmen polyline <= setengah ketebalan,
+#   - poligon  : titik di dalam poligon (jika diisi, aturan even-odd) atau jarak ke tepi
+#                <= setengah ketebalan (outline).
+# Setiap pengujian ditambah toleransi klik. Kandidat diambil dari indeks spasial adegan
+# lalu disaring dengan bounding box sebelum pengujian presisi, dan diperiksa dari
+# lapisan paling atas. Tidak bergantung pada tkinter.
+import affine
+
+
+# --- Fungsi Geometri ---
+# Jarak kuadrat terkecil dari titik (px, py) ke polyline 'points'. Jika 'closed', segmen
+# dari titik terakhir ke titik pertama ikut dihitung.
+def polyline_distance_sq(points, px, py, closed=False):
+    if affine.HAVE_NUMPY:
+        np = affine.np
+        pts = affine.as_array(points)
+        if closed and len(pts) > 2: pts = np.vstack((pts, pts[:1]))
+        if len(pts) == 1: return float(((pts[0] - (px, py)) ** 2).sum())
+        a, ab = pts[:-1], pts[1:] - pts[:-1]
+        ap = np.array((px, py)) - a
+        length_sq = (ab * ab).sum(axis=1)
+        # Parameter proyeksi pada setiap segmen, dibatasi ke [0, 1] (segmen nol -> 0).
+        t = np.divide((ap * ab).sum(axis=1), length_sq, out=np.zeros_like(length_sq),
+                      where=length_sq > 0)
+        t = np.clip(t, 0.0, 1.0)
+        d = ap - ab * t[:, None]
+        return float((d * d).sum(axis=1).min())
+    pts = list(points)
+    if closed and len(pts) > 2: pts.append(pts[0])
+    if len(pts) == 1:
+        return (pts[0][0] - px) ** 2 + (pts[0][1] - py) ** 2
+    best = float('inf')
+    for (ax, ay), (bx, by) in zip(pts, pts[1:]):
+        abx, aby = bx - ax, by - ay
+        length_sq = abx * abx + aby * aby
+        t = ((px - ax) * abx + (py - ay) * aby) / length_sq if length_sq > 0 else 0.0
+        t = min(1.0, max(0.0, t))
+        dx, dy = px - (ax + t * abx), py - (ay + t * aby)
+        best = min(best, dx * dx + dy * dy)
+    return best
+
+# Mengecek apakah titik (px, py) berada di dalam poligon (aturan even-odd, sama seperti
+# isi poligon di kanvas).
+def point_in_polygon(points, px, py):
+    if affine.HAVE_NUMPY:
+        np = affine.np
+        pts = affine.as_array(points)
+        if len(pts) < 3: return False
+        x1, y1 = pts[:, 0], pts[:, 1]
+        x2, y2 = np.roll(x1, -1), np.roll(y1, -1)
+        crosses = (y1 > py) != (y2 > py)
+        # Koordinat x perpotongan sinar horizontal dengan setiap sisi yang dilintasi.
+        with np.errstate(divide='ignore', invalid='ignore'):
+            x_cross = x1 + (py - y1) * (x2 - x1) / (y2 - y1)
+        return bool(np.count_nonzero(crosses & (px < x_cross)) % 2)
+    pts = list(points)
+    if len(pts) < 3: return False
+    inside = False
+    for (x1, y1), (x2, y2) in zip(pts, pts[1:] + pts[:1]):
+        if (y1 > py) != (y2 > py) and px < x1 + (py - y1) * (x2 - x1) / (y2 - y1):
+            inside = not inside
+    return inside
+
+# Jarak tambahan di luar geometri yang masih termasuk objek (ketebalan garis).
+def stroke_margin(shape):
+    # Titik digambar sebagai lingkaran dengan radius = ketebalan; garis dan outline
+    # melebar setengah ketebalan ke setiap sisi.
+    return shape.width if shape.type == 'point' else shape.width / 2
+
+# Mengecek apakah titik (px, py) mengenai objek dengan toleransi 'tolerance' piksel.
+def hit_shape(shape, px, py, tolerance=0.0):
+    bbox = shape.bbox
+    if bbox is None: return False
+    reach = stroke_margin(shape) + tolerance
+    # Saringan cepat dengan bounding box yang diperlebar.
+    if px < bbox[0] - reach or px > bbox[2] + reach or py < bbox[1] - reach or py > bbox[3] + reach:
+        return False
+    points = shape.points
+    if shape.type in ('rectangle', 'ellipse'):
+        if shape.fill and point_in_polygon(points, px, py): return True
+        return polyline_distance_sq(points, px, py, closed=True) <= reach * reach
+    if shape.type == 'point':
+        return polyline_distance_sq(points[:1], px, py) <= reach * reach
+    return polyline_distance_sq(points, px, py) <= reach * reach
+
+
+# --- Kelas HitTester ---
+# Mencari objek teratas di bawah kursor. Mendengarkan event Scene untuk menjaga urutan
+# gambar dan margin ketebalan terbesar secara inkremental.
+class HitTester:
+    def __init__(self, scene):
+        self.scene = scene
+        # Urutan gambar objek (id objek -> nomor urut), dihitung ulang hanya saat urutan berubah.
+        self._order = None
+        self._next_order = 0
+        # Margin ketebalan terbesar yang pernah dilihat, untuk memperlebar query indeks.
+        self._max_margin = 0.0
+        for shape in scene: self._max_margin = max(self._max_margin, stroke_margin(shape))
+        scene.subscribe(self._on_scene_event)
+
+    # Pendengar perubahan Scene.
+    def _on_scene_event(self, event, shape):
+        if event == 'added':
+            # Tanpa event 'reordered', objek baru selalu berada di atas objek lama.
+            if self._order is not None:
+                self._order[id(shape)] = self._next_order
+                self._next_order += 1
+            self._max_margin = max(self._max_margin, stroke_margin(shape))
+        elif event == 'removed':
+            if self._order is not None: self._order.pop(id(shape), None)
+        elif event in ('geometry', 'style'):
+            self._max_margin = max(self._max_margin, stroke_margin(shape))
+        elif event == 'reordered':
+            self._order = None
+
+    def _shape_order(self):
+        if self._order is None:
+            self._order = {id(shape): i for i, shape in enumerate(self.scene)}
+            self._next_order = len(self._order)
+        return self._order
+
+    # Menghasilkan objek-objek yang mengenai titik (x, y), dari lapisan paling atas.
+    def iter_hits(self, x, y, tolerance=0.0):
+        reach = self._max_margin + tolerance
+        candidates = self.scene.query((x - reach, y - reach, x + reach, y + reach))
+        if not candidates: return
+        order = self._shape_order()
+        for shape in sorted(candidates, key=lambda shape: order[id(shape)], reverse=True):
+            if hit_shape(shape, x, y, tolerance): yield shape
+
+    # Mengembalikan objek teratas yang mengenai titik (x, y), atau None.
+    def hit(self, x, y, tolerance=0.0):
+        return next(self.iter_hits(x, y, tolerance), None)
@@ -0,0 +1,73 @@
+# --- Level of Detail (LOD) ---
+# Saat adegan besar dilihat dari jauh (zoom kecil), sebagian besar titik goresan dan
+# poligon elips jatuh ke piksel yang sama. Setiap objek menyimpan piramida versi titik
+# sumber yang disederhanakan (Shape.lod_points) pada beberapa toleransi tetap, dan
+# renderer memilih level dari skala tampilan:
+#   - level yang dipilih adalah yang paling kasar dengan galat di layar paling banyak
+#     MAX_SCREEN_ERROR piksel; jika tidak ada (zoom besar), titik penuh yang dipakai,
+#   - objek yang di layar lebih kecil dari DOT_SIZE piksel digambar sebagai titik saja,
+#   - elips analitik yang diperbesar ditessellasi ulang dengan toleransi yang mengikuti
+#     skala (ellipse_points), agar sisi poligonnya tidak terlihat pada zoom besar.
+# Cache level dibuang otomatis saat titik sumber berubah (bake setelah transformasi,
+# clipping, undo/redo). Tidak bergantung pada tkinter.
+import math
+
+import affine
+
+# Toleransi level piramida (dalam satuan dunia, sama dengan piksel pada zoom 100%).
+LEVEL_TOLERANCES = (0.5, 2.0, 8.0)
+# Galat maksimum di layar (piksel) yang masih diterima saat memilih level.
+MAX_SCREEN_ERROR = 0.5
+# Objek yang bounding box-nya di layar lebih kecil dari ukuran ini digambar sebagai titik.
+DOT_SIZE = 1.0
+
+
+# Toleransi level paling kasar yang galatnya di layar tidak melebihi MAX_SCREEN_ERROR
+# pada skala 'scale', atau None jika titik penuh harus dipakai.
+def select_tolerance(scale):
+    chosen = None
+    for tolerance in LEVEL_TOLERANCES:
+        if tolerance * scale <= MAX_SCREEN_ERROR: chosen = tolerance
+    return chosen
+
+# Titik-titik objek (koordinat dunia) yang cukup untuk digambar pada skala tampilan
+# 'scale'. Skala dari matriks objek yang belum di-bake ikut diperhitungkan.
+def render_points(shape, scale):
+    if shape.type == 'point': return shape.points
+    matrix = shape.matrix
+    scale = scale * affine.matrix_scale(matrix)
+    tolerance = select_tolerance(scale)
+    if tolerance is None:
+        points = ellipse_points(shape, scale)
+        return shape.points if points is None else points
+    points = shape.lod_points(tolerance)
+    # Poligon yang tersisa kurang dari tiga titik tidak bisa digambar; pakai titik penuh.
+    if shape.type != 'line' and len(points) < 3: return shape.points
+    return points if matrix == affine.IDENTITY else affine.apply(matrix, points)
+
+# Toleransi tessellasi elips (satuan titik sumber) dengan galat di layar paling banyak
+# MAX_SCREEN_ERROR piksel pada skala total 'scale'. Dibulatkan ke bawah ke pangkat dua
+# agar zoom bertahap tidak mengisi cache Shape.lod_points dengan banyak toleransi.
+def ellipse_tolerance(scale):
+    return 2.0 ** math.floor(math.log2(MAX_SCREEN_ERROR / scale))
+
+# Poligon elips analitik (koordinat dunia) yang cukup halus untuk skala total 'scale'
+# (skala tampilan dikali skala matriks objek), atau None jika objek bukan elips analitik.
+def ellipse_points(shape, scale):
+    if shape.ellipse is None or scale <= 0: return None
+    points = shape.lod_points(ellipse_tolerance(scale))
+    matrix = shape.matrix
+    return points if matrix == affine.IDENTITY else affine.apply(matrix, points)
+
+# Mengecek apakah bounding box dunia 'bbox' di layar lebih kecil dari DOT_SIZE piksel.
+def is_tiny(bbox, scale):
+    return bbox is not None and max(bbox[2] - bbox[0], bbox[3] - bbox[1]) * scale < DOT_SIZE
+
+# Koordinat layar datar untuk menggambar objek kecil sebagai titik dari bounding box
+# layarnya: dua titik untuk garis, empat sudut untuk poligon.
+def dot_coords(screen_bbox, is_line):
+    x0, y0, x1, y1 = screen_bbox
+    # Segmen sepanjang nol tidak digambar oleh Tk; beri panjang minimum setengah piksel.
+    x1 = max(x1, x0 + 0.5)
+    if is_line: return [x0, y0, x1, y1]
+    return [x0, y0, x1, y0, x1, y1, x0, y1]
@@ -0,0 +1,181 @@
+# --- Clipping Paralel Multi-Proses ---
+# Untuk adegan yang sangat besar, objek kandidat clipping dibagi menjadi potongan
+# (chunk) yang dipotong bersamaan oleh beberapa proses pekerja (ProcessPoolExecutor).
+#   - Koordinat semua garis dan poligon yang perlu dipotong disalin sekali ke satu blok
+#     shared memory (array float64 (N, 2)); setiap tugas hanya membawa nama blok dan
+#     array indeks titik awal objek-objeknya, bukan objek Shape yang di-pickle.
+#   - Pekerja mengembalikan hasil dalam bentuk array ringkas: pemilik run, offset titik,
+#     titik hasil, dan penanda 'utuh'.
+#   - Hasil disusun kembali di proses utama dengan aturan yang sama seperti clipping
+#     biasa, dan objek hasil menggantikan objek aslinya di posisi yang sama, sehingga
+#     urutan gambar tetap.
+# Adegan kecil (jumlah titik kandidat di bawah 'threshold'), mesin dengan satu CPU, atau
+# lingkungan tanpa NumPy otomatis memakai clipping.perform_clipping di proses yang sama.
+# Tidak bergantung pada tkinter.
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+import affine
+import clipping
+
+# Jumlah titik kandidat minimum agar clipping dijalankan paralel.
+DEFAULT_THRESHOLD = 200000
+# Jumlah potongan per pekerja (lebih dari satu agar beban tetap seimbang).
+CHUNKS_PER_WORKER = 4
+
+# Pool pekerja dibuat sekali lalu dipakai ulang oleh clipping berikutnya.
+_executor = None
+_executor_workers = 0
+
+
+# Jumlah pekerja default: jumlah CPU.
+def default_workers():
+    return os.cpu_count() or 1
+
+# Mengembalikan pool pekerja dengan jumlah 'workers' (dibuat jika belum ada). Proses
+# pekerja dibuat dengan metode 'spawn' agar tidak mewarisi keadaan Tk dari proses utama.
+def get_executor(workers):
+    global _executor, _executor_workers
+    if _executor is None or _executor_workers != workers:
+        shutdown()
+        _executor = ProcessPoolExecutor(workers, mp_context=multiprocessing.get_context('spawn'))
+        _executor_workers = workers
+    return _executor
+
+# Menghentikan pool pekerja (jika ada).
+def shutdown():
+    global _executor, _executor_workers
+    if _executor is not None: _executor.shutdown()
+    _executor, _executor_workers = None, 0
+
+
+# --- Bagian yang Dijalankan di Proses Pekerja ---
+# Memotong semua garis dalam satu potongan. 'points' adalah titik-titik objek yang
+# bersambung dan 'starts' indeks titik awal setiap objek (starts[-1] = jumlah titik).
+def _clip_line_chunk(points, starts, clip_window, algorithm):
+    np = affine.np
+    count = len(starts) - 1
+    # Segmen antar-titik berurutan, lalu buang segmen yang menyambung dua objek berbeda.
+    segments = np.hstack((points[:-1], points[1:]))
+    segments = np.delete(segments, starts[1:-1] - 1, axis=0)
+    # Objek ke-i punya (jumlah titik - 1) segmen, jadi offset segmennya = starts[i] - i.
+    offsets = (starts - np.arange(count + 1)).tolist()
+    accepted, clipped = clipping.clip_segments(segments, clip_window, algorithm)
+    return clipping.coalesce_runs(segments, offsets, accepted, clipped)
+
+# Memotong semua poligon dalam satu potongan dengan Sutherland-Hodgman.
+def _clip_polygon_chunk(points, starts, clip_window):
+    runs = []
+    for i in range(len(starts) - 1):
+        polygon = [tuple(p) for p in points[starts[i]:starts[i + 1]].tolist()]
+        clipped = clipping.sutherland_hodgman_clip(polygon, clip_window)
+        if clipped: runs.append((i, clipped, False))
+    return runs
+
+# Mengemas run menjadi array ringkas: (pemilik, offset titik, titik, utuh).
+def _pack_runs(runs):
+    np = affine.np
+    owners = np.array([run[0] for run in runs], dtype=np.int64)
+    intact = np.array([run[2] for run in runs], dtype=bool)
+    offsets = np.zeros(len(runs) + 1, dtype=np.int64)
+    offsets[1:] = np.cumsum([len(run[1]) for run in runs])
+    points = (np.concatenate([np.asarray(run[1], dtype=float).reshape(-1, 2) for run in runs])
+              if runs else np.zeros((0, 2)))
+    return owners, offsets, points, intact
+
+# Satu tugas pekerja: membaca titik-titik potongannya dari shared memory lalu memotongnya.
+def _clip_task(name, total, kind, starts, clip_window, algorithm):
+    np = affine.np
+    first, last = int(starts[0]), int(starts[-1])
+    block = shared_memory.SharedMemory(name=name)
+    try:
+        coords = np.ndarray((total, 2), dtype=float, buffer=block.buf)
+        points = coords[first:last].copy()
+        # View ke blok harus dilepas sebelum blok ditutup.
+        del coords
+    finally:
+        block.close()
+    starts = starts - first
+    if kind == 'line': runs = _clip_line_chunk(points, starts, clip_window, algorithm)
+    else: runs = _clip_polygon_chunk(points, starts, clip_window)
+    return _pack_runs(runs)
+
+
+# --- Bagian di Proses Utama ---
+# Membagi objek [0, count) menjadi potongan-potongan dengan jumlah titik yang kira-kira
+# sama. Mengembalikan list (awal, akhir) indeks objek.
+def _split(starts, count, pieces):
+    np = affine.np
+    if not count: return []
+    base = starts[0]
+    targets = np.linspace(base, starts[count], pieces + 1)[1:-1]
+    bounds = np.unique(np.concatenate(([0], np.searchsorted(starts[:count + 1], targets), [count])))
+    return [(int(a), int(b)) for a, b in zip(bounds[:-1], bounds[1:]) if b > a]
+
+# Melakukan clipping pada seluruh adegan, secara paralel jika adegannya cukup besar.
+# Hasilnya identik dengan clipping.perform_clipping.
+def perform_clipping(scene, clip_window, algorithm=clipping.DEFAULT_LINE_ALGORITHM,
+                     workers=None, threshold=DEFAULT_THRESHOLD):
+    candidates = scene.query(clip_window)
+    if not candidates: return scene
+    workers = default_workers() if workers is None else workers
+    if not affine.HAVE_NUMPY or workers < 2 \
+            or sum(len(shape.points) for shape in candidates) < threshold:
+        return clipping.replace_clipped(scene, clipping.clip_candidates(candidates, clip_window, algorithm))
+    # Garis dan poligon yang benar-benar perlu dipotong dikirim ke pekerja; objek lain
+    # (titik, poligon yang seluruhnya di dalam window, garis tanpa segmen) dipotong di sini.
+    lines, polygons, others = [], [], []
+    for shape in candidates:
+        if shape.type == 'line' and len(shape.points) >= 2:
+            lines.append(shape)
+        elif shape.type in ('rectangle', 'ellipse') and len(shape.points) \
+                and not clipping.bbox_inside(shape.bbox, clip_window):
+            polygons.append(shape)
+        else:
+            others.append(shape)
+    replacements = clipping.clip_candidates(others, clip_window, algorithm)
+    if lines or polygons:
+        replacements.update(_clip_parallel(lines, polygons, clip_window, algorithm, workers))
+    return clipping.replace_clipped(scene, replacements)
+
+# Memotong garis dan poligon di proses pekerja. Mengembalikan dict id(objek) -> list objek hasil.
+def _clip_parallel(lines, polygons, clip_window, algorithm, workers):
+    np = affine.np
+    arrays = [affine.as_array(shape.points) for shape in lines + polygons]
+    starts = np.zeros(len(arrays) + 1, dtype=np.int64)
+    starts[1:] = np.cumsum([len(a) for a in arrays])
+    total = int(starts[-1])
+    block = shared_memory.SharedMemory(create=True, size=max(total * 16, 1))
+    try:
+        coords = np.ndarray((total, 2), dtype=float, buffer=block.buf)
+        np.concatenate(arrays, out=coords)
+        del coords, arrays
+        # Potongan garis dan poligon dikirim dalam urutan objek.
+        executor = get_executor(workers)
+        pieces = workers * CHUNKS_PER_WORKER
+        tasks = []
+        for kind, offset, count in (('line', 0, len(lines)), ('polygon', len(lines), len(polygons))):
+            for lo, hi in _split(starts[offset:], count, pieces):
+                future = executor.submit(_clip_task, block.name, total, kind,
+                                         starts[offset + lo:offset + hi + 1], clip_window, algorithm)
+                tasks.append((kind, lo, future))
+        line_runs = []
+        replacements = {id(shape): [] for shape in polygons}
+        for kind, lo, future in tasks:
+            owners, offsets, points, intact = future.result()
+            runs = [(lo + owner, points[offsets[j]:offsets[j + 1]], flag)
+                    for j, (owner, flag) in enumerate(zip(owners.tolist(), intact.tolist()))]
+            if kind == 'line':
+                line_runs.extend(runs)
+            else:
+                for i, clipped, _ in runs:
+                    shape = polygons[i]
+                    shape.points = clipped
+                    replacements[id(shape)] = [shape]
+    finally:
+        block.close()
+        block.unlink()
+    replacements.update(clipping.runs_to_shapes(lines, line_runs))
+    return replacements
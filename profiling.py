@@ -0,0 +1,172 @@
+# --- Instrumentasi Latensi ---
+# Pengukuran waktu opsional untuk handler event dan tahap-tahap penggambaran.
+# Saat dinonaktifkan tidak ada kode pengukuran sama sekali di jalur panas: Profiler
+# memasang pembungkus (wrapper) pada metode instance hanya ketika instrumentasi
+# diaktifkan, lalu mengembalikan metode aslinya ketika dinonaktifkan.
+# Setiap pemanggilan yang diukur dicatat ke:
+#   - histogram latensi per tahap (bucket logaritmik, untuk persentil),
+#   - log event berukuran terbatas yang bisa diekspor sebagai Chrome trace JSON
+#     (dibuka di chrome://tracing atau https://ui.perfetto.dev).
+# Tahap bernama FRAME dianggap satu frame dan dipakai untuk menghitung waktu frame dan FPS.
+# Tidak bergantung pada tkinter.
+import json
+import math
+import os
+import time
+from collections import deque
+
+# Nama tahap yang mewakili satu frame penggambaran.
+FRAME = 'frame'
+# Jumlah maksimum event yang disimpan untuk ekspor trace (event tertua dibuang).
+DEFAULT_MAX_EVENTS = 200000
+# Jumlah bucket per kelipatan dua dan jumlah seluruh bucket histogram (1 us sampai ~67 detik).
+SUB_BUCKETS = 4
+BUCKET_COUNT = 26 * SUB_BUCKETS
+# Panjang jendela waktu (detik) untuk waktu frame dan FPS terkini.
+RECENT_WINDOW = 1.0
+
+
+# --- Kelas LatencyHistogram ---
+# Histogram latensi dengan bucket logaritmik: bucket i mencakup [2^(i/4), 2^((i+1)/4))
+# mikrodetik, sehingga galat persentil paling banyak sekitar 19%.
+class LatencyHistogram:
+    def __init__(self):
+        self.counts = [0] * BUCKET_COUNT
+        self.count = 0
+        self.total = 0.0
+        self.min = math.inf
+        self.max = 0.0
+
+    # Mencatat satu durasi (detik).
+    def record(self, seconds):
+        micros = seconds * 1e6
+        index = int(math.log2(micros) * SUB_BUCKETS) if micros > 1.0 else 0
+        self.counts[min(index, BUCKET_COUNT - 1)] += 1
+        self.count += 1
+        self.total += seconds
+        if seconds < self.min: self.min = seconds
+        if seconds > self.max: self.max = seconds
+
+    @property
+    def mean(self):
+        return self.total / self.count if self.count else 0.0
+
+    # Perkiraan persentil 'p' (0-100) dalam detik: batas atas bucket tempat persentil
+    # berada, dibatasi oleh nilai maksimum yang pernah tercatat.
+    def percentile(self, p):
+        if not self.count: return 0.0
+        rank = max(1, math.ceil(self.count * p / 100))
+        seen = 0
+        for index, n in enumerate(self.counts):
+            seen += n
+            if seen >= rank:
+                return min(2 ** ((index + 1) / SUB_BUCKETS) / 1e6, self.max)
+        return self.max
+
+    # Ringkasan statistik dalam milidetik.
+    def summary(self):
+        ms = 1000.0
+        return {'count': self.count, 'mean_ms': self.mean * ms,
+                'min_ms': (self.min if self.count else 0.0) * ms, 'max_ms': self.max * ms,
+                'p50_ms': self.percentile(50) * ms, 'p95_ms': self.percentile(95) * ms,
+                'p99_ms': self.percentile(99) * ms}
+
+
+# --- Kelas Profiler ---
+class Profiler:
+    def __init__(self, max_events=DEFAULT_MAX_EVENTS, clock=time.perf_counter):
+        self.enabled = False
+        self.clock = clock
+        # Histogram latensi per nama tahap.
+        self.histograms = {}
+        # Event (nama, mulai, durasi) dalam detik, untuk ekspor trace.
+        self.events = deque(maxlen=max_events)
+        # (waktu selesai, durasi) frame-frame terkini untuk waktu frame dan FPS.
+        self._recent_frames = deque()
+        # Dipanggil setelah setiap frame tercatat (misalnya untuk memperbarui status bar).
+        self.on_frame = None
+        # Metode yang sedang dibungkus: (objek, nama atribut, nilai asli atau None).
+        self._patched = []
+        # Waktu awal sesi (titik nol timestamp trace).
+        self._origin = clock()
+
+    # Mencatat satu pemanggilan tahap 'name' yang berjalan dari 'start' sampai 'end'.
+    def record(self, name, start, end):
+        duration = end - start
+        histogram = self.histograms.get(name)
+        if histogram is None: histogram = self.histograms[name] = LatencyHistogram()
+        histogram.record(duration)
+        self.events.append((name, start, duration))
+        if name == FRAME:
+            recent = self._recent_frames
+            recent.append((end, duration))
+            while recent and recent[0][0] < end - RECENT_WINDOW: recent.popleft()
+            if self.on_frame: self.on_frame()
+
+    # Membuat pembungkus yang mengukur setiap pemanggilan 'func' sebagai tahap 'name'.
+    def wrap(self, name, func):
+        clock, record = self.clock, self.record
+
+        def timed(*args, **kwargs):
+            start = clock()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                record(name, start, clock())
+
+        timed.__wrapped__ = func
+        return timed
+
+    # Membungkus metode-metode 'obj' sesuai pemetaan {nama atribut: nama tahap}.
+    # Pembungkus dipasang sebagai atribut instance, jadi kelasnya tidak berubah.
+    def instrument(self, obj, methods):
+        for attribute, name in methods.items():
+            original = obj.__dict__.get(attribute)
+            self._patched.append((obj, attribute, original))
+            setattr(obj, attribute, self.wrap(name, getattr(obj, attribute)))
+
+    # Melepas semua pembungkus dan mengembalikan metode aslinya.
+    def uninstrument(self):
+        for obj, attribute, original in reversed(self._patched):
+            if original is None: delattr(obj, attribute)
+            else: setattr(obj, attribute, original)
+        self._patched = []
+
+    # Menghapus semua data yang sudah tercatat.
+    def reset(self):
+        self.histograms = {}
+        self.events.clear()
+        self._recent_frames.clear()
+        self._origin = self.clock()
+
+    # Rata-rata waktu frame (detik) dan jumlah frame per detik dalam jendela terkini.
+    def recent_frame_stats(self):
+        recent = self._recent_frames
+        if not recent: return 0.0, 0.0
+        mean = sum(duration for _, duration in recent) / len(recent)
+        span = recent[-1][0] - recent[0][0]
+        fps = (len(recent) - 1) / span if span > 0 else 0.0
+        return mean, fps
+
+    # Ringkasan histogram semua tahap dalam milidetik.
+    def summary(self):
+        return {name: histogram.summary() for name, histogram in sorted(self.histograms.items())}
+
+    # Tabel teks ringkasan latensi per tahap.
+    def report(self):
+        lines = [f"{'tahap':<24}{'jumlah':>8}{'rata2':>10}{'p50':>10}{'p95':>10}{'p99':>10}{'maks':>10}  (ms)"]
+        for name, s in self.summary().items():
+            lines.append(f"{name:<24}{s['count']:>8}{s['mean_ms']:>10.2f}{s['p50_ms']:>10.2f}"
+                         f"{s['p95_ms']:>10.2f}{s['p99_ms']:>10.2f}{s['max_ms']:>10.2f}")
+        return "\n".join(lines)
+
+    # Menulis event sebagai Chrome trace JSON (event lengkap 'X', timestamp mikrodetik).
+    # Ringkasan histogram disertakan di 'otherData'.
+    def export_chrome_trace(self, path):
+        pid, origin = os.getpid(), self._origin
+        trace_events = [{'name': name, 'cat': name.split('.')[0], 'ph': 'X', 'pid': pid, 'tid': 1,
+                         'ts': round((start - origin) * 1e6, 3), 'dur': round(duration * 1e6, 3)}
+                        for name, start, duration in self.events]
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump({'traceEvents': trace_events, 'displayTimeUnit': 'ms',
+                       'otherData': {'latency': self.summary()}}, f)
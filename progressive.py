@@ -0,0 +1,144 @@
+# --- Pemuatan dan Penggambaran Bertahap ---
+# Memasukkan objek dalam jumlah sangat besar ke adegan tanpa membekukan event loop Tk.
+# Pekerjaan dipecah menjadi potongan (chunk) berbatas waktu yang dijadwalkan lewat
+# root.after, sehingga event input tetap diproses di antara potongan:
+#   1. Memuat  : objek diambil dari iterator/generator sumber.
+#   2. Menggambar: objek dimasukkan ke adegan mulai dari yang paling dekat ke area
+#                terlihat, lalu callback 'on_chunk' (misalnya flush renderer) dipanggil.
+#                Jumlah objek per potongan disesuaikan agar tetap dalam anggaran waktu.
+# Setelah selesai (atau dibatalkan), urutan gambar dikembalikan ke urutan sumber dalam
+# satu langkah, jadi tumpukan akhirnya sama seperti jika objek dimasukkan berurutan.
+# Modul ini tidak mengimpor tkinter; 'root' cukup menyediakan after dan after_cancel.
+import time
+
+# Anggaran waktu setiap potongan (milidetik).
+DEFAULT_BUDGET_MS = 15
+# Jumlah awal objek per potongan saat menggambar.
+INITIAL_CHUNK = 200
+
+
+# Jarak kuadrat antara bounding box 'box' dan persegi panjang 'rect' (0 jika bersinggungan).
+def rect_distance_sq(box, rect):
+    dx = max(rect[0] - box[2], 0.0, box[0] - rect[2])
+    dy = max(rect[1] - box[3], 0.0, box[1] - rect[3])
+    return dx * dx + dy * dy
+
+
+# --- Kelas ProgressiveLoader ---
+class ProgressiveLoader:
+    def __init__(self, root, scene, source, visible_rect=None, total=None,
+                 budget_ms=DEFAULT_BUDGET_MS, on_chunk=None, on_progress=None, on_done=None):
+        self.root = root
+        self.scene = scene
+        self._source = iter(source)
+        # Area terlihat (xmin, ymin, xmax, ymax); objek terdekat digambar lebih dulu.
+        self.visible_rect = visible_rect
+        # Jumlah objek sumber jika diketahui (untuk persentase kemajuan).
+        self.total = total
+        self.budget = budget_ms / 1000.0
+        # on_chunk() dipanggil setelah setiap potongan dimasukkan ke adegan;
+        # on_progress(teks) untuk status kemajuan; on_done(dibatalkan) di akhir.
+        self.on_chunk = on_chunk
+        self.on_progress = on_progress
+        self.on_done = on_done
+        # Objek yang sudah dimuat, dalam urutan sumber, beserta jaraknya ke area terlihat.
+        self.loaded = []
+        self._distances = []
+        # Urutan objek yang akan dimasukkan ke adegan (indeks ke self.loaded).
+        self._queue = None
+        self._next = 0
+        self._chunk = INITIAL_CHUNK
+        self._after_id = None
+        self.running = False
+        self.cancelled = False
+
+    # Memulai pemuatan; langkah pertama dijalankan lewat event loop.
+    def start(self):
+        self.running = True
+        # Objek yang sudah ada di adegan tetap berada di bawah objek yang dimuat.
+        self._existing = {id(shape) for shape in self.scene}
+        self._schedule(self._load_step)
+        return self
+
+    # Membatalkan pemuatan. Objek yang sudah masuk ke adegan tetap ada.
+    def cancel(self):
+        if not self.running: return
+        if self._after_id is not None:
+            self.root.after_cancel(self._after_id)
+            self._after_id = None
+        self.cancelled = True
+        self._finish()
+
+    def _schedule(self, step):
+        # Jeda 1 ms memberi kesempatan event input diproses sebelum potongan berikutnya.
+        self._after_id = self.root.after(1, step)
+
+    def _progress(self, text):
+        if self.on_progress: self.on_progress(text)
+
+    # Jarak objek ke area terlihat (dihitung saat dimuat agar ikut dalam anggaran waktu).
+    def _distance(self, shape):
+        if self.visible_rect is None: return 0.0
+        box = shape.bbox
+        return float('inf') if box is None else rect_distance_sq(box, self.visible_rect)
+
+    # Tahap 1: ambil objek dari sumber sampai anggaran waktu habis.
+    def _load_step(self):
+        self._after_id = None
+        deadline = time.perf_counter() + self.budget
+        loaded, distances = self.loaded, self._distances
+        for shape in self._source:
+            loaded.append(shape)
+            distances.append(self._distance(shape))
+            if len(loaded) % 64 == 0 and time.perf_counter() >= deadline:
+                total = f"/{self.total}" if self.total else ""
+                self._progress(f"Memuat: {len(loaded)}{total} objek")
+                self._schedule(self._load_step)
+                return
+        # Urutan penggambaran: objek di dalam/dekat area terlihat lebih dulu. Pengurutan
+        # stabil, jadi urutan sumber dipertahankan di antara objek dengan jarak yang sama.
+        self._queue = sorted(range(len(loaded)), key=distances.__getitem__)
+        self._schedule(self._draw_step)
+
+    # Tahap 2: masukkan satu potongan objek ke adegan lalu gambar.
+    def _draw_step(self):
+        self._after_id = None
+        start = time.perf_counter()
+        end = min(len(self._queue), self._next + self._chunk)
+        loaded = self.loaded
+        for i in self._queue[self._next:end]:
+            self.scene.add(loaded[i])
+        count = end - self._next
+        self._next = end
+        if self.on_chunk: self.on_chunk()
+        # Sesuaikan ukuran potongan berikutnya dengan waktu yang benar-benar terpakai.
+        elapsed = time.perf_counter() - start
+        if count and elapsed > 0:
+            self._chunk = max(16, min(count * 4, int(count * self.budget / elapsed)))
+        if self._next >= len(self._queue):
+            self._finish()
+            return
+        percent = 100 * self._next // len(self._queue)
+        self._progress(f"Menggambar: {self._next}/{len(self._queue)} objek ({percent}%) - Esc untuk batal")
+        self._schedule(self._draw_step)
+
+    # Mengembalikan urutan gambar objek yang sudah dimasukkan ke urutan sumber. Objek yang
+    # sudah ada sebelumnya tetap di bawah, dan objek lain yang masuk selama pemuatan
+    # (misalnya digambar pengguna) tetap di atas.
+    def _finish(self):
+        self.running = False
+        inserted = self._queue[:self._next] if self._queue is not None else []
+        if any(a > b for a, b in zip(inserted, inserted[1:])):
+            rank = {id(self.loaded[i]): i for i in inserted}
+            existing = self._existing
+
+            def order(item):
+                pos, shape = item
+                key = id(shape)
+                if key in existing: return (0, pos)
+                if key in rank: return (1, rank[key])
+                return (2, pos)
+
+            self.scene.reorder(shape for _, shape in sorted(enumerate(self.scene), key=order))
+            if self.on_chunk: self.on_chunk()
+        if self.on_done: self.on_done(self.cancelled)
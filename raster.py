@@ -0,0 +1,236 @@
+# --- Renderer Raster Tanpa Layar ---
+# Menggambar adegan ke buffer piksel RGB di memori, tanpa tkinter dan tanpa layar,
+# sehingga thumbnail dan ekspor bisa dibuat dalam batch job. Hasilnya meniru item
+# yang dibuat CanvasRenderer: titik sebagai lingkaran terisi, garis dengan ujung dan
+# sambungan bulat, serta persegi/elips sebagai poligon berisi atau hanya outline.
+# Poligon diisi dengan algoritma scanline berbasis edge table (aturan even-odd, sampel
+# di tengah piksel). Buffer berupa array NumPy (tinggi, lebar, 3) bertipe uint8 jika
+# NumPy tersedia, atau bytearray biasa. Ekspor ke PPM dan PNG hanya memakai pustaka
+# standar Python (zlib dan struct).
+import math
+import struct
+import zlib
+from functools import lru_cache
+
+import affine
+import lod
+
+# Nilai RGB untuk nama warna yang dipakai aplikasi (sesuai nilai warna Tk 8.6).
+COLOR_NAMES = {
+    'white': (255, 255, 255), 'black': (0, 0, 0), 'gray': (128, 128, 128),
+    'grey': (128, 128, 128), 'silver': (192, 192, 192), 'maroon': (128, 0, 0),
+    'red': (255, 0, 0), 'purple': (128, 0, 128), 'fuchsia': (255, 0, 255),
+    'magenta': (255, 0, 255), 'green': (0, 128, 0), 'lime': (0, 255, 0),
+    'olive': (128, 128, 0), 'yellow': (255, 255, 0), 'navy': (0, 0, 128),
+    'blue': (0, 0, 255), 'teal': (0, 128, 128), 'aqua': (0, 255, 255),
+    'cyan': (0, 255, 255), 'orange': (255, 165, 0),
+}
+
+
+# Mengubah warna Tk ('red', '#f00', '#ff0000', '#ffff00000000') menjadi tuple (r, g, b).
+@lru_cache(maxsize=256)
+def parse_color(color):
+    if isinstance(color, tuple): return color
+    name = color.strip().lower()
+    if name in COLOR_NAMES: return COLOR_NAMES[name]
+    if name.startswith('#') and len(name) in (4, 7, 13):
+        digits = (len(name) - 1) // 3
+        try:
+            channels = [int(name[1 + i * digits:1 + (i + 1) * digits], 16) for i in range(3)]
+        except ValueError:
+            channels = None
+        if channels is not None:
+            # Skalakan setiap kanal ke rentang 0-255.
+            top = 16 ** digits - 1
+            return tuple(round(c * 255 / top) for c in channels)
+    raise ValueError(f"warna tidak dikenal: {color!r}")
+
+
+# Menghasilkan span (y, x_awal, x_akhir) untuk mengisi poligon, x_akhir eksklusif.
+# Edge table: setiap sisi non-horizontal dimasukkan ke ember baris pertama yang
+# dilintasinya. Active edge list menyimpan [baris_akhir, x, dx/dy] dan x dimajukan
+# secara inkremental setiap baris.
+def polygon_spans(points, height):
+    points = affine.as_list(points)
+    count = len(points)
+    if count < 3: return
+    table = {}
+    for i in range(count):
+        x0, y0 = points[i]
+        x1, y1 = points[(i + 1) % count]
+        if y0 == y1: continue
+        if y0 > y1: x0, y0, x1, y1 = x1, y1, x0, y0
+        # Baris yang tengah pikselnya (y + 0.5) berada di [y0, y1).
+        first = max(0, math.ceil(y0 - 0.5))
+        last = min(height, math.ceil(y1 - 0.5))
+        if first >= last: continue
+        slope = (x1 - x0) / (y1 - y0)
+        table.setdefault(first, []).append([last, x0 + (first + 0.5 - y0) * slope, slope])
+    if not table: return
+    active = []
+    y = min(table)
+    end = max(edge[0] for edges in table.values() for edge in edges)
+    while y < end:
+        if y in table: active.extend(table[y])
+        active = [edge for edge in active if edge[0] > y]
+        xs = sorted(edge[1] for edge in active)
+        # Pasangan perpotongan berurutan membatasi bagian dalam poligon.
+        for i in range(0, len(xs) - 1, 2):
+            yield y, math.ceil(xs[i] - 0.5), math.ceil(xs[i + 1] - 0.5)
+        for edge in active: edge[1] += edge[2]
+        y += 1
+
+
+# --- Kelas Raster ---
+# 'origin' adalah koordinat adegan yang dipetakan ke piksel (0, 0), sehingga sebuah
+# Raster bisa mewakili satu potongan (tile) dari adegan yang lebih besar.
+class Raster:
+    def __init__(self, width, height, background='white', origin=(0, 0)):
+        self.width = width
+        self.height = height
+        self.origin = origin
+        self.background = background
+        # Buffer piksel RGB, 3 byte per piksel, baris demi baris dari atas.
+        if affine.HAVE_NUMPY:
+            self.pixels = affine.np.empty((height, width, 3), dtype=affine.np.uint8)
+        else:
+            self.pixels = bytearray(width * height * 3)
+        self.clear()
+
+    # Mengisi ulang seluruh buffer dengan warna latar (buffer dipakai ulang, tidak dialokasi lagi).
+    def clear(self, background=None):
+        if background is not None: self.background = background
+        color = parse_color(self.background)
+        if affine.is_array(self.pixels): self.pixels[:] = color
+        else: self.pixels[:] = bytes(color) * (self.width * self.height)
+
+    # Mengisi span horizontal [x0, x1) pada baris y (dipotong ke batas gambar).
+    def _span(self, y, x0, x1, color):
+        if y < 0 or y >= self.height: return
+        x0, x1 = max(0, x0), min(self.width, x1)
+        if x0 >= x1: return
+        if affine.is_array(self.pixels):
+            self.pixels[y, x0:x1] = color
+        else:
+            start = (y * self.width + x0) * 3
+            self.pixels[start:start + (x1 - x0) * 3] = bytes(color) * (x1 - x0)
+
+    # Warna piksel (x, y) sebagai tuple (r, g, b).
+    def get_pixel(self, x, y):
+        if affine.is_array(self.pixels): return tuple(int(c) for c in self.pixels[y, x])
+        start = (y * self.width + x) * 3
+        return tuple(self.pixels[start:start + 3])
+
+    # Mengisi poligon dengan warna 'color'.
+    def fill_polygon(self, points, color):
+        color = parse_color(color)
+        for y, x0, x1 in polygon_spans(points, self.height):
+            self._span(y, x0, x1, color)
+
+    # Mengisi lingkaran berpusat (cx, cy) dengan jari-jari 'radius'.
+    def fill_disc(self, cx, cy, radius, color):
+        color = parse_color(color)
+        first = max(0, math.ceil(cy - radius - 0.5))
+        last = min(self.height, math.ceil(cy + radius - 0.5))
+        for y in range(first, last):
+            half = math.sqrt(max(0.0, radius * radius - (y + 0.5 - cy) ** 2))
+            self._span(y, math.ceil(cx - half - 0.5), math.ceil(cx + half - 0.5), color)
+        # Lingkaran yang lebih kecil dari satu piksel tetap terlihat sebagai satu piksel.
+        if first >= last or radius < 0.5:
+            x, y = math.floor(cx), math.floor(cy)
+            self._span(y, x, x + 1, color)
+
+    # Menggambar polyline dengan ujung dan sambungan bulat. Setiap segmen diisi sebagai
+    # persegi panjang setebal 'width' dan setiap titik sudut diberi lingkaran.
+    def draw_polyline(self, points, color, width, closed=False):
+        points = affine.as_list(points)
+        if closed and len(points) > 1 and points[0] != points[-1]:
+            points = points + [points[0]]
+        half = max(1.0, width) / 2
+        for (x0, y0), (x1, y1) in zip(points, points[1:]):
+            # Lewati segmen yang seluruhnya di luar buffer.
+            if max(x0, x1) + half < 0 or min(x0, x1) - half > self.width \
+                    or max(y0, y1) + half < 0 or min(y0, y1) - half > self.height:
+                continue
+            length = math.hypot(x1 - x0, y1 - y0)
+            if length == 0: continue
+            # Vektor normal segmen sepanjang setengah ketebalan.
+            nx, ny = -(y1 - y0) / length * half, (x1 - x0) / length * half
+            self.fill_polygon([(x0 + nx, y0 + ny), (x1 + nx, y1 + ny),
+                               (x1 - nx, y1 - ny), (x0 - nx, y0 - ny)], color)
+        if half > 0.5:
+            for x, y in points:
+                if -half <= x <= self.width + half and -half <= y <= self.height + half:
+                    self.fill_disc(x, y, half, color)
+
+    # Menggambar satu objek Shape seperti CanvasRenderer menggambarnya. 'matrix' adalah
+    # transformasi tampilan (dunia -> layar) opsional; ketebalan ikut diskalakan.
+    def draw_shape(self, shape, matrix=None):
+        points = shape.points
+        # Elips yang diperbesar ditessellasi ulang sesuai skala agar tetap halus.
+        if matrix is not None and shape.type == 'ellipse':
+            scale = affine.matrix_scale(matrix) * affine.matrix_scale(shape.matrix)
+            if scale > 1 and shape.ellipse is not None:
+                points = lod.ellipse_points(shape, scale)
+        count = len(points)
+        width = shape.width
+        # Geser ke koordinat buffer jika Raster mewakili potongan adegan.
+        m = affine.translation(-self.origin[0], -self.origin[1])
+        if matrix is not None:
+            m = affine.compose(m, matrix)
+            width = width * affine.matrix_scale(matrix)
+        if m != affine.IDENTITY and count:
+            points = affine.apply(m, points)
+        if shape.type == 'point' and count >= 1:
+            x, y = points[0]
+            self.fill_disc(x, y, width, shape.color)
+        elif shape.type == 'line' and count >= 2:
+            self.draw_polyline(points, shape.color, width)
+        elif shape.type in ['rectangle', 'ellipse'] and count >= 3:
+            if shape.fill: self.fill_polygon(points, shape.color)
+            self.draw_polyline(points, shape.color, width, closed=True)
+
+    # Isi buffer sebagai bytes RGB mentah.
+    def to_bytes(self):
+        if affine.is_array(self.pixels): return self.pixels.tobytes()
+        return bytes(self.pixels)
+
+    # Data gambar dalam format PPM biner (P6).
+    def to_ppm(self):
+        return b'P6\n%d %d\n255\n' % (self.width, self.height) + self.to_bytes()
+
+    # Data gambar dalam format PNG (RGB 8-bit, tanpa filter).
+    def to_png(self, level=6):
+        row_size = self.width * 3
+        if affine.is_array(self.pixels):
+            np = affine.np
+            rows = self.pixels.reshape(self.height, row_size)
+            raw = np.hstack((np.zeros((self.height, 1), dtype=np.uint8), rows)).tobytes()
+        else:
+            data = self.pixels
+            raw = b''.join(b'\x00' + bytes(data[y * row_size:(y + 1) * row_size])
+                           for y in range(self.height))
+
+        def chunk(tag, body):
+            return (struct.pack('>I', len(body)) + tag + body
+                    + struct.pack('>I', zlib.crc32(tag + body) & 0xFFFFFFFF))
+
+        header = struct.pack('>IIBBBBB', self.width, self.height, 8, 2, 0, 0, 0)
+        return (b'\x89PNG\r\n\x1a\n' + chunk(b'IHDR', header)
+                + chunk(b'IDAT', zlib.compress(raw, level)) + chunk(b'IEND', b''))
+
+    # Menyimpan gambar ke file; formatnya ditentukan dari ekstensi (.ppm atau .png).
+    def save(self, path):
+        if str(path).lower().endswith('.ppm'): data = self.to_ppm()
+        elif str(path).lower().endswith('.png'): data = self.to_png()
+        else: raise ValueError(f"format gambar tidak didukung: {path!r}")
+        with open(path, 'wb') as f:
+            f.write(data)
+
+
+# Menggambar semua objek adegan (urutan gambar sama dengan di kanvas) ke Raster baru.
+def render_scene(scene, width, height, background='white'):
+    raster = Raster(width, height, background)
+    for shape in scene:
+        raster.draw_shape(shape)
+    return raster
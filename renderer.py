@@ -0,0 +1,281 @@
+# --- Renderer Retained-Mode untuk Kanvas ---
+# Renderer ini menyimpan pemetaan permanen dari setiap Shape ke ID item kanvasnya.
+# Daripada menghapus dan membuat ulang semua item setiap kali kanvas digambar ulang,
+# renderer mendengarkan perubahan Scene dan hanya memperbarui item yang kotor (dirty)
+# lewat canvas.coords / canvas.itemconfig. Item yang tidak berubah dibiarkan di tempatnya.
+# Koordinat item adalah koordinat layar hasil Viewport (zoom/pan). Hanya objek yang
+# bounding box-nya (ditambah ketebalan) bersinggungan dengan area terlihat yang punya
+# item kanvas (view-frustum culling); objek lain dibuatkan item saat masuk ke tampilan.
+# Jumlah titik yang dikirim ke kanvas mengikuti zoom: level of detail (modul 'lod')
+# dipilih dari skala tampilan, dan objek yang lebih kecil dari satu piksel menjadi titik.
+# Modul ini tidak mengimpor tkinter; objek kanvas cukup menyediakan API tk.Canvas.
+import affine
+import lod
+from scene import bbox_intersects
+from viewport import Viewport
+
+# Tag kanvas untuk semua item objek (dipakai untuk menggeser semua item sekaligus saat pan).
+ITEM_TAG = 'shape'
+
+
+# Fungsi untuk meratakan daftar titik [(x, y), ...] menjadi [x1, y1, x2, y2, ...].
+def flatten_points(points):
+    return affine.flatten(points)
+
+
+# --- Kelas CanvasRenderer ---
+class CanvasRenderer:
+    def __init__(self, canvas, scene, viewport=None):
+        self.canvas = canvas
+        self.scene = scene
+        # Transformasi tampilan dunia -> layar.
+        self.viewport = viewport if viewport is not None else Viewport()
+        # Pemetaan Shape -> ID item kanvas, dan sebaliknya (ID item kanvas -> Shape).
+        self.items = {}
+        self.shapes_by_item = {}
+        # Objek yang baru ditambahkan dan belum punya item kanvas (urutan dipertahankan).
+        self._added = []
+        # Objek yang titiknya berubah sejak flush terakhir.
+        self._dirty_geometry = set()
+        # Objek yang gayanya (warna/ketebalan/isi) berubah sejak flush terakhir.
+        self._dirty_style = set()
+        # ID item kanvas milik objek yang sudah dikeluarkan dari adegan.
+        self._removed_ids = []
+        # Penanda bahwa urutan tumpukan item perlu disusun ulang.
+        self._needs_restack = False
+        # Penanda bahwa viewport atau ukuran kanvas berubah sejak flush terakhir.
+        self._view_dirty = False
+        # Matriks viewport saat koordinat item terakhir ditulis.
+        self._drawn_view = self.viewport.matrix
+        # Ketebalan terbesar yang pernah dilihat, untuk memperlebar query area terlihat.
+        self._max_margin = 0.0
+        # Urutan gambar objek (id objek -> nomor urut), dihitung ulang hanya saat urutan berubah.
+        self._order = None
+        self._next_order = 0
+        scene.subscribe(self._on_scene_event)
+        # Semua objek yang sudah ada di adegan perlu dibuatkan item.
+        self._added.extend(scene)
+
+    # Pendengar perubahan Scene: hanya mencatat apa yang kotor, pekerjaan kanvas
+    # dilakukan sekaligus di flush().
+    def _on_scene_event(self, event, shape):
+        if event == 'added':
+            self._added.append(shape)
+            # Tanpa event 'reordered', objek baru selalu berada di atas objek lama.
+            if self._order is not None:
+                self._order[id(shape)] = self._next_order
+                self._next_order += 1
+        elif event == 'removed':
+            tk_id = self.items.pop(shape, None)
+            if tk_id is not None:
+                del self.shapes_by_item[tk_id]
+                self._removed_ids.append(tk_id)
+            self._dirty_geometry.discard(shape)
+            self._dirty_style.discard(shape)
+            if self._order is not None: self._order.pop(id(shape), None)
+        elif event == 'geometry':
+            self._dirty_geometry.add(shape)
+        elif event == 'style':
+            self._dirty_style.add(shape)
+        elif event == 'reordered':
+            self._order = None
+            self._needs_restack = True
+
+    # Mengembalikan True jika ada perubahan yang belum diterapkan ke kanvas.
+    def has_pending(self):
+        return bool(self._added or self._dirty_geometry or self._dirty_style
+                    or self._removed_ids or self._needs_restack or self._view_dirty)
+
+    # Menandai bahwa viewport (zoom/pan) atau ukuran kanvas berubah; flush berikutnya
+    # menyesuaikan item dengan area terlihat yang baru.
+    def view_changed(self):
+        self._view_dirty = True
+
+    # Area dunia yang terlihat di kanvas.
+    def visible_rect(self):
+        width, height = self.canvas.winfo_width(), self.canvas.winfo_height()
+        return self.viewport.world_rect(max(1, width), max(1, height))
+
+    # Mengecek apakah objek (termasuk ketebalannya) bersinggungan dengan area terlihat.
+    def _is_visible(self, shape, rect):
+        bbox = shape.bbox
+        if bbox is None: return False
+        margin = shape.width
+        if margin > self._max_margin: self._max_margin = margin
+        return bbox_intersects((bbox[0] - margin, bbox[1] - margin, bbox[2] + margin, bbox[3] + margin), rect)
+
+    # Pemetaan id(objek) -> nomor urut gambar, dihitung ulang hanya jika urutan berubah.
+    def _shape_order(self):
+        if self._order is None:
+            self._order = {id(shape): i for i, shape in enumerate(self.scene)}
+            self._next_order = len(self._order)
+        return self._order
+
+    # Menerapkan semua perubahan yang tertunda ke kanvas. Biayanya sebanding dengan
+    # jumlah objek yang berubah, bukan dengan jumlah seluruh objek di adegan.
+    def flush(self):
+        canvas = self.canvas
+        rect = self.visible_rect()
+        # Hapus item milik objek yang sudah tidak ada.
+        for tk_id in self._removed_ids: canvas.delete(tk_id)
+        self._removed_ids = []
+        # Setelah zoom/pan, semua item disesuaikan dengan area terlihat yang baru.
+        if self._view_dirty or self._drawn_view != self.viewport.matrix:
+            self._view_dirty = False
+            self._sync_visible(rect)
+        # Buat item untuk objek baru yang terlihat sesuai urutan penambahannya.
+        added, self._added = self._added, []
+        for shape in added:
+            if shape._scene is not self.scene or shape in self.items: continue
+            if self._is_visible(shape, rect): self._create_item(shape)
+            self._dirty_geometry.discard(shape)
+            self._dirty_style.discard(shape)
+        # Perbarui koordinat item yang geometrinya berubah (objek bisa masuk atau keluar tampilan).
+        dirty_geometry, self._dirty_geometry = self._dirty_geometry, set()
+        for shape in dirty_geometry:
+            self._update_coords(shape, rect)
+        # Perbarui gaya item yang warnanya/ketebalannya berubah.
+        dirty_style, self._dirty_style = self._dirty_style, set()
+        for shape in dirty_style:
+            self._update_style(shape)
+        # Susun ulang tumpukan item jika urutan gambar berubah (misalnya setelah clipping).
+        if self._needs_restack:
+            self._needs_restack = False
+            self._restack()
+
+    # Menumpuk ulang semua item sesuai urutan gambar objeknya.
+    def _restack(self):
+        order = self._shape_order()
+        for shape in sorted(self.items, key=lambda shape: order[id(shape)]):
+            self.canvas.tag_raise(self.items[shape])
+
+    # Menyesuaikan item dengan area terlihat 'rect': item objek yang keluar dihapus dan
+    # objek yang masuk dibuatkan item. Pada pan (skala tetap), item yang tetap terlihat
+    # digeser sekaligus lewat tag-nya; pada zoom, koordinat dan ketebalannya ditulis ulang.
+    # Kandidat diambil dari query indeks adegan, jadi objek di luar tampilan tidak disentuh.
+    def _sync_visible(self, rect):
+        margin = self._max_margin
+        query = (rect[0] - margin, rect[1] - margin, rect[2] + margin, rect[3] + margin)
+        visible = [shape for shape in self.scene.query(query) if self._is_visible(shape, rect)]
+        keep = set(visible)
+        for shape in [shape for shape in self.items if shape not in keep]: self._delete_item(shape)
+        old, new = self._drawn_view, self.viewport.matrix
+        self._drawn_view = new
+        rescaled = old[0] != new[0]
+        if not rescaled and (old[2], old[5]) != (new[2], new[5]):
+            self.canvas.move(ITEM_TAG, new[2] - old[2], new[5] - old[5])
+        entering = []
+        for shape in visible:
+            tk_id = self.items.get(shape)
+            if tk_id is None:
+                if self._create_item(shape) is not None: entering.append(shape)
+            elif rescaled:
+                self.canvas.coords(tk_id, *self._item_coords(shape))
+                self.canvas.itemconfig(tk_id, **self._item_style(shape))
+        # Item baru dibuat di atas tumpukan; susun ulang jika ada yang seharusnya berada di bawah.
+        if entering and len(entering) < len(self.items):
+            order = self._shape_order()
+            lowest_new = min(order[id(shape)] for shape in entering)
+            entering_ids = set(map(id, entering))
+            if any(order[id(shape)] > lowest_new for shape in self.items if id(shape) not in entering_ids):
+                self._needs_restack = True
+
+    # Menghapus semua item lalu membuat ulang dari awal (misalnya setelah kanvas diganti).
+    def rebuild(self):
+        for tk_id in self.items.values(): self.canvas.delete(tk_id)
+        self.items = {}
+        self.shapes_by_item = {}
+        self._removed_ids = []
+        self._dirty_geometry = set()
+        self._dirty_style = set()
+        self._needs_restack = False
+        self._view_dirty = False
+        self._drawn_view = self.viewport.matrix
+        self._added = list(self.scene)
+        self.flush()
+
+    # Mengembalikan ID item kanvas milik sebuah objek (atau None).
+    def item_for(self, shape):
+        return self.items.get(shape)
+
+    # Mengembalikan objek pemilik sebuah ID item kanvas (atau None), dalam O(1).
+    def shape_for(self, tk_id):
+        return self.shapes_by_item.get(tk_id)
+
+    # Mengecek apakah objek punya cukup titik untuk digambar.
+    def _is_drawable(self, shape):
+        n = len(shape.points)
+        if shape.type == 'point': return n >= 1
+        if shape.type == 'line': return n >= 2
+        if shape.type in ['rectangle', 'ellipse']: return n >= 3
+        return False
+
+    # Menghitung koordinat item kanvas (layar) untuk sebuah objek.
+    def _item_coords(self, shape):
+        viewport = self.viewport
+        if shape.type == 'point':
+            x, y = viewport.to_screen(*shape.points[0])
+            r = shape.width * viewport.scale
+            return [x - r, y - r, x + r, y + r]
+        # Objek yang di layar lebih kecil dari satu piksel cukup digambar sebagai titik.
+        bbox = shape.bbox
+        if lod.is_tiny(bbox, viewport.scale):
+            return lod.dot_coords(viewport.screen_bbox(bbox), shape.type == 'line')
+        return flatten_points(viewport.points_to_screen(lod.render_points(shape, viewport.scale)))
+
+    # Menghitung opsi gaya item kanvas untuk sebuah objek (ketebalan dalam piksel layar).
+    def _item_style(self, shape):
+        if shape.type == 'point':
+            return {'fill': shape.color, 'outline': shape.color}
+        width = shape.width * self.viewport.scale
+        if shape.type == 'line':
+            return {'fill': shape.color, 'width': width}
+        return {'fill': shape.color if shape.fill else '',
+                'outline': shape.color, 'width': width}
+
+    # Membuat item kanvas baru untuk sebuah objek.
+    def _create_item(self, shape):
+        if not self._is_drawable(shape): return None
+        coords = self._item_coords(shape)
+        style = self._item_style(shape)
+        if shape.type == 'point':
+            tk_id = self.canvas.create_oval(*coords, tags=ITEM_TAG, **style)
+        elif shape.type == 'line':
+            tk_id = self.canvas.create_line(coords, capstyle='round', joinstyle='round', tags=ITEM_TAG, **style)
+        else:
+            tk_id = self.canvas.create_polygon(coords, tags=ITEM_TAG, **style)
+        self.items[shape] = tk_id
+        self.shapes_by_item[tk_id] = shape
+        return tk_id
+
+    # Menghapus item kanvas milik sebuah objek.
+    def _delete_item(self, shape):
+        tk_id = self.items.pop(shape)
+        del self.shapes_by_item[tk_id]
+        self.canvas.delete(tk_id)
+
+    # Memperbarui koordinat item yang sudah ada.
+    def _update_coords(self, shape, rect):
+        tk_id = self.items.get(shape)
+        drawable = self._is_drawable(shape) and self._is_visible(shape, rect)
+        # Objek yang sebelumnya tidak bisa digambar atau tidak terlihat kini perlu item baru.
+        if tk_id is None:
+            if drawable:
+                self._create_item(shape)
+                self._needs_restack = True
+            return
+        # Objek yang kini tidak punya cukup titik atau keluar dari tampilan: hapus item-nya.
+        if not drawable:
+            self._delete_item(shape)
+            return
+        self.canvas.coords(tk_id, *self._item_coords(shape))
+
+    # Memperbarui gaya item yang sudah ada.
+    def _update_style(self, shape):
+        tk_id = self.items.get(shape)
+        if tk_id is None: return
+        style = self._item_style(shape)
+        if shape.type == 'point':
+            # Radius titik bergantung pada ketebalannya.
+            self.canvas.coords(tk_id, *self._item_coords(shape))
+        self.canvas.itemconfig(tk_id, **style)
@@ -0,0 +1,490 @@
+# --- Model Adegan (Scene) Tanpa Tkinter ---
+# Modul ini menyimpan semua data geometri aplikasi menggambar: bentuk (Shape) dan
+# kumpulan bentuk (Scene). Modul ini sengaja tidak mengimpor tkinter sehingga bisa
+# dipakai di server tanpa layar (misalnya untuk batch processing atau benchmark).
+import math
+
+import affine
+import ellipse
+import simplify
+import store
+
+# Jumlah titik list tuple baru minimum sebelum Scene.compact() memindahkannya ke buffer
+# koordinat bersama (sekitar 1 MB per buffer).
+COMPACT_BATCH = 65536
+
+
+# --- Kelas Shape ---
+# Merepresentasikan satu objek yang digambar (titik, garis, persegi, atau elips).
+# Menggantikan dictionary ad-hoc yang sebelumnya disimpan di DrawingApp.drawn_objects.
+# Perubahan pada titik atau gaya dilaporkan ke Scene pemiliknya, sehingga view dan
+# struktur data turunan (indeks, cache) bisa diperbarui secara inkremental.
+#
+# Transformasi bersifat malas (lazy): objek menyimpan titik sumber yang tidak disentuh
+# ('base') beserta matriks affine akumulasi. Selama drag, setiap event hanya mengganti
+# matriks (operasi O(1)); koordinat nyata dihitung saat dibutuhkan (render, clipping)
+# dan di-cache sampai matriks berubah. bake() menuliskan matriks ke titik sumber.
+#
+# Elips bisa disimpan secara analitik ('ellipse' = (cx, cy, rx, ry, theta), lihat modul
+# 'ellipse'). Poligonnya dibuat dari ukuran di layar dan di-cache sampai elips
+# ditransformasi; bake() memasukkan matriks ke parameter analitik, bukan ke poligon.
+#
+# Untuk level of detail (lihat modul 'lod'), versi titik sumber yang disederhanakan
+# di-cache per toleransi dan dibuang setiap kali titik sumber atau elipsnya berganti.
+#
+# Gaya (warna, warna asli, ketebalan, isi) disimpan sebagai satu objek store.Style yang
+# dibagi oleh semua objek bergaya sama; mengubah gaya memasang objek Style lain.
+class Shape:
+    # __slots__ menghemat memori karena setiap objek tidak membawa __dict__ sendiri.
+    __slots__ = ('type', '_base', '_matrix', '_cache', '_base_center', '_base_bbox',
+                 '_style', 'rotation_angle', '_scene', '_bbox', '_ellipse', '_lod')
+
+    def __init__(self, type, points, color, width, fill=False, rotation_angle=0.0,
+                 original_color=None, ellipse=None, base_bbox=None):
+        # Jenis bentuk: 'point', 'line', 'rectangle', atau 'ellipse'.
+        self.type = type
+        # Titik sumber (x, y) sebelum matriks transformasi diterapkan.
+        self._base = points
+        # Matriks affine akumulasi yang belum di-bake ke titik sumber.
+        self._matrix = affine.IDENTITY
+        # Cache titik hasil transformasi untuk matriks saat ini.
+        self._cache = None
+        # Cache centroid dan bounding box titik sumber.
+        self._base_center = None
+        # Bounding box titik sumber boleh diberikan jika sudah diketahui (misalnya dari
+        # file), sehingga titik tidak perlu dibaca hanya untuk menghitungnya.
+        self._base_bbox = base_bbox
+        # Gaya bersama: warna yang sedang ditampilkan (bisa berubah karena efek windowing),
+        # warna asli (untuk mengembalikan warna setelah windowing), ketebalan garis/outline
+        # sebelum skala dari matriks diterapkan, dan apakah bentuk diisi warna.
+        if original_color is None: original_color = color
+        self._style = store.intern_style(color, original_color, width, fill)
+        # Akumulasi sudut rotasi (radian).
+        self.rotation_angle = rotation_angle
+        # Scene pemilik objek ini (None jika belum dimasukkan ke adegan).
+        self._scene = None
+        # Cache bounding box; dihitung saat pertama dibutuhkan dan dibuang saat titik berubah.
+        self._bbox = None
+        # Parameter elips analitik sebelum matriks diterapkan (None untuk bentuk lain,
+        # 'points' diabaikan jika diisi).
+        self._ellipse = ellipse
+        # Cache level of detail: toleransi -> titik sumber yang disederhanakan.
+        self._lod = None
+
+    # Memberi tahu Scene pemilik bahwa objek ini berubah ('geometry' atau 'style').
+    def _notify(self, event):
+        if self._scene is not None: self._scene._emit(event, self)
+
+    # Titik-titik objek dalam koordinat nyata (matriks sudah diterapkan).
+    @property
+    def points(self):
+        if self._ellipse is not None:
+            # Poligon elips dibuat dari parameter analitik dan di-cache sampai ditransformasi.
+            if self._cache is None: self._cache = ellipse.tessellate(self.ellipse)
+            return self._cache
+        if self._matrix == affine.IDENTITY: return self._base
+        if self._cache is None: self._cache = affine.apply(self._matrix, self._base)
+        return self._cache
+
+    # Mengganti titik-titik objek; matriks yang tertunda ikut dibuang.
+    @points.setter
+    def points(self, value):
+        # Skala dari matriks sudah menjadi bagian dari ketebalan sebelum matriks dibuang.
+        self._set_base_width(self.width_unclamped)
+        self._base = value
+        # Titik yang ditulis langsung menggantikan bentuk analitik elips.
+        self._ellipse = None
+        self._matrix = affine.IDENTITY
+        self._cache = None
+        self._lod = None
+        self._base_center = None
+        self._base_bbox = None
+        self._bbox = None
+        self._notify('geometry')
+
+    # Titik sumber sebelum matriks transformasi diterapkan.
+    @property
+    def base_points(self):
+        if self._ellipse is not None: return ellipse.tessellate(self._ellipse)
+        return self._base
+
+    # Parameter elips analitik dalam koordinat nyata, atau None jika bentuk ini bukan
+    # elips analitik.
+    @property
+    def ellipse(self):
+        if self._ellipse is None: return None
+        return ellipse.transform(self._matrix, self._ellipse)
+
+    # Matriks affine akumulasi yang belum di-bake.
+    @property
+    def matrix(self):
+        return self._matrix
+
+    # Mengganti matriks transformasi akumulasi (tanpa menyentuh titik sumber). 'points'
+    # boleh diisi titik hasil transformasi yang sudah dihitung di luar (misalnya untuk
+    # satu grup objek sekaligus); titik itu langsung dipakai sebagai cache.
+    def set_transform(self, matrix, points=None):
+        if matrix == self._matrix: return
+        # Perubahan skala ikut mengubah ketebalan yang ditampilkan.
+        style_changed = affine.matrix_scale(matrix) != affine.matrix_scale(self._matrix)
+        self._matrix = matrix
+        self._cache = points if self._ellipse is None else None
+        self._bbox = None
+        self._notify('geometry')
+        if style_changed: self._notify('style')
+
+    # Menggabungkan matriks baru setelah matriks yang sudah ada.
+    def apply_transform(self, matrix):
+        self.set_transform(affine.compose(matrix, self._matrix))
+
+    # Menuliskan matriks tertunda ke titik sumber. Geometri tidak berubah, sehingga
+    # tidak ada event yang dikirim.
+    def bake(self):
+        if self._matrix == affine.IDENTITY: return
+        center, bbox = self.center, self.bbox
+        self._set_base_width(self.width_unclamped)
+        if self._ellipse is not None:
+            # Elips tetap analitik; poligon yang sudah di-cache masih berlaku.
+            self._ellipse = self.ellipse
+        else:
+            self._base = self.points
+            self._cache = None
+        self._matrix = affine.IDENTITY
+        self._base_center = center
+        self._base_bbox = bbox
+        self._lod = None
+
+    # Titik sumber yang disederhanakan dengan galat maksimum 'tolerance' (dalam satuan titik
+    # sumber), untuk level of detail. Elips dibuat ulang dari parameter analitiknya dengan
+    # toleransi tersebut. Level kasar dibuat dari level halus terdekat yang sudah ada
+    # (jauh lebih sedikit titik) dengan sisa toleransinya, sehingga galat totalnya tetap
+    # paling banyak 'tolerance'. Setiap level di-cache sampai titik sumber berubah.
+    def lod_points(self, tolerance):
+        if self._lod is None: self._lod = {}
+        points = self._lod.get(tolerance)
+        if points is None:
+            if self._ellipse is not None:
+                points = ellipse.tessellate(self._ellipse, tolerance)
+            else:
+                finer = max((t for t in self._lod if t < tolerance), default=0.0)
+                source = self._lod[finer] if finer else self._base
+                points = simplify.simplify_rdp(source, tolerance - finer)
+            self._lod[tolerance] = points
+        return points
+
+    # Titik tengah (centroid) objek dalam koordinat nyata. Karena transformasi affine
+    # memetakan rata-rata ke rata-rata, cukup transformasikan centroid titik sumber.
+    @property
+    def center(self):
+        if self._base_center is None:
+            if self._ellipse is not None: self._base_center = self._ellipse[:2]
+            else: self._base_center = affine.centroid(self._base)
+        return affine.apply_point(self._matrix, self._base_center)
+
+    # Bounding box (xmin, ymin, xmax, ymax) objek, atau None jika objek tidak punya titik.
+    @property
+    def bbox(self):
+        if self._bbox is None and self._ellipse is not None:
+            self._bbox = ellipse.bbox(self.ellipse)
+        elif self._bbox is None and len(self._base):
+            m = self._matrix
+            if m == affine.IDENTITY:
+                self._bbox = self.base_bbox
+            elif m[1] == 0 and m[3] == 0:
+                # Tanpa rotasi, bounding box cukup dihitung dari bounding box titik sumber.
+                self._bbox = affine.transform_bbox(m, self.base_bbox)
+            else:
+                self._bbox = points_bbox(self.points)
+        return self._bbox
+
+    # Bounding box titik sumber (sebelum matriks diterapkan).
+    @property
+    def base_bbox(self):
+        if self._base_bbox is None:
+            if self._ellipse is not None: self._base_bbox = ellipse.bbox(self._ellipse)
+            else: self._base_bbox = points_bbox(self._base)
+        return self._base_bbox
+
+    @property
+    def color(self):
+        return self._style.color
+
+    @color.setter
+    def color(self, value):
+        # Hanya laporkan perubahan jika warnanya benar-benar berbeda.
+        if value != self._style.color:
+            self._style = self._style.replace(color=value)
+            self._notify('style')
+
+    @property
+    def original_color(self):
+        return self._style.original_color
+
+    @original_color.setter
+    def original_color(self, value):
+        self._style = self._style.replace(original_color=value)
+
+    # Mengganti ketebalan sebelum skala matriks (tanpa event).
+    def _set_base_width(self, value):
+        if value != self._style.width: self._style = self._style.replace(width=value)
+
+    # Ketebalan setelah skala matriks diterapkan, tanpa batas bawah.
+    @property
+    def width_unclamped(self):
+        if self._matrix == affine.IDENTITY: return self._style.width
+        return self._style.width * affine.matrix_scale(self._matrix)
+
+    # Ketebalan yang ditampilkan. Batas bawah 1 piksel hanya diterapkan di sini agar
+    # skala kecil lalu besar kembali tidak kehilangan informasi.
+    @property
+    def width(self):
+        if self._matrix == affine.IDENTITY: return self._style.width
+        return max(1, self.width_unclamped)
+
+    @width.setter
+    def width(self, value):
+        if value != self.width:
+            scale = affine.matrix_scale(self._matrix)
+            self._set_base_width(value / scale if scale else value)
+            self._notify('style')
+
+    @property
+    def fill(self):
+        return self._style.fill
+
+    @fill.setter
+    def fill(self, value):
+        if value != self._style.fill:
+            self._style = self._style.replace(fill=value)
+            self._notify('style')
+
+    # Snapshot geometri objek (titik sumber, matriks, elips analitik, ketebalan, sudut).
+    # Titik sumber tidak disalin: setter 'points' dan bake() selalu memasang objek titik
+    # baru dan tidak pernah mengubahnya di tempat, sehingga cukup menyimpan referensinya.
+    def geometry_state(self):
+        return (self._base, self._matrix, self._ellipse, self._style.width, self.rotation_angle)
+
+    # Mengembalikan geometri objek ke snapshot dari geometry_state().
+    def restore_geometry(self, state):
+        base, matrix, ellipse_params, width, rotation_angle = state
+        style_changed = (width != self._style.width
+                         or affine.matrix_scale(matrix) != affine.matrix_scale(self._matrix))
+        self._base, self._matrix, self._ellipse = base, matrix, ellipse_params
+        self._set_base_width(width)
+        self.rotation_angle = rotation_angle
+        self._cache = None
+        self._lod = None
+        self._base_center = None
+        self._base_bbox = None
+        self._bbox = None
+        self._notify('geometry')
+        if style_changed: self._notify('style')
+
+    # Membuat salinan dangkal objek dengan titik-titik baru (dipakai saat clipping).
+    # Salinan adalah objek baru yang belum termasuk anggota window mana pun, jadi dibuat
+    # dengan warna aslinya; sorotan window diberikan lagi jika salinan berada di window.
+    def copy(self, points=None):
+        style = self._style
+        color = style.original_color
+        if points is None and self._ellipse is not None:
+            return Shape(self.type, None, color, self.width_unclamped, style.fill,
+                         self.rotation_angle, color, ellipse=self.ellipse)
+        return Shape(self.type, self.points.copy() if points is None else points,
+                     color, self.width_unclamped, style.fill, self.rotation_angle, color)
+
+    def __repr__(self):
+        return f"Shape({self.type!r}, {len(self.points)} titik, color={self._style.color!r})"
+
+
+# --- Kelas Scene ---
+# Wadah berurutan untuk semua Shape. Urutan daftar sama dengan urutan gambar
+# (objek terakhir digambar paling atas).
+# Pendengar (listener) yang didaftarkan lewat subscribe() dipanggil sebagai
+# listener(event, shape) dengan event berikut:
+#   'added'     - shape baru masuk ke adegan.
+#   'removed'   - shape dikeluarkan dari adegan.
+#   'geometry'  - titik-titik shape berubah.
+#   'style'     - warna, ketebalan, atau isi shape berubah.
+#   'reordered' - urutan gambar berubah (shape bernilai None).
+class Scene:
+    def __init__(self, shapes=None):
+        # List objek Shape yang telah digambar.
+        self.shapes = []
+        # Daftar fungsi pendengar perubahan.
+        self._listeners = []
+        # Indeks spasial opsional (lihat spatial_index.GridIndex.attach).
+        self.index = None
+        # Objek yang masuk dengan titik berupa list tuple sejak compact() terakhir, beserta
+        # jumlah titiknya.
+        self._loose = []
+        self._loose_points = 0
+        for shape in shapes or ():
+            self.add(shape)
+
+    # Mendaftarkan pendengar perubahan adegan.
+    def subscribe(self, listener):
+        self._listeners.append(listener)
+
+    # Melepas pendengar yang sebelumnya didaftarkan.
+    def unsubscribe(self, listener):
+        self._listeners.remove(listener)
+
+    # Mengirim event ke semua pendengar.
+    def _emit(self, event, shape):
+        for listener in self._listeners:
+            listener(event, shape)
+
+    # Mencatat objek baru yang titik sumbernya belum disimpan ringkas.
+    def _track_loose(self, shape):
+        if not store.is_compact(shape._base):
+            self._loose.append(shape)
+            self._loose_points += len(shape._base)
+
+    # Menambahkan bentuk baru ke adegan (di lapisan paling atas).
+    def add(self, shape):
+        shape._scene = self
+        self.shapes.append(shape)
+        self._track_loose(shape)
+        self._emit('added', shape)
+        return shape
+
+    # Menyisipkan objek pada posisi 'index' dalam urutan gambar.
+    def insert(self, index, shape):
+        shape._scene = self
+        self.shapes.insert(index, shape)
+        self._track_loose(shape)
+        self._emit('added', shape)
+        # Objek yang tidak masuk di lapisan paling atas mengubah urutan tumpukan.
+        if index < len(self.shapes) - 1: self._emit('reordered', None)
+        return shape
+
+    # Mengeluarkan objek dari adegan (objek teratas dikeluarkan tanpa menggeser list).
+    def remove(self, shape):
+        if self.shapes and self.shapes[-1] is shape: self.shapes.pop()
+        else: self.shapes.remove(shape)
+        shape._scene = None
+        self._emit('removed', shape)
+
+    # Mengganti seluruh isi adegan (misalnya hasil clipping). Hanya objek yang benar-benar
+    # keluar atau masuk yang dilaporkan, sehingga objek yang tidak tersentuh tetap utuh.
+    def replace_all(self, shapes):
+        shapes = list(shapes)
+        old_ids = {id(s) for s in self.shapes}
+        new_ids = {id(s) for s in shapes}
+        for shape in self.shapes:
+            if id(shape) not in new_ids:
+                shape._scene = None
+                self._emit('removed', shape)
+        self.shapes = shapes
+        # Urutan dianggap berubah jika ada objek baru yang terselip di bawah objek lama.
+        reordered = False
+        seen_new = False
+        for shape in shapes:
+            if id(shape) in old_ids:
+                if seen_new:
+                    reordered = True
+            else:
+                seen_new = True
+                shape._scene = self
+                self._track_loose(shape)
+                self._emit('added', shape)
+        if reordered: self._emit('reordered', None)
+
+    # Mengganti urutan gambar dengan permutasi 'shapes' dari isi adegan saat ini.
+    def reorder(self, shapes):
+        shapes = list(shapes)
+        if len(shapes) != len(self.shapes): raise ValueError("reorder harus memuat semua objek adegan")
+        self.shapes = shapes
+        self._emit('reordered', None)
+
+    # Mengosongkan adegan.
+    def clear(self):
+        self.replace_all([])
+
+    # Memindahkan titik sumber objek yang masuk dengan list tuple ke satu buffer koordinat
+    # bersama (lihat modul 'store'), jika jumlah titiknya sudah mencapai 'min_points'.
+    # Geometri tidak berubah sehingga tidak ada event; jangan dipanggil di tengah edit
+    # yang sedang dicatat History (snapshot geometri dibandingkan lewat identitas titik).
+    # Mengembalikan jumlah titik yang dipindahkan.
+    def compact(self, min_points=0):
+        if not self._loose or self._loose_points < min_points: return 0
+        # Objek yang sudah keluar dari adegan atau titiknya sudah diganti dilewati (objek
+        # yang keluar-masuk karena undo/redo bisa tercatat lebih dari sekali).
+        shapes = {id(shape): shape for shape in self._loose
+                  if shape._scene is self and not store.is_compact(shape._base)}
+        shapes = list(shapes.values())
+        self._loose = []
+        self._loose_points = 0
+        if not shapes: return 0
+        views = store.pack_points([shape._base for shape in shapes])
+        for shape, points in zip(shapes, views):
+            shape._base = points
+        return sum(len(points) for points in views)
+
+    # Mengembalikan objek-objek yang bounding box-nya bersinggungan dengan 'rect'.
+    # Jika indeks spasial terpasang, hanya kandidat dari indeks yang diperiksa.
+    def query(self, rect):
+        if self.index is not None:
+            return self.index.query(rect)
+        return [s for s in self.shapes if s.bbox is not None and bbox_intersects(s.bbox, rect)]
+
+    def __iter__(self):
+        return iter(self.shapes)
+
+    def __len__(self):
+        return len(self.shapes)
+
+    def __reversed__(self):
+        return reversed(self.shapes)
+
+
+# --- Fungsi Pembuat Geometri ---
+# Fungsi untuk mendapatkan 4 titik sudut dari sebuah persegi panjang.
+def rect_corners(x1, y1, x2, y2):
+    return [(min(x1,x2), min(y1,y2)), (max(x1,x2), min(y1,y2)),
+            (max(x1,x2), max(y1,y2)), (min(x1,x2), max(y1,y2))]
+
+# Fungsi untuk mensimulasikan elips sebagai poligon dengan jumlah sisi tetap.
+# Objek elips baru disimpan secara analitik (lihat ellipse_shape); fungsi ini tetap ada
+# untuk kode yang membutuhkan poligon dengan jumlah sisi tertentu.
+def ellipse_points(x1, y1, x2, y2, num_segments=60):
+    center_x, center_y = (x1 + x2) / 2, (y1 + y2) / 2
+    radius_x, radius_y = abs(x2 - x1) / 2, abs(y2 - y1) / 2
+    if radius_x == 0: radius_x = 0.01 # Hindari pembagian dengan nol
+    if radius_y == 0: radius_y = 0.01 # Hindari pembagian dengan nol
+    points = []
+    # Hitung posisi titik-titik di sekeliling elips.
+    for i in range(num_segments + 1):
+        angle = (i / num_segments) * 2 * math.pi
+        points.append((center_x + radius_x * math.cos(angle),
+                       center_y + radius_y * math.sin(angle)))
+    return points
+
+# Fungsi untuk membuat objek elips analitik dari dua titik sudut bounding box-nya.
+def ellipse_shape(x1, y1, x2, y2, color, width, fill=False):
+    return Shape('ellipse', None, color, width, fill, ellipse=ellipse.from_bbox(x1, y1, x2, y2))
+
+# Fungsi untuk menghitung bounding box (xmin, ymin, xmax, ymax) dari sekumpulan titik.
+# Titik bisa berupa list tuple maupun array NumPy (N, 2).
+def points_bbox(points):
+    return affine.bbox(points)
+
+# Fungsi untuk mengecek apakah dua bounding box saling bersinggungan.
+def bbox_intersects(a, b):
+    # Jika salah satu bounding box sepenuhnya di kiri, kanan, atas, atau bawah yang
+    # lain, maka tidak ada persinggungan.
+    return not (a[2] < b[0] or a[0] > b[2] or a[3] < b[1] or a[1] > b[3])
+
+# Fungsi sederhana untuk mengecek apakah sebuah titik ada di dalam persegi panjang.
+def is_point_in_rect(point, rect):
+    px, py = point; rx1, ry1, rx2, ry2 = rect
+    return rx1 <= px <= rx2 and ry1 <= py <= ry2
+
+# Fungsi ini mengecek apakah sebuah objek (berdasarkan bounding box-nya)
+# bersinggungan dengan area window yang diberikan.
+def object_intersects_window(shape, window):
+    # Jika objek tidak punya titik (misalnya, setelah gagal di-clip), anggap tidak bersinggungan.
+    bbox = shape.bbox
+    if bbox is None:
+        return False
+    return bbox_intersects(bbox, window)
@@ -0,0 +1,250 @@
+# --- Penyimpanan dan Pemuatan Adegan ---
+# Format biner berversi untuk menyimpan adegan secara ringkas, serta impor/ekspor JSON
+# untuk pertukaran data. Tidak bergantung pada tkinter; memakai NumPy jika tersedia.
+#
+# Tata letak file biner (semua angka little-endian):
+#   header       : magic 'DRW2', versi (u16), cadangan (u16), jumlah objek (u32),
+#                  jumlah gaya (u32), jumlah titik (u64)
+#   tabel gaya   : setiap gaya = ketebalan (f64), isi (u8), warna (panjang u8 + teks
+#                  UTF-8); versi 1 menyimpan dua warna (warna tampil dan warna asli)
+#   rekaman objek: 64 byte per objek = jenis (u8), flag (u8), indeks gaya (u32),
+#                  indeks titik pertama (u64), jumlah titik (u32), sudut rotasi (f64),
+#                  bounding box (4 x f64)
+#   koordinat    : satu array float64 [x0, y0, x1, y1, ...] yang bersambung, dimulai
+#                  pada offset kelipatan 8
+# Elips analitik disimpan sebagai tiga "titik" (cx, cy), (rx, ry), (theta, 0) dengan
+# flag FLAG_ELLIPSE. Warna yang disimpan (juga 'color' di JSON) selalu warna asli objek;
+# sorotan window hanya tampilan dan tidak ikut disimpan.
+#
+# Pemuatan memakai mmap: hanya header, tabel gaya, dan rekaman objek yang dibaca.
+# Titik setiap objek adalah potongan (view) dari file yang baru dibaca dari disk saat
+# objek digambar atau diedit, dan bounding box dari rekaman membuat indeks spasial bisa
+# dibangun tanpa menyentuh koordinat.
+#
+# Karena objek hasil pemuatan masih membaca file lewat mmap, penyimpanan tidak pernah
+# menimpa file di tempat: isi baru ditulis ke file sementara di direktori yang sama lalu
+# dipasang dengan os.replace (lihat replacing_file), dan file lama utuh jika penyimpanan
+# gagal di tengah jalan. Di POSIX, menyimpan ke file yang sedang dibuka aman: mmap tetap
+# membaca isi lama. Di Windows, file yang masih dipetakan tidak bisa diganti; penyimpanan
+# gagal dengan PermissionError (file lama tetap utuh) dan adegan harus disimpan ke file lain.
+import json
+import mmap
+import os
+import struct
+import sys
+import tempfile
+from array import array
+from contextlib import contextmanager
+
+import affine
+from scene import Shape
+from store import LazyPoints
+
+# Penanda file dan versi format.
+MAGIC = b'DRW2'
+VERSION = 2
+# Kode jenis objek.
+TYPE_CODES = {'point': 0, 'line': 1, 'rectangle': 2, 'ellipse': 3}
+TYPE_NAMES = {code: name for name, code in TYPE_CODES.items()}
+# Flag rekaman objek.
+FLAG_ELLIPSE = 1
+
+_HEADER = struct.Struct('<4sHHIIQ')
+_STYLE = struct.Struct('<dB')
+_RECORD = struct.Struct('<BBxxIQIxxxxd4d')
+
+
+# --- Penulisan File Atomik ---
+# Membuka file sementara di direktori 'path' untuk ditulis, lalu menggantikan 'path'
+# dengannya setelah blok 'with' selesai tanpa error. File lama (yang mungkin masih
+# dipetakan lewat mmap oleh objek-objek adegan) tidak pernah dipotong; di POSIX mmap tetap
+# membaca isi lamanya sampai dilepas. Windows menolak mengganti file yang masih dipetakan
+# (juga lewat titik di riwayat undo), jadi di sana os.replace gagal dengan PermissionError.
+@contextmanager
+def replacing_file(path, mode='wb', **kwargs):
+    path = os.fspath(path)
+    directory, name = os.path.split(os.path.abspath(path))
+    fd, temp_path = tempfile.mkstemp(prefix=f".{name}.", suffix='.tmp', dir=directory)
+    try:
+        with os.fdopen(fd, mode, **kwargs) as f:
+            yield f
+        # mkstemp membuat file dengan izin 0600; pakai izin file lama, atau izin default.
+        try:
+            permissions = os.stat(path).st_mode & 0o777
+        except FileNotFoundError:
+            umask = os.umask(0)
+            os.umask(umask)
+            permissions = 0o666 & ~umask
+        os.chmod(temp_path, permissions)
+        try:
+            os.replace(temp_path, path)
+        except PermissionError as e:
+            if os.name != 'nt': raise
+            raise PermissionError(e.errno, "file sedang dibuka oleh aplikasi dan tidak bisa "
+                                  "ditimpa di Windows; simpan ke file lain", path) from e
+    except BaseException:
+        try:
+            os.unlink(temp_path)
+        except FileNotFoundError:
+            pass
+        raise
+
+
+# --- Format Biner ---
+# Menyimpan objek-objek ke file biner. Geometri disimpan dalam koordinat nyata
+# (matriks tertunda sudah diterapkan) dan gaya yang sama hanya disimpan sekali. Warna
+# yang disimpan adalah warna asli, bukan warna sorotan window yang sedang tampil.
+def save_binary(shapes, path):
+    shapes = list(shapes)
+    styles, style_index = [], {}
+    records = []
+    parts = []
+    total = 0
+    for shape in shapes:
+        style = (shape.width_unclamped, bool(shape.fill), shape.original_color)
+        if style not in style_index:
+            style_index[style] = len(styles)
+            styles.append(style)
+        flags = 0
+        params = shape.ellipse
+        if params is not None:
+            flags |= FLAG_ELLIPSE
+            cx, cy, rx, ry, theta = params
+            points = [(cx, cy), (rx, ry), (theta, 0.0)]
+        else:
+            points = shape.points
+        bbox = shape.bbox or (0.0, 0.0, 0.0, 0.0)
+        records.append(_RECORD.pack(TYPE_CODES[shape.type], flags, style_index[style], total,
+                                    len(points), shape.rotation_angle, *bbox))
+        parts.append(points)
+        total += len(points)
+
+    with replacing_file(path, 'wb') as f:
+        f.write(_HEADER.pack(MAGIC, VERSION, 0, len(shapes), len(styles), total))
+        for width, fill, color in styles:
+            data = color.encode('utf-8')
+            f.write(_STYLE.pack(width, fill) + struct.pack('<B', len(data)) + data)
+        for record in records: f.write(record)
+        # Koordinat dimulai pada offset kelipatan 8 agar bisa dipetakan sebagai float64.
+        f.write(b'\0' * (-f.tell() % 8))
+        for points in parts:
+            if affine.is_array(points):
+                f.write(affine.np.ascontiguousarray(points, dtype='<f8').tobytes())
+            else:
+                coords = array('d', affine.flatten(points))
+                if sys.byteorder != 'little': coords.byteswap()
+                f.write(coords.tobytes())
+
+# Memuat objek-objek dari file biner lewat mmap. Mengembalikan list Shape. File yang
+# rusak atau terpotong menghasilkan ValueError.
+def load_binary(path):
+    with open(path, 'rb') as f:
+        size = f.seek(0, 2)
+        if size == 0: raise ValueError(f"file adegan kosong: {path!r}")
+        if size < _HEADER.size: raise ValueError(f"bukan file adegan: {path!r}")
+        data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    try:
+        return _read_binary(data, size, path)
+    except (struct.error, IndexError, KeyError, UnicodeDecodeError) as e:
+        raise ValueError(f"file adegan rusak: {path!r}") from e
+
+# Membaca isi file biner yang sudah dipetakan ke 'data' (berukuran 'size' byte).
+def _read_binary(data, size, path):
+    magic, version, _, shape_count, style_count, total = _HEADER.unpack_from(data, 0)
+    if magic != MAGIC: raise ValueError(f"bukan file adegan: {path!r}")
+    if version > VERSION: raise ValueError(f"versi format {version} tidak didukung")
+    offset = _HEADER.size
+    # Tabel gaya. Teks yang melewati akhir file berarti file terpotong.
+    styles = []
+    for _ in range(style_count):
+        width, fill = _STYLE.unpack_from(data, offset)
+        offset += _STYLE.size
+        texts = []
+        # Versi 1 menyimpan warna tampil lalu warna asli; hanya warna asli yang dipakai.
+        for _ in range(2 if version == 1 else 1):
+            length = data[offset]
+            if offset + 1 + length > size: raise ValueError(f"file adegan terpotong: {path!r}")
+            texts.append(data[offset + 1:offset + 1 + length].decode('utf-8'))
+            offset += 1 + length
+        styles.append((width, bool(fill), texts[-1]))
+    records_offset = offset
+    coords_offset = records_offset + shape_count * _RECORD.size
+    coords_offset += -coords_offset % 8
+    if coords_offset + total * 16 > size: raise ValueError(f"file adegan terpotong: {path!r}")
+    # Array koordinat dipetakan langsung dari file, tanpa disalin.
+    if affine.HAVE_NUMPY:
+        coords = affine.np.frombuffer(data, dtype='<f8', count=total * 2,
+                                      offset=coords_offset).reshape(-1, 2)
+    else:
+        coords = memoryview(data)[coords_offset:coords_offset + total * 16].cast('d')
+        if sys.byteorder != 'little': coords = array('d', coords); coords.byteswap()
+    shapes = []
+    for i in range(shape_count):
+        (code, flags, style, start, count, rotation_angle,
+         xmin, ymin, xmax, ymax) = _RECORD.unpack_from(data, records_offset + i * _RECORD.size)
+        # Potongan NumPy di luar array tidak menghasilkan error, jadi batasnya dicek di sini.
+        if start + count > total or (flags & FLAG_ELLIPSE and count < 3):
+            raise ValueError(f"rekaman objek {i} rusak: {path!r}")
+        width, fill, color = styles[style]
+        if flags & FLAG_ELLIPSE:
+            if affine.HAVE_NUMPY: values = coords[start:start + 3].ravel().tolist()
+            else: values = list(coords[start * 2:start * 2 + 6])
+            shape = Shape(TYPE_NAMES[code], None, color, width, fill, rotation_angle,
+                          ellipse=tuple(values[:5]))
+        else:
+            if affine.HAVE_NUMPY: points = coords[start:start + count]
+            else: points = LazyPoints(coords, start, count)
+            # Bounding box dari rekaman: indeks spasial tidak perlu membaca koordinat.
+            shape = Shape(TYPE_NAMES[code], points, color, width, fill, rotation_angle,
+                          base_bbox=(xmin, ymin, xmax, ymax) if count else None)
+        shapes.append(shape)
+    return shapes
+
+
+# --- Format JSON ---
+# Mengubah satu objek menjadi dictionary yang bisa ditulis sebagai JSON (dengan warna
+# asli, tanpa sorotan window).
+def shape_to_dict(shape):
+    item = {'type': shape.type, 'color': shape.original_color, 'width': shape.width_unclamped,
+            'fill': bool(shape.fill), 'rotation_angle': shape.rotation_angle}
+    if shape.ellipse is not None: item['ellipse'] = list(shape.ellipse)
+    else: item['points'] = [list(p) for p in affine.as_list(shape.points)]
+    return item
+
+# Membuat objek dari dictionary hasil shape_to_dict(). File versi 1 juga menyimpan
+# 'original_color'; jika ada, itulah warna objek.
+def shape_from_dict(item):
+    ellipse_params = item.get('ellipse')
+    points = [tuple(p) for p in item.get('points', ())]
+    color = item.get('original_color') or item['color']
+    return Shape(item['type'], None if ellipse_params else points, color, item['width'],
+                 item.get('fill', False), item.get('rotation_angle', 0.0),
+                 ellipse=tuple(ellipse_params) if ellipse_params else None)
+
+# Menyimpan objek-objek sebagai JSON.
+def save_json(shapes, path):
+    with replacing_file(path, 'w', encoding='utf-8') as f:
+        json.dump({'format': 'drawingapp2d', 'version': VERSION,
+                   'shapes': [shape_to_dict(shape) for shape in shapes]}, f)
+
+# Memuat objek-objek dari file JSON. Mengembalikan list Shape. JSON yang tidak valid
+# atau tidak sesuai skema menghasilkan ValueError.
+def load_json(path):
+    with open(path, encoding='utf-8') as f:
+        document = json.load(f)
+    try:
+        return [shape_from_dict(item) for item in document['shapes']]
+    except (KeyError, TypeError, AttributeError) as e:
+        raise ValueError(f"isi file adegan JSON tidak valid: {path!r}") from e
+
+
+# --- Pemilihan Format dari Ekstensi ---
+# Menyimpan objek-objek; file berakhiran .json ditulis sebagai JSON, lainnya biner.
+def save(shapes, path):
+    if str(path).lower().endswith('.json'): save_json(shapes, path)
+    else: save_binary(shapes, path)
+
+# Memuat objek-objek dari file JSON atau biner sesuai ekstensinya.
+def load(path):
+    if str(path).lower().endswith('.json'): return load_json(path)
+    return load_binary(path)
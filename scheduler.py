@@ -0,0 +1,67 @@
+# --- Penjadwal Render Berbatas Frame Rate ---
+# Event <B1-Motion> dari mouse dengan polling tinggi bisa datang jauh lebih cepat daripada
+# kemampuan kanvas menggambar. Penjadwal ini hanya menandai bahwa tampilan kotor lalu
+# menjadwalkan satu flush lewat root.after/after_idle; permintaan berikutnya sebelum
+# flush terjadi digabung ke flush yang sama. Dengan begitu render terjadi paling banyak
+# sekali per frame sesuai target FPS.
+# Modul ini tidak mengimpor tkinter; 'root' cukup menyediakan after, after_idle,
+# dan after_cancel seperti tk.Tk.
+import time
+
+# Target frame per detik default.
+DEFAULT_FPS = 60
+
+
+# --- Kelas RenderScheduler ---
+class RenderScheduler:
+    def __init__(self, root, flush, fps=DEFAULT_FPS):
+        self.root = root
+        # Fungsi yang dipanggil sekali per frame untuk menggambar.
+        self._flush = flush
+        self.fps = fps
+        # ID callback after yang sedang menunggu (None jika tidak ada).
+        self._pending_id = None
+        # Waktu (detik, monotonic) flush terakhir.
+        self._last_flush = 0.0
+
+    @property
+    def fps(self):
+        return self._fps
+
+    @fps.setter
+    def fps(self, value):
+        if value <= 0: raise ValueError("fps harus lebih besar dari 0")
+        self._fps = value
+        self._interval = 1.0 / value
+
+    # Mengecek apakah ada flush yang sedang dijadwalkan.
+    def is_pending(self):
+        return self._pending_id is not None
+
+    # Menandai tampilan kotor. Jika belum ada flush terjadwal, jadwalkan satu: segera
+    # (saat idle) jika frame sebelumnya sudah cukup lama, atau pada awal frame berikutnya.
+    def request(self):
+        if self._pending_id is not None: return
+        wait = self._last_flush + self._interval - time.monotonic()
+        if wait <= 0:
+            self._pending_id = self.root.after_idle(self._run)
+        else:
+            self._pending_id = self.root.after(max(1, int(wait * 1000)), self._run)
+
+    # Menjalankan flush sekarang juga (misalnya saat mouse dilepas) dan membatalkan
+    # flush yang masih terjadwal.
+    def flush_now(self):
+        self.cancel()
+        self._run()
+
+    # Membatalkan flush yang terjadwal.
+    def cancel(self):
+        if self._pending_id is not None:
+            self.root.after_cancel(self._pending_id)
+            self._pending_id = None
+
+    # Callback yang dipanggil oleh event loop Tk.
+    def _run(self):
+        self._pending_id = None
+        self._last_flush = time.monotonic()
+        self._flush()
@@ -0,0 +1,92 @@
+# --- Penyederhanaan Polyline (Ramer-Douglas-Peucker) ---
+# Goresan pensil merekam satu titik untuk setiap event gerakan mouse, padahal sebagian
+# besar titik itu nyaris segaris. Algoritma Ramer-Douglas-Peucker membuang titik yang
+# jaraknya ke garis penyederhanaan tidak melebihi 'tolerance' piksel, sehingga bentuk
+# goresan tetap sama secara visual dengan jumlah titik yang jauh lebih sedikit.
+# Tidak bergantung pada tkinter; memakai NumPy jika tersedia.
+import math
+
+import affine
+
+# Toleransi penyederhanaan goresan default (dalam piksel).
+DEFAULT_TOLERANCE = 1.0
+# Jumlah titik minimum untuk memakai versi NumPy. Untuk polyline pendek, biaya per
+# iterasi NumPy lebih besar daripada perulangan Python biasa.
+NUMPY_MIN_POINTS = 1000
+
+
+# Menghitung jarak titik (px, py) ke segmen (ax, ay)-(bx, by).
+def point_segment_distance(px, py, ax, ay, bx, by):
+    dx, dy = bx - ax, by - ay
+    length_sq = dx * dx + dy * dy
+    if length_sq == 0: return math.hypot(px - ax, py - ay)
+    t = max(0.0, min(1.0, ((px - ax) * dx + (py - ay) * dy) / length_sq))
+    return math.hypot(px - (ax + t * dx), py - (ay + t * dy))
+
+# Menyederhanakan polyline dengan algoritma Ramer-Douglas-Peucker (versi iteratif agar
+# goresan yang sangat panjang tidak melampaui batas rekursi). Titik pertama dan terakhir
+# selalu dipertahankan. Hasilnya bertipe sama dengan masukan (list tuple atau array).
+def simplify_rdp(points, tolerance=DEFAULT_TOLERANCE):
+    count = len(points)
+    if count < 3 or tolerance <= 0: return points
+    if affine.HAVE_NUMPY and count >= NUMPY_MIN_POINTS:
+        keep = _rdp_mask_numpy(affine.as_array(points), tolerance)
+        if affine.is_array(points): return points[keep]
+        return [p for p, k in zip(points, keep.tolist()) if k]
+    source = points
+    if affine.is_array(points): points = affine.as_list(points)
+    keep = [False] * count
+    keep[0] = keep[-1] = True
+    stack = [(0, count - 1)]
+    while stack:
+        first, last = stack.pop()
+        ax, ay = points[first]; bx, by = points[last]
+        dx, dy = bx - ax, by - ay
+        length_sq = dx * dx + dy * dy
+        # Cari titik di antara 'first' dan 'last' yang paling jauh dari segmen (jarak
+        # kuadrat dihitung langsung di sini agar tidak ada pemanggilan fungsi per titik).
+        max_dist, index = -1.0, first
+        for i in range(first + 1, last):
+            px, py = points[i]
+            ex, ey = px - ax, py - ay
+            if length_sq:
+                t = (ex * dx + ey * dy) / length_sq
+                if t > 1.0: ex, ey = px - bx, py - by
+                elif t > 0.0: ex, ey = ex - t * dx, ey - t * dy
+            dist = ex * ex + ey * ey
+            if dist > max_dist: max_dist, index = dist, i
+        # Jika titik terjauh melebihi toleransi, pertahankan dan pecah rentangnya.
+        if max_dist > tolerance * tolerance:
+            keep[index] = True
+            stack.append((first, index))
+            stack.append((index, last))
+    if affine.is_array(source): return source[affine.np.array(keep)]
+    return [p for p, k in zip(points, keep) if k]
+
+# Versi NumPy: jarak semua titik dalam satu rentang dihitung sekaligus.
+def _rdp_mask_numpy(pts, tolerance):
+    np = affine.np
+    count = len(pts)
+    keep = np.zeros(count, dtype=bool)
+    keep[0] = keep[-1] = True
+    stack = [(0, count - 1)]
+    while stack:
+        first, last = stack.pop()
+        if last - first < 2: continue
+        a, b = pts[first], pts[last]
+        inner = pts[first + 1:last]
+        ab = b - a
+        length_sq = float(ab @ ab)
+        if length_sq == 0:
+            dist = np.hypot(inner[:, 0] - a[0], inner[:, 1] - a[1])
+        else:
+            t = np.clip(((inner - a) @ ab) / length_sq, 0.0, 1.0)
+            proj = a + t[:, None] * ab
+            dist = np.hypot(inner[:, 0] - proj[:, 0], inner[:, 1] - proj[:, 1])
+        index = int(dist.argmax())
+        if dist[index] > tolerance:
+            index += first + 1
+            keep[index] = True
+            stack.append((first, index))
+            stack.append((index, last))
+    return keep
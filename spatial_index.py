@@ -0,0 +1,109 @@
+# --- Indeks Spasial Grid Seragam ---
+# Indeks ini membagi bidang gambar menjadi sel-sel persegi berukuran tetap. Setiap objek
+# didaftarkan ke semua sel yang disentuh bounding box-nya, sehingga query window/clip
+# hanya perlu memeriksa objek di sel-sel yang ditutupi window, bukan seluruh adegan.
+# Indeks mendengarkan event Scene dan diperbarui secara inkremental ketika objek
+# ditambah, dihapus, atau geometrinya berubah (translasi, rotasi, skala, clipping).
+import math
+
+from scene import bbox_intersects
+
+# Ukuran sisi sel grid default (dalam piksel).
+DEFAULT_CELL_SIZE = 64
+# Objek yang menyentuh lebih dari jumlah sel ini disimpan di daftar terpisah agar
+# satu objek raksasa tidak memenuhi ribuan sel.
+MAX_CELLS_PER_SHAPE = 256
+
+
+# --- Kelas GridIndex ---
+class GridIndex:
+    def __init__(self, cell_size=DEFAULT_CELL_SIZE):
+        self.cell_size = cell_size
+        # Pemetaan (kolom, baris) -> set objek yang bounding box-nya menyentuh sel tersebut.
+        self._cells = {}
+        # Pemetaan objek -> rentang sel (c0, r0, c1, r1) tempat objek terdaftar.
+        self._ranges = {}
+        # Objek berukuran sangat besar yang selalu ikut diperiksa pada setiap query.
+        self._large = set()
+
+    # Memasang indeks ke sebuah Scene: mengisi indeks dengan objek yang sudah ada
+    # lalu mendengarkan perubahan berikutnya.
+    def attach(self, scene):
+        for shape in scene: self.insert(shape)
+        scene.subscribe(self._on_scene_event)
+        scene.index = self
+        return self
+
+    # Pendengar perubahan Scene.
+    def _on_scene_event(self, event, shape):
+        if event == 'added': self.insert(shape)
+        elif event == 'removed': self.remove(shape)
+        elif event == 'geometry': self.update(shape)
+
+    # Menghitung rentang sel yang ditutupi sebuah bounding box.
+    def _cell_range(self, bbox):
+        size = self.cell_size
+        return (math.floor(bbox[0] / size), math.floor(bbox[1] / size),
+                math.floor(bbox[2] / size), math.floor(bbox[3] / size))
+
+    # Mendaftarkan objek ke sel-sel yang disentuhnya.
+    def insert(self, shape):
+        bbox = shape.bbox
+        if bbox is None: return
+        c0, r0, c1, r1 = cell_range = self._cell_range(bbox)
+        self._ranges[shape] = cell_range
+        if (c1 - c0 + 1) * (r1 - r0 + 1) > MAX_CELLS_PER_SHAPE:
+            self._large.add(shape)
+            return
+        cells = self._cells
+        for col in range(c0, c1 + 1):
+            for row in range(r0, r1 + 1):
+                bucket = cells.get((col, row))
+                if bucket is None: cells[(col, row)] = bucket = set()
+                bucket.add(shape)
+
+    # Mengeluarkan objek dari indeks.
+    def remove(self, shape):
+        cell_range = self._ranges.pop(shape, None)
+        if cell_range is None: return
+        if shape in self._large:
+            self._large.discard(shape)
+            return
+        c0, r0, c1, r1 = cell_range
+        cells = self._cells
+        for col in range(c0, c1 + 1):
+            for row in range(r0, r1 + 1):
+                bucket = cells.get((col, row))
+                if bucket is None: continue
+                bucket.discard(shape)
+                if not bucket: del cells[(col, row)]
+
+    # Memperbarui posisi objek setelah geometrinya berubah. Jika objek masih berada
+    # di sel yang sama (misalnya pergeseran kecil), tidak ada sel yang disentuh.
+    def update(self, shape):
+        bbox = shape.bbox
+        new_range = self._cell_range(bbox) if bbox is not None else None
+        if new_range is not None and self._ranges.get(shape) == new_range: return
+        self.remove(shape)
+        self.insert(shape)
+
+    # Mengembalikan list objek yang bounding box-nya bersinggungan dengan 'rect'.
+    def query(self, rect):
+        c0, r0, c1, r1 = self._cell_range(rect)
+        cells = self._cells
+        candidates = set(self._large)
+        # Jika window menutupi lebih banyak sel daripada sel yang terisi, lebih murah
+        # memeriksa sel yang terisi saja.
+        if (c1 - c0 + 1) * (r1 - r0 + 1) > len(cells):
+            for (col, row), bucket in cells.items():
+                if c0 <= col <= c1 and r0 <= row <= r1: candidates.update(bucket)
+        else:
+            for col in range(c0, c1 + 1):
+                for row in range(r0, r1 + 1):
+                    bucket = cells.get((col, row))
+                    if bucket: candidates.update(bucket)
+        # Saring kandidat dengan bounding box yang sebenarnya.
+        return [s for s in candidates if bbox_intersects(s.bbox, rect)]
+
+    def __len__(self):
+        return len(self._ranges)
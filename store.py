@@ -0,0 +1,133 @@
+# --- Penyimpanan Ringkas Titik dan Gaya ---
+# Titik sumber objek yang dibuat dari list tuple (goresan pensil, hasil clipping, JSON,
+# generator) memakan lebih dari 100 byte per titik: satu tuple dan dua objek float untuk
+# setiap titik. Modul ini menyediakan penyimpanan ringkas untuk adegan besar:
+#   - pack_points() menyalin titik-titik banyak objek sekaligus ke satu buffer koordinat
+#     float64 bersama (array NumPy (N, 2), atau array('d') tanpa NumPy). Setiap objek
+#     memegang potongan (view) buffer itu dengan offset dan panjangnya sendiri, jadi
+#     kode yang membaca shape.points tetap bekerja tanpa perubahan (16 byte per titik).
+#   - Gaya objek (warna, warna asli, ketebalan, isi) disimpan sebagai flyweight: objek
+#     dengan gaya yang sama berbagi satu objek Style (lihat intern_style).
+# Buffer tidak pernah diubah di tempat. Objek yang titiknya diganti (bake, clipping)
+# memegang titik baru; buffer lama dilepas setelah tidak ada objek yang memakainya.
+# Tidak bergantung pada tkinter.
+import weakref
+from array import array
+from itertools import chain
+
+import affine
+
+# Perkiraan memori satu titik dalam penyimpanan ringkas (dua float64).
+COMPACT_POINT_BYTES = 16
+
+
+# --- Gaya (Flyweight) ---
+# Kombinasi gaya yang tidak bisa diubah. Jangan membuat Style langsung; pakai
+# intern_style() atau replace() agar gaya yang sama selalu berupa objek yang sama.
+class Style:
+    __slots__ = ('color', 'original_color', 'width', 'fill', '__weakref__')
+
+    def __init__(self, color, original_color, width, fill):
+        self.color = color
+        self.original_color = original_color
+        self.width = width
+        self.fill = fill
+
+    # Gaya yang sama dengan beberapa atribut diganti (juga hasil intern).
+    def replace(self, color=None, original_color=None, width=None, fill=None):
+        return intern_style(self.color if color is None else color,
+                            self.original_color if original_color is None else original_color,
+                            self.width if width is None else width,
+                            self.fill if fill is None else fill)
+
+    # Hasil pickle di-intern ulang saat dimuat.
+    def __reduce__(self):
+        return intern_style, (self.color, self.original_color, self.width, self.fill)
+
+    def __repr__(self):
+        return (f"Style({self.color!r}, {self.original_color!r}, width={self.width!r}, "
+                f"fill={self.fill!r})")
+
+# Tabel gaya yang sedang dipakai. Referensinya lemah: gaya yang tidak lagi dipakai objek
+# mana pun (misalnya ketebalan hasil skala yang sudah di-undo) otomatis keluar dari tabel.
+_styles = weakref.WeakValueDictionary()
+
+# Mengembalikan objek Style bersama untuk kombinasi gaya ini.
+def intern_style(color, original_color, width, fill):
+    key = (color, original_color, width, fill)
+    style = _styles.get(key)
+    if style is None:
+        style = _styles[key] = Style(color, original_color, width, fill)
+    return style
+
+# Jumlah gaya berbeda yang sedang dipakai.
+def style_count():
+    return len(_styles)
+
+
+# --- Titik Malas Tanpa NumPy ---
+# Urutan titik (x, y) yang dibaca langsung dari buffer koordinat datar (array('d') atau
+# memoryview); tuple baru dibuat hanya saat titik diakses. Dipakai sebagai pengganti
+# potongan array NumPy jika NumPy tidak ada.
+class LazyPoints:
+    __slots__ = ('_coords', '_start', '_count')
+
+    def __init__(self, coords, start, count):
+        self._coords = coords
+        self._start = start
+        self._count = count
+
+    def __len__(self):
+        return self._count
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(self._count))]
+        if index < 0: index += self._count
+        if not 0 <= index < self._count: raise IndexError(index)
+        i = (self._start + index) * 2
+        return (self._coords[i], self._coords[i + 1])
+
+    def __iter__(self):
+        coords = self._coords
+        for i in range(self._start * 2, (self._start + self._count) * 2, 2):
+            yield (coords[i], coords[i + 1])
+
+    # Salinan sebagai list tuple biasa (sama seperti list.copy()).
+    def copy(self):
+        return list(self)
+
+
+# --- Buffer Koordinat Bersama ---
+# Mengecek apakah titik-titik sudah disimpan ringkas (array NumPy atau LazyPoints).
+def is_compact(points):
+    return points is None or affine.is_array(points) or isinstance(points, LazyPoints)
+
+# Perkiraan memori titik-titik (byte).
+def points_nbytes(points, list_point_bytes):
+    if points is None: return 0
+    if affine.is_array(points): return points.nbytes
+    if isinstance(points, LazyPoints): return len(points) * COMPACT_POINT_BYTES
+    return len(points) * list_point_bytes
+
+# Menyalin beberapa kumpulan titik ke satu buffer koordinat bersama. Mengembalikan list
+# potongan buffer (satu per kumpulan, dengan urutan yang sama).
+def pack_points(point_lists):
+    counts = [len(points) for points in point_lists]
+    total = sum(counts)
+    flat = chain.from_iterable(chain.from_iterable(point_lists))
+    views = []
+    start = 0
+    if affine.HAVE_NUMPY:
+        coords = affine.np.fromiter(flat, dtype=float, count=total * 2).reshape(-1, 2)
+        # Buffer bersama hanya-baca, sama seperti titik yang dimuat lewat mmap.
+        coords.flags.writeable = False
+        for count in counts:
+            views.append(coords[start:start + count])
+            start += count
+    else:
+        coords = array('d', flat)
+        for count in counts:
+            views.append(LazyPoints(coords, start, count))
+            start += count
+    return views
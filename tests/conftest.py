@@ -0,0 +1,13 @@
+# --- Konfigurasi Pengujian (pytest) ---
+# Modul aplikasi berada langsung di root repositori, sedangkan kanvas tiruan
+# (stub_tk.py) dan generator adegan sintetis (synthetic.py) dipakai bersama dengan
+# suite benchmark di benchmarks/. Keduanya dimasukkan ke sys.path sekali di sini.
+# Jalankan dari direktori root repositori: python -m pytest tests
+import os
+import sys
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir)
+
+for path in (ROOT, os.path.join(ROOT, 'benchmarks')):
+    path = os.path.abspath(path)
+    if path not in sys.path: sys.path.insert(0, path)
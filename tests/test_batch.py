@@ -0,0 +1,68 @@
+# --- Uji Mode Batch ---
+# Jalankan dari direktori root repositori: python -m pytest tests
+import contextlib
+import io
+import os
+import tempfile
+import unittest
+
+import batch
+import scene_io
+import synthetic
+
+
+class InPlaceBatchTest(unittest.TestCase):
+    # Menjalankan batch.main dengan keluaran pesan yang ditampung.
+    def run_batch(self, inputs, output_dir, jobs):
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output), contextlib.redirect_stderr(output):
+            status = batch.main([inputs, '--clip', '0,0,800,600', '--export', 'drw',
+                                 '-o', output_dir, '-j', str(jobs)])
+        self.assertEqual(status, 0, output.getvalue())
+
+    # Keluaran ditulis ke direktori input yang sama: file input (yang sedang dibaca lewat
+    # mmap) diganti hasilnya tanpa merusak file lain atau menghentikan proses. Hasilnya
+    # harus sama dengan keluaran ke direktori terpisah.
+    def run_in_place(self, jobs):
+        with tempfile.TemporaryDirectory() as directory, tempfile.TemporaryDirectory() as separate:
+            names = [f"a{i}.drw" for i in range(3)]
+            for i, name in enumerate(names):
+                scene_io.save(synthetic.make_shapes(300, 20, seed=i), os.path.join(directory, name))
+            self.run_batch(directory, separate, jobs)
+            self.run_batch(directory, directory, jobs)
+            self.assertEqual(sorted(os.listdir(directory)), names)
+            for name in names:
+                with open(os.path.join(directory, name), 'rb') as a, \
+                        open(os.path.join(separate, name), 'rb') as b:
+                    self.assertEqual(a.read(), b.read())
+                self.assertTrue(scene_io.load(os.path.join(directory, name)))
+
+    def test_single_process(self):
+        self.run_in_place(1)
+
+    def test_worker_processes(self):
+        self.run_in_place(2)
+
+
+class WindowOptionTest(unittest.TestCase):
+    # Sorotan window tidak disimpan di file adegan; tanpa ekspor gambar --window ditolak
+    # alih-alih diabaikan diam-diam.
+    def test_window_requires_image_export(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'a.drw')
+            scene_io.save(synthetic.make_shapes(50, 10, seed=1), path)
+            output = io.StringIO()
+            with contextlib.redirect_stdout(output), contextlib.redirect_stderr(output):
+                for export in ('drw', 'json'):
+                    with self.assertRaises(SystemExit) as raised:
+                        batch.main([path, '--window', '0,0,400,400', '--export', export,
+                                    '-o', directory, '-j', '1'])
+                    self.assertEqual(raised.exception.code, 2)
+                status = batch.main([path, '--window', '0,0,400,400', '--export', 'drw',
+                                     '--export', 'png', '-o', directory, '-j', '1'])
+            self.assertEqual(status, 0, output.getvalue())
+            self.assertTrue(os.path.exists(os.path.join(directory, 'a.png')))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,64 @@
+# --- Uji Menggambar ---
+# Jalankan dari direktori root repositori: python -m pytest tests
+import math
+import unittest
+from types import SimpleNamespace
+
+import affine
+import lod
+from scene import Shape
+from stub_tk import make_stub_app
+
+
+class PencilZoomTest(unittest.TestCase):
+    # Menggambar goresan zig-zag dengan amplitudo 'amplitude' piksel layar pada zoom 'scale'.
+    # Mengembalikan jumlah titik goresan yang disimpan.
+    def draw_zigzag(self, scale, amplitude):
+        app, _ = make_stub_app()
+        app.viewport.scale = scale
+        app.set_tool('Pencil')
+        app._on_mouse_down(SimpleNamespace(x=100, y=100, state=0))
+        for i in range(1, 21):
+            app._on_mouse_move(SimpleNamespace(x=100 + 10 * i, y=100 + amplitude * (i % 2), state=0))
+        app._on_mouse_up(SimpleNamespace(x=300, y=100, state=0))
+        shapes = list(app.scene)
+        self.assertEqual(len(shapes), 1)
+        return len(shapes[0].points)
+
+    # Toleransi penyederhanaan berlaku dalam piksel layar, apa pun zoom-nya: detail 3 piksel
+    # tetap ada dan getaran 0,5 piksel tetap dibuang.
+    def test_tolerance_is_in_screen_pixels(self):
+        for scale in (0.25, 1.0, 10.0):
+            self.assertGreater(self.draw_zigzag(scale, 3), 10, scale)
+            self.assertEqual(self.draw_zigzag(scale, 0.5), 2, scale)
+
+
+class EllipseZoomTest(unittest.TestCase):
+    # Galat terbesar (piksel layar) antara sisi poligon dan lingkaran berjari-jari 'radius'
+    # pada skala 'scale', diukur di titik tengah setiap sisi.
+    def screen_error(self, points, center, radius, scale):
+        points = affine.as_list(points)
+        error = 0.0
+        for (x0, y0), (x1, y1) in zip(points, points[1:] + points[:1]):
+            mx, my = (x0 + x1) / 2, (y0 + y1) / 2
+            error = max(error, radius - math.hypot(mx - center[0], my - center[1]))
+        return error * scale
+
+    # Sisi poligon elips tetap di bawah MAX_SCREEN_ERROR piksel pada zoom besar.
+    def test_zoomed_ellipse_stays_smooth(self):
+        shape = Shape('ellipse', None, 'black', 1, ellipse=(0.0, 0.0, 100.0, 100.0, 0.0))
+        for scale in (1.0, 3.0, 20.0, 100.0):
+            points = lod.render_points(shape, scale)
+            self.assertLessEqual(self.screen_error(points, (0, 0), 100, scale),
+                                 lod.MAX_SCREEN_ERROR, scale)
+
+    # Skala dari matriks objek yang belum di-bake ikut diperhitungkan.
+    def test_scaled_ellipse_stays_smooth(self):
+        shape = Shape('ellipse', None, 'black', 1, ellipse=(0.0, 0.0, 20.0, 20.0, 0.0))
+        shape.apply_transform(affine.scaling(5))
+        points = lod.render_points(shape, 20.0)
+        self.assertLessEqual(self.screen_error(points, (0, 0), 100, 20.0), lod.MAX_SCREEN_ERROR)
+
+
+if __name__ == "__main__":
+    unittest.main()
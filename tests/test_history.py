@@ -0,0 +1,102 @@
+# --- Uji Riwayat Undo/Redo ---
+# Jalankan dari direktori root repositori: python -m pytest tests
+import unittest
+
+import affine
+import history
+import synthetic
+from scene import Scene, Shape
+from stub_tk import make_stub_app
+
+
+# Geometri semua objek adegan (jenis dan titik dalam koordinat nyata), sesuai urutan gambar.
+def snapshot(scene):
+    return [(shape.type, [tuple(p) for p in affine.as_list(shape.points)]) for shape in scene]
+
+
+class BudgetTest(unittest.TestCase):
+    # Entri tertua dibuang saat perkiraan memori melebihi anggaran.
+    def test_oldest_entries_are_dropped(self):
+        scene = Scene()
+        shapes = [Shape('line', [(i, 0), (i, 100)] * 50, 'black', 1) for i in range(50)]
+        cost = history.shape_nbytes(shapes[0])
+        log = history.History(scene, budget=cost * 10)
+        for shape in shapes:
+            scene.add(shape)
+            log.record_add(shape)
+        self.assertEqual(len(log), 10)
+        self.assertLessEqual(log.memory, log.budget)
+        # Yang tersisa adalah sepuluh penambahan terakhir.
+        for _ in range(10): log.undo()
+        self.assertFalse(log.can_undo())
+        self.assertEqual(list(scene), shapes[:40])
+
+    # Entri terbaru selalu disimpan walaupun sendirian sudah melebihi anggaran.
+    def test_newest_entry_is_always_kept(self):
+        scene = Scene()
+        log = history.History(scene, budget=1)
+        shape = scene.add(Shape('line', [(0, 0), (10, 10)], 'black', 1))
+        log.record_add(shape)
+        self.assertEqual(len(log), 1)
+        log.undo()
+        self.assertEqual(len(scene), 0)
+
+    # Memori entri redo ikut dilepas saat perintah baru dicatat.
+    def test_push_releases_redo_memory(self):
+        scene = Scene()
+        log = history.History(scene)
+        for i in range(3):
+            log.record_add(scene.add(Shape('line', [(i, 0), (i, 10)], 'black', 1)))
+        log.undo()
+        log.undo()
+        log.record_add(scene.add(Shape('line', [(9, 0), (9, 10)], 'black', 1)))
+        self.assertFalse(log.can_redo())
+        self.assertEqual(log.memory, sum(command.nbytes for command in log._undo))
+        log.clear()
+        self.assertEqual((len(log), log.memory), (0, 0))
+
+
+class EditUndoTest(unittest.TestCase):
+    # Clipping lalu undo/redo mengembalikan adegan tepat ke keadaan sebelum/sesudahnya,
+    # termasuk urutan gambar objek yang dipotong dan yang tidak.
+    def test_clipping_undo_redo(self):
+        app, _ = make_stub_app()
+        for shape in synthetic.make_shapes(200, 20, size=(800, 800), seed=4): app.scene.add(shape)
+        before = snapshot(app.scene)
+        app._perform_clipping((200, 200, 600, 600))
+        after = snapshot(app.scene)
+        self.assertNotEqual(after, before)
+        app.undo()
+        self.assertEqual(snapshot(app.scene), before)
+        app.redo()
+        self.assertEqual(snapshot(app.scene), after)
+
+    # Hapus kanvas bisa di-undo sebagai satu entri.
+    def test_clear_canvas_undo(self):
+        app, _ = make_stub_app()
+        for shape in synthetic.make_shapes(50, 10, seed=2): app.scene.add(shape)
+        before = snapshot(app.scene)
+        app.clear_canvas()
+        self.assertEqual(len(app.scene), 0)
+        app.undo()
+        self.assertEqual(snapshot(app.scene), before)
+
+    # Undo transformasi menerapkan matriks invers tanpa menyimpan titik.
+    def test_transform_undo(self):
+        scene = Scene()
+        log = history.History(scene)
+        shape = scene.add(Shape('rectangle', [(0, 0), (10, 0), (10, 10), (0, 10)], 'black', 1))
+        before = snapshot(scene)
+        delta = affine.compose(affine.translation(5, 7), affine.scaling(2))
+        shape.apply_transform(delta)
+        shape.bake()
+        log.record_transform(shape, delta)
+        log.undo()
+        for (_, a), (_, b) in zip(snapshot(scene), before):
+            for p, q in zip(a, b):
+                self.assertAlmostEqual(p[0], q[0])
+                self.assertAlmostEqual(p[1], q[1])
+
+
+if __name__ == "__main__":
+    unittest.main()
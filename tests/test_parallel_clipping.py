@@ -0,0 +1,57 @@
+# --- Uji Clipping Paralel ---
+# Jalankan dari direktori root repositori: python -m pytest tests
+import unittest
+
+import affine
+import clipping
+import parallel_clipping
+import synthetic
+from scene import Scene
+
+
+# Adegan sintetis baru (objek yang sama untuk 'seed' yang sama).
+def make_scene(seed):
+    scene = Scene()
+    for shape in synthetic.make_shapes(400, 30, size=(1000, 1000), seed=seed): scene.add(shape)
+    return scene
+
+
+@unittest.skipUnless(affine.HAVE_NUMPY, "clipping paralel membutuhkan NumPy")
+class ParallelEquivalenceTest(unittest.TestCase):
+    def setUp(self):
+        self.addCleanup(parallel_clipping.shutdown)
+
+    # Membandingkan dua adegan objek demi objek: urutan, jenis, gaya, dan titik.
+    def assertScenesEqual(self, actual, expected):
+        self.assertEqual(len(actual), len(expected))
+        for a, b in zip(actual, expected):
+            self.assertEqual((a.type, a.color, a.width, a.fill), (b.type, b.color, b.width, b.fill))
+            a, b = affine.as_list(a.points), affine.as_list(b.points)
+            self.assertEqual(len(a), len(b))
+            for p, q in zip(a, b):
+                self.assertAlmostEqual(p[0], q[0], places=9)
+                self.assertAlmostEqual(p[1], q[1], places=9)
+
+    # Clipping oleh proses pekerja menghasilkan adegan yang sama dengan clipping biasa,
+    # untuk setiap algoritma clipping garis.
+    def test_parallel_matches_serial(self):
+        window = (250, 250, 750, 750)
+        for algorithm in sorted(clipping.LINE_ALGORITHMS):
+            serial = make_scene(11)
+            clipping.perform_clipping(serial, window, algorithm)
+            parallel = make_scene(11)
+            parallel_clipping.perform_clipping(parallel, window, algorithm, workers=2, threshold=0)
+            self.assertScenesEqual(parallel, serial)
+
+    # Adegan di bawah ambang tetap dipotong di proses yang sama dengan hasil yang sama.
+    def test_small_scene_falls_back_to_serial(self):
+        window = (100, 100, 400, 400)
+        serial = make_scene(12)
+        clipping.perform_clipping(serial, window)
+        fallback = make_scene(12)
+        parallel_clipping.perform_clipping(fallback, window, workers=2)
+        self.assertScenesEqual(fallback, serial)
+
+
+if __name__ == "__main__":
+    unittest.main()
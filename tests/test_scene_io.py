@@ -0,0 +1,165 @@
+# --- Uji Penyimpanan dan Pemuatan Adegan ---
+# Jalankan dari direktori root repositori: python -m pytest tests
+import os
+import struct
+import tempfile
+import unittest
+
+import affine
+import scene_io
+import synthetic
+from scene import Shape, ellipse_shape, rect_corners
+
+
+# Geometri objek yang bisa dibandingkan (titik atau parameter elips).
+def geometry(shapes):
+    return [(s.type, s.ellipse if s.ellipse is not None else [tuple(p) for p in affine.as_list(s.points)])
+            for s in shapes]
+
+
+class LoadThenSaveSamePathTest(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+
+    # Objek hasil load_binary masih membaca file lewat mmap; menyimpannya kembali ke path
+    # yang sama tidak boleh memotong file yang sedang dibaca.
+    def test_binary_round_trip_to_same_path(self):
+        path = os.path.join(self.directory.name, 'adegan.drw')
+        scene_io.save(synthetic.make_shapes(500, 20, seed=3), path)
+        shapes = scene_io.load(path)
+        expected = geometry(shapes)
+        scene_io.save(shapes, path)
+        # Objek lama tetap bisa dibaca, dan file baru berisi adegan yang sama.
+        self.assertEqual(geometry(shapes), expected)
+        self.assertEqual(geometry(scene_io.load(path)), expected)
+        self.assertEqual([f for f in os.listdir(self.directory.name) if f != 'adegan.drw'], [])
+
+    def test_json_round_trip_to_same_path(self):
+        path = os.path.join(self.directory.name, 'adegan.json')
+        scene_io.save(synthetic.make_shapes(100, 20, seed=4), path)
+        shapes = scene_io.load(path)
+        scene_io.save(shapes, path)
+        self.assertEqual(geometry(scene_io.load(path)), geometry(shapes))
+
+
+class RoundTripTest(unittest.TestCase):
+    # Atribut objek yang harus sama setelah disimpan lalu dimuat kembali.
+    def attributes(self, shapes):
+        return [(s.type, s.color, s.width_unclamped, bool(s.fill), s.rotation_angle, s.bbox)
+                for s in shapes]
+
+    # Semua jenis objek, termasuk elips analitik dan objek dengan matriks yang belum di-bake,
+    # dimuat kembali dengan geometri dan gaya yang sama dari kedua format.
+    def test_all_shape_kinds_round_trip(self):
+        shapes = synthetic.make_shapes(200, 20, seed=7)
+        shapes.append(ellipse_shape(10, 20, 110, 70, 'hijau muda', 3, fill=True))
+        transformed = Shape('rectangle', rect_corners(0, 0, 40, 20), 'blue', 2, rotation_angle=0.5)
+        matrix = affine.compose(affine.rotation(0.5, (20, 10)), affine.scaling(3))
+        transformed.apply_transform(matrix)
+        shapes.append(transformed)
+        shapes.append(Shape('line', [], 'black', 1))
+        with tempfile.TemporaryDirectory() as directory:
+            for name in ('adegan.drw', 'adegan.json'):
+                path = os.path.join(directory, name)
+                scene_io.save(shapes, path)
+                loaded = scene_io.load(path)
+                self.assertEqual(len(loaded), len(shapes), name)
+                for a, b in zip(loaded, shapes):
+                    a, b = affine.as_list(a.points), affine.as_list(b.points)
+                    self.assertEqual(len(a), len(b))
+                    for p, q in zip(a, b):
+                        self.assertAlmostEqual(p[0], q[0], places=9)
+                        self.assertAlmostEqual(p[1], q[1], places=9)
+                for a, b in zip(self.attributes(loaded), self.attributes(shapes)):
+                    self.assertEqual(a[:5], b[:5], name)
+                    if b[5] is not None:
+                        for u, v in zip(a[5], b[5]): self.assertAlmostEqual(u, v, places=9)
+                # Elips analitik tetap analitik, bukan poligon.
+                self.assertIsNotNone(loaded[-3].ellipse, name)
+
+    # Gaya yang sama hanya disimpan sekali di tabel gaya file biner.
+    def test_styles_are_shared(self):
+        shapes = [Shape('line', [(i, 0), (i, 10)], 'black', 2) for i in range(100)]
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'adegan.drw')
+            scene_io.save(shapes, path)
+            with open(path, 'rb') as f:
+                header = scene_io._HEADER.unpack(f.read(scene_io._HEADER.size))
+            self.assertEqual(header[3:], (100, 1, 200))
+            self.assertEqual(len(scene_io.load(path)), 100)
+
+
+class CorruptFileTest(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+
+    # Menulis 'data' ke file sementara dan mengembalikan path-nya.
+    def write(self, name, data):
+        path = os.path.join(self.directory.name, name)
+        with open(path, 'wb') as f: f.write(data)
+        return path
+
+    # File biner yang terpotong di mana pun atau rekamannya rusak selalu menghasilkan
+    # ValueError (yang ditangkap open_scene), bukan struct.error atau IndexError.
+    def test_truncated_binary_raises_value_error(self):
+        path = os.path.join(self.directory.name, 'adegan.drw')
+        scene_io.save(synthetic.make_shapes(20, 5, seed=1), path)
+        with open(path, 'rb') as f: data = f.read()
+        for size in range(1, len(data), 7):
+            with self.assertRaises(ValueError, msg=size):
+                scene_io.load(self.write('terpotong.drw', data[:size]))
+
+    def test_bad_record_raises_value_error(self):
+        path = os.path.join(self.directory.name, 'adegan.drw')
+        scene_io.save(synthetic.make_shapes(20, 5, seed=1), path)
+        with open(path, 'rb') as f: data = bytearray(f.read())
+        # Indeks gaya objek pertama dibuat menunjuk ke luar tabel gaya.
+        style_count = scene_io._HEADER.unpack_from(data, 0)[4]
+        offset = scene_io._HEADER.size
+        for _ in range(style_count):
+            offset += scene_io._STYLE.size
+            offset += 1 + data[offset]
+        data[offset + 4:offset + 8] = (1000).to_bytes(4, 'little')
+        with self.assertRaises(ValueError):
+            scene_io.load(self.write('rusak.drw', bytes(data)))
+
+    def test_bad_json_schema_raises_value_error(self):
+        for text in ('{"shapes": 5}', '{"shapes": [{"type": "line"}]}', '[1, 2]', '{"sha'):
+            with self.assertRaises(ValueError, msg=text):
+                scene_io.load(self.write('rusak.json', text.encode('utf-8')))
+
+
+class HighlightColorTest(unittest.TestCase):
+    # Objek yang sedang disorot window disimpan dengan warna aslinya.
+    def test_saved_color_is_original_color(self):
+        with tempfile.TemporaryDirectory() as directory:
+            for name in ('adegan.drw', 'adegan.json'):
+                shapes = synthetic.make_shapes(20, 10, seed=5)
+                originals = [s.original_color for s in shapes]
+                for shape in shapes: shape.color = 'red'
+                path = os.path.join(directory, name)
+                scene_io.save(shapes, path)
+                loaded = scene_io.load(path)
+                self.assertEqual([s.color for s in loaded], originals)
+                self.assertEqual([s.original_color for s in loaded], originals)
+
+    # File versi 1 menyimpan warna tampil dan warna asli; objek dimuat dengan warna asli.
+    def test_version_1_files_load_original_color(self):
+        header = scene_io._HEADER.pack(scene_io.MAGIC, 1, 0, 1, 1, 2)
+        style = scene_io._STYLE.pack(2.0, 0) + b'\x03red' + b'\x04blue'
+        record = scene_io._RECORD.pack(scene_io.TYPE_CODES['line'], 0, 0, 0, 2, 0.0,
+                                       0.0, 0.0, 10.0, 10.0)
+        data = header + style + record
+        data += b'\0' * (-len(data) % 8) + struct.pack('<4d', 0.0, 0.0, 10.0, 10.0)
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'lama.drw')
+            with open(path, 'wb') as f: f.write(data)
+            shape, = scene_io.load(path)
+            self.assertEqual((shape.color, shape.original_color), ('blue', 'blue'))
+            self.assertEqual(geometry([shape]), [('line', [(0.0, 0.0), (10.0, 10.0)])])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,75 @@
+# --- Uji Seleksi Objek ---
+# Memakai kanvas tiruan (stub_tk, lihat conftest.py) sehingga tidak perlu display.
+# Jalankan dari direktori root repositori: python -m pytest tests
+import unittest
+from types import SimpleNamespace
+
+from scene import Shape, rect_corners
+from stub_tk import make_stub_app
+
+
+class SelectionTest(unittest.TestCase):
+    def setUp(self):
+        self.app, self.root = make_stub_app()
+        # Dua persegi yang berjauhan; titik (300, 300) berada di area kosong di antaranya.
+        self.near = self.app.scene.add(Shape('rectangle', rect_corners(10, 10, 50, 50), 'black', 2))
+        self.far = self.app.scene.add(Shape('rectangle', rect_corners(500, 500, 550, 550), 'black', 2))
+        self.app.redraw_all()
+        self.app.set_transform_mode('Select')
+
+    # Klik di area kosong tidak memilih objek terdekat yang jauh dari kursor.
+    def test_click_on_empty_space_selects_nothing(self):
+        self.assertIsNone(self.app._select_object(300, 300))
+        self.assertEqual(self.app.selected_objects, [])
+
+    # Klik tepat di tepi objek memilih objek tersebut.
+    def test_click_on_outline_selects_shape(self):
+        self.assertIs(self.app._select_object(50, 30), self.near)
+        self.assertEqual(self.app.selected_objects, [self.near])
+
+    # Menarik persegi seleksi dari titik (x0, y0) ke (x1, y1) dalam mode Select.
+    def drag_marquee(self, x0, y0, x1, y1, state=0):
+        self.app._on_mouse_down(SimpleNamespace(x=x0, y=y0, state=state))
+        self.assertTrue(self.app.is_drawing_marquee)
+        self.app._on_mouse_move(SimpleNamespace(x=x1, y=y1, state=state))
+        self.app.render_scheduler.flush_now()
+        self.app._on_mouse_up(SimpleNamespace(x=x1, y=y1, state=state))
+        self.assertFalse(self.app.is_drawing_marquee)
+
+    # Klik di area kosong lalu drag memilih objek yang seluruhnya berada di dalam persegi.
+    def test_marquee_from_empty_space(self):
+        self.drag_marquee(300, 300, 600, 600)
+        self.assertEqual(self.app.selected_objects, [self.far])
+        # Dengan Shift, hasil marquee berikutnya ditambahkan ke seleksi.
+        self.drag_marquee(0, 0, 60, 60, state=0x0001)
+        self.assertEqual(set(self.app.selected_objects), {self.near, self.far})
+        # Marquee tanpa Shift yang tidak mengenai objek mengosongkan seleksi.
+        self.drag_marquee(200, 200, 300, 300)
+        self.assertEqual(self.app.selected_objects, [])
+
+
+class ZoomedHitTest(unittest.TestCase):
+    # Klik dengan jarak 'distance' piksel layar dari goresan tipis pada zoom 'scale'.
+    # Mengembalikan objek yang terpilih, atau None.
+    def click_near_stroke(self, scale, distance):
+        app, _ = make_stub_app()
+        line = app.scene.add(Shape('line', [(100, 100), (200, 100)], 'black', 0.1))
+        app.viewport.scale = scale
+        app.redraw_all()
+        app.set_transform_mode('Select')
+        x, y = app.viewport.to_screen(150, 100)
+        app._on_mouse_down(SimpleNamespace(x=x, y=y + distance, state=0))
+        app._on_mouse_up(SimpleNamespace(x=x, y=y + distance, state=0))
+        self.assertIn(app.selected_objects, ([], [line]))
+        return app.selected_objects[0] if app.selected_objects else None
+
+    # Toleransi klik berlaku dalam piksel layar: goresan tipis bisa diklik dari jarak
+    # beberapa piksel pada zoom berapa pun, dan klik yang jauh di layar tidak mengenainya.
+    def test_tolerance_is_in_screen_pixels(self):
+        for scale in (0.2, 1.0, 10.0):
+            self.assertIsNotNone(self.click_near_stroke(scale, 3), scale)
+            self.assertIsNone(self.click_near_stroke(scale, 12), scale)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,112 @@
+# --- Uji Penyimpanan Ringkas Titik dan Gaya ---
+# Jalankan dari direktori root repositori: python -m pytest tests
+import pickle
+import unittest
+from array import array
+
+import affine
+import store
+import synthetic
+from scene import Scene, Shape
+from stub_tk import make_stub_app
+
+
+# Geometri semua objek adegan sebagai list tuple, sesuai urutan gambar.
+def snapshot(shapes):
+    return [[tuple(p) for p in affine.as_list(shape.points)] for shape in shapes]
+
+
+class CompactTest(unittest.TestCase):
+    # Titik list tuple dipindahkan ke buffer bersama tanpa mengubah geometri.
+    def test_compact_keeps_geometry(self):
+        scene = Scene()
+        for shape in synthetic.make_shapes(300, 20, seed=1): scene.add(shape)
+        before = snapshot(scene)
+        moved = scene.compact()
+        self.assertEqual(moved, sum(len(shape.base_points) for shape in scene
+                                    if shape.ellipse is None))
+        self.assertTrue(all(store.is_compact(shape.base_points) for shape in scene))
+        self.assertEqual(snapshot(scene), before)
+        # Tidak ada lagi yang perlu dipindahkan.
+        self.assertEqual(scene.compact(), 0)
+
+    # Objek dipindahkan hanya setelah jumlah titik baru mencapai 'min_points'.
+    def test_min_points(self):
+        scene = Scene()
+        scene.add(Shape('line', [(i, i) for i in range(10)], 'black', 1))
+        self.assertEqual(scene.compact(100), 0)
+        scene.add(Shape('line', [(i, 0) for i in range(90)], 'black', 1))
+        self.assertEqual(scene.compact(100), 100)
+
+    # Objek yang sudah keluar dari adegan tidak disentuh.
+    def test_skips_removed_shapes(self):
+        scene = Scene()
+        removed = scene.add(Shape('line', [(0, 0), (5, 5)], 'black', 1))
+        kept = scene.add(Shape('line', [(0, 0), (5, 5)], 'black', 1))
+        scene.remove(removed)
+        self.assertEqual(scene.compact(), 2)
+        self.assertFalse(store.is_compact(removed.base_points))
+        self.assertTrue(store.is_compact(kept.base_points))
+
+    # Compact saat menggambar ulang setelah clipping tidak merusak undo/redo.
+    def test_undo_after_compact(self):
+        app, _ = make_stub_app()
+        for shape in synthetic.make_shapes(200, 20, size=(800, 800), seed=2): app.scene.add(shape)
+        app.redraw_all()
+        before = snapshot(app.scene)
+        app._perform_clipping((200, 200, 600, 600))
+        after = snapshot(app.scene)
+        app.scene.compact()
+        app.undo()
+        self.assertEqual(snapshot(app.scene), before)
+        app.scene.compact()
+        app.redo()
+        self.assertEqual(snapshot(app.scene), after)
+
+
+class PackPointsTest(unittest.TestCase):
+    # Setiap kumpulan titik mendapat potongan buffer bersama dengan isi yang sama.
+    def test_views_match_inputs(self):
+        point_lists = [[(0.0, 1.0), (2.0, 3.0)], [], [(4.0, 5.0)]]
+        views = store.pack_points(point_lists)
+        self.assertEqual([affine.as_list(v) for v in views], point_lists)
+        self.assertEqual([store.points_nbytes(v, 112) for v in views], [32, 0, 16])
+
+    # Buffer bersama tidak bisa diubah di tempat.
+    @unittest.skipUnless(affine.HAVE_NUMPY, "buffer NumPy")
+    def test_buffer_is_read_only(self):
+        view, = store.pack_points([[(0.0, 1.0), (2.0, 3.0)]])
+        with self.assertRaises(ValueError):
+            view[0, 0] = 9.0
+
+    def test_lazy_points(self):
+        points = store.LazyPoints(array('d', [0, 1, 2, 3, 4, 5, 6, 7]), 1, 3)
+        self.assertEqual(len(points), 3)
+        self.assertEqual(points[0], (2, 3))
+        self.assertEqual(points[-1], (6, 7))
+        self.assertEqual(points[1:], [(4, 5), (6, 7)])
+        self.assertEqual(points.copy(), [(2, 3), (4, 5), (6, 7)])
+        with self.assertRaises(IndexError):
+            points[3]
+
+
+class StyleTest(unittest.TestCase):
+    # Gaya yang sama selalu berupa objek yang sama, juga setelah replace() dan pickle.
+    def test_styles_are_interned(self):
+        a = store.intern_style('black', 'black', 2.0, False)
+        self.assertIs(store.intern_style('black', 'black', 2.0, False), a)
+        b = a.replace(color='red')
+        self.assertIs(b.replace(color='black'), a)
+        self.assertIs(pickle.loads(pickle.dumps(a)), a)
+
+    # Objek dengan gaya yang sama berbagi satu objek Style.
+    def test_shapes_share_styles(self):
+        shapes = [Shape('line', [(i, 0), (i, 1)], 'blue', 3) for i in range(100)]
+        self.assertEqual(len({id(shape._style) for shape in shapes}), 1)
+        shapes[0].color = 'red'
+        self.assertIsNot(shapes[0]._style, shapes[1]._style)
+        self.assertEqual(shapes[1].color, 'blue')
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,63 @@
+# --- Uji Sorotan Window ---
+# Jalankan dari direktori root repositori: python -m pytest tests
+import unittest
+
+from scene import Scene, Shape, rect_corners
+from stub_tk import make_stub_app
+from windowing import WindowHighlighter
+
+
+class WindowHighlighterTest(unittest.TestCase):
+    # Objek yang keluar dari adegan saat disorot kembali ke warna aslinya.
+    def test_removed_member_gets_original_color(self):
+        scene = Scene()
+        highlighter = WindowHighlighter(scene, 'red')
+        shape = scene.add(Shape('rectangle', rect_corners(10, 10, 50, 50), 'black', 2))
+        highlighter.set_window((0, 0, 100, 100))
+        self.assertEqual(shape.color, 'red')
+        scene.remove(shape)
+        self.assertEqual(shape.color, 'black')
+        self.assertNotIn(shape, highlighter.members)
+        # Objek yang dimasukkan kembali tanpa window aktif tetap berwarna asli.
+        highlighter.set_window(None)
+        scene.add(shape)
+        highlighter.update()
+        self.assertEqual(shape.color, 'black')
+
+    # Bersihkan kanvas saat window aktif lalu Undo: objek kembali tanpa warna sorotan.
+    def test_clear_then_undo_restores_original_color(self):
+        app, _ = make_stub_app()
+        shape = app.scene.add(Shape('rectangle', rect_corners(10, 10, 50, 50), 'black', 2))
+        app.history.record_add(shape)
+        app.window_coords = (0, 0, 100, 100)
+        app._apply_windowing_effect()
+        self.assertEqual(shape.color, app.window_highlighter.highlight_color)
+        app.clear_canvas()
+        app.undo()
+        self.assertIsNone(app.window_coords)
+        self.assertIn(shape, list(app.scene))
+        self.assertEqual(shape.color, 'black')
+
+    # Clipping goresan yang sedang disorot lalu hapus window: semua potongan hasil clipping
+    # kembali ke warna asli, termasuk potongan yang jatuh di luar window sorotan.
+    def test_clip_then_clear_window_restores_original_color(self):
+        app, _ = make_stub_app()
+        # Goresan zig-zag yang keluar-masuk window clipping beberapa kali.
+        points = [(x, 50 if (x // 20) % 2 else 150) for x in range(0, 200, 10)]
+        app.scene.add(Shape('line', points, 'black', 2))
+        app.window_coords = (0, 0, 60, 200)
+        app._apply_windowing_effect()
+        app.redraw_all()
+        app._perform_clipping((0, 40, 200, 60))
+        app.redraw_all()
+        self.assertGreater(len(app.scene), 1)
+        # Potongan di dalam window sorotan tetap disorot selama window aktif.
+        for shape in app.scene:
+            inside = shape.bbox[0] <= 60
+            self.assertEqual(shape.color, 'red' if inside else 'black')
+        app._clear_window()
+        self.assertEqual([shape.color for shape in app.scene], ['black'] * len(app.scene))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,197 @@
+# --- Renderer Berbasis Tile dengan Pelacakan Area Kotor ---
+# Alternatif untuk CanvasRenderer pada kanvas yang besar dan padat. Kanvas dibagi
+# menjadi grid tile berukuran tetap; setiap tile adalah satu gambar offscreen (Raster)
+# yang ditampilkan lewat satu item gambar kanvas (misalnya tk.PhotoImage). Saat objek
+# berubah, bounding box lama dan barunya ditandai kotor di grid tile, dan hanya tile
+# kotor yang digambar ulang dari objek-objek yang bersinggungan dengannya.
+# Buffer Raster dan gambar setiap tile dipakai ulang, tidak dibuat ulang setiap frame.
+# Tile berada di koordinat layar; objek digambar lewat matriks Viewport (zoom/pan), dan
+# hanya tile di area terlihat yang dibuat, sehingga objek di luar tampilan tidak digambar.
+# Modul ini tidak mengimpor tkinter; pembuat gambar ('photo_factory', misalnya
+# tk.PhotoImage) diberikan dari luar.
+import math
+
+from raster import Raster
+from viewport import Viewport
+
+# Ukuran sisi tile default (piksel).
+DEFAULT_TILE_SIZE = 128
+
+
+# --- Kelas DirtyRegion ---
+# Mencatat tile mana saja yang kotor dalam grid tile berukuran 'tile_size'.
+class DirtyRegion:
+    def __init__(self, tile_size=DEFAULT_TILE_SIZE):
+        self.tile_size = tile_size
+        # Set kunci tile (tx, ty) yang kotor.
+        self.tiles = set()
+
+    # Rentang tile (tx0, ty0, tx1, ty1) inklusif yang dicakup sebuah bounding box.
+    def tile_range(self, rect):
+        size = self.tile_size
+        return (math.floor(rect[0] / size), math.floor(rect[1] / size),
+                math.floor(rect[2] / size), math.floor(rect[3] / size))
+
+    # Menandai semua tile yang bersinggungan dengan 'rect' sebagai kotor.
+    def mark(self, rect):
+        if rect is None: return
+        tx0, ty0, tx1, ty1 = self.tile_range(rect)
+        for ty in range(max(0, ty0), ty1 + 1):
+            for tx in range(max(0, tx0), tx1 + 1):
+                self.tiles.add((tx, ty))
+
+    # Mengambil semua tile kotor lalu mengosongkan catatan.
+    def take(self):
+        tiles, self.tiles = self.tiles, set()
+        return tiles
+
+    def __len__(self):
+        return len(self.tiles)
+
+
+# --- Kelas TileRenderer ---
+# Antarmukanya sama dengan CanvasRenderer (flush, rebuild, has_pending, item_for),
+# sehingga DrawingApp bisa memakai salah satunya.
+class TileRenderer:
+    def __init__(self, canvas, scene, photo_factory, tile_size=DEFAULT_TILE_SIZE,
+                 background='white', viewport=None):
+        self.canvas = canvas
+        self.scene = scene
+        # Transformasi tampilan dunia -> layar.
+        self.viewport = viewport if viewport is not None else Viewport()
+        # Fungsi pembuat gambar kanvas (misalnya tk.PhotoImage).
+        self.photo_factory = photo_factory
+        self.background = background
+        self.dirty = DirtyRegion(tile_size)
+        # Tile yang sudah dibuat: (tx, ty) -> [Raster, gambar, ID item kanvas].
+        self.tiles = {}
+        # Bounding box dunia (sudah diberi margin ketebalan) terakhir yang digambar untuk setiap objek.
+        self._drawn_bbox = {}
+        # Objek yang geometri atau gayanya berubah sejak flush terakhir.
+        self._changed = set()
+        # Margin terbesar yang pernah dipakai, agar query tile juga menemukan objek tebal
+        # yang bounding box geometrinya sedikit di luar tile.
+        self._max_margin = 0.0
+        # Urutan gambar objek (id objek -> nomor urut), dihitung ulang hanya saat urutan berubah.
+        self._order = None
+        self._next_order = 0
+        # Jumlah tile yang digambar ulang pada flush terakhir.
+        self.last_flush_tiles = 0
+        scene.subscribe(self._on_scene_event)
+        self._changed.update(scene)
+
+    @property
+    def tile_size(self):
+        return self.dirty.tile_size
+
+    # Bounding box objek ditambah margin ketebalan garis (titik digambar dengan radius = ketebalan).
+    def _padded_bbox(self, shape):
+        bbox = shape.bbox
+        if bbox is None: return None
+        margin = shape.width + 1
+        self._max_margin = max(self._max_margin, margin)
+        return (bbox[0] - margin, bbox[1] - margin, bbox[2] + margin, bbox[3] + margin)
+
+    # Pendengar perubahan Scene: hanya mencatat objek yang berubah.
+    def _on_scene_event(self, event, shape):
+        if event == 'removed':
+            self.dirty.mark(self.viewport.screen_bbox(self._drawn_bbox.pop(shape, None)))
+            self._changed.discard(shape)
+            if self._order is not None: self._order.pop(id(shape), None)
+        elif event == 'added':
+            self._changed.add(shape)
+            # Tanpa event 'reordered', objek baru selalu berada di atas objek lama.
+            if self._order is not None:
+                self._order[id(shape)] = self._next_order
+                self._next_order += 1
+        elif event in ('geometry', 'style'):
+            self._changed.add(shape)
+        elif event == 'reordered':
+            self._order = None
+
+    # Mengembalikan True jika ada perubahan yang belum digambar.
+    def has_pending(self):
+        return bool(self._changed or self.dirty.tiles)
+
+    # Tidak ada item kanvas per objek pada renderer ini.
+    def item_for(self, shape):
+        return None
+
+    def shape_for(self, tk_id):
+        return None
+
+    # Ukuran area kanvas yang terlihat (tile di luar area ini tidak dibuat).
+    def _visible_size(self):
+        width, height = self.canvas.winfo_width(), self.canvas.winfo_height()
+        return max(1, width), max(1, height)
+
+    # Menerapkan perubahan: tandai bounding box lama dan baru setiap objek yang berubah,
+    # lalu gambar ulang hanya tile yang kotor.
+    def flush(self):
+        to_screen = self.viewport.screen_bbox
+        for shape in self._changed:
+            if shape._scene is not self.scene: continue
+            self.dirty.mark(to_screen(self._drawn_bbox.get(shape)))
+            bbox = self._padded_bbox(shape)
+            self.dirty.mark(to_screen(bbox))
+            if bbox is None: self._drawn_bbox.pop(shape, None)
+            else: self._drawn_bbox[shape] = bbox
+        self._changed = set()
+        width, height = self._visible_size()
+        size = self.tile_size
+        tiles = [key for key in self.dirty.take()
+                 if key[0] * size < width and key[1] * size < height]
+        for key in tiles: self._render_tile(key)
+        self.last_flush_tiles = len(tiles)
+
+    # Menggambar ulang satu tile dari objek-objek yang bersinggungan dengannya.
+    def _render_tile(self, key):
+        size = self.tile_size
+        x0, y0 = key[0] * size, key[1] * size
+        tile = self.tiles.get(key)
+        if tile is None:
+            raster = Raster(size, size, self.background, origin=(x0, y0))
+            photo = self.photo_factory(width=size, height=size)
+            tk_id = self.canvas.create_image(x0, y0, image=photo, anchor='nw')
+            # Tile selalu berada di bawah item lain (kotak seleksi, pratinjau, window).
+            self.canvas.tag_lower(tk_id)
+            tile = self.tiles[key] = [raster, photo, tk_id]
+        else:
+            raster = tile[0]
+            raster.clear()
+        margin = self._max_margin
+        wx0, wy0, wx1, wy1 = self.viewport.world_bbox((x0, y0, x0 + size, y0 + size))
+        shapes = self.scene.query((wx0 - margin, wy0 - margin, wx1 + margin, wy1 + margin))
+        if shapes:
+            order = self._shape_order()
+            matrix = self.viewport.matrix
+            for shape in sorted(shapes, key=lambda s: order.get(id(s), 0)):
+                raster.draw_shape(shape, matrix)
+        tile[1].configure(data=raster.to_ppm(), format='PPM')
+
+    # Pemetaan id(objek) -> nomor urut gambar, dihitung ulang hanya jika urutan berubah.
+    def _shape_order(self):
+        if self._order is None:
+            self._order = {id(shape): i for i, shape in enumerate(self.scene)}
+            self._next_order = len(self._order)
+        return self._order
+
+    # Menandai seluruh area terlihat sebagai kotor (misalnya setelah ukuran kanvas berubah).
+    def invalidate(self):
+        width, height = self._visible_size()
+        self.dirty.mark((0, 0, width - 1, height - 1))
+
+    # Setelah zoom/pan, seluruh tile terlihat digambar ulang dengan tampilan baru.
+    def view_changed(self):
+        self.invalidate()
+
+    # Menghapus semua tile lalu menggambar ulang dari awal.
+    def rebuild(self):
+        for tile in self.tiles.values(): self.canvas.delete(tile[2])
+        self.tiles = {}
+        self._drawn_bbox = {}
+        self._order = None
+        self.dirty.take()
+        self._changed = set(self.scene)
+        self.invalidate()
+        self.flush()
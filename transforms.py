@@ -0,0 +1,190 @@
+# --- Logika Transformasi ---
+# Translasi, rotasi, dan skala sebagai fungsi murni di atas Shape.
+# Setiap transformasi dibangun sebagai satu matriks affine 3x3 (lihat modul 'affine').
+# Matriks tidak langsung diterapkan ke titik: Shape menyimpannya sebagai transformasi
+# tertunda yang baru di-bake saat drag selesai atau saat koordinat nyata dibutuhkan.
+# Transformasi sekelompok objek memakai satu buffer titik terkemas (PackedPoints) sehingga
+# matriksnya diterapkan dalam satu perkalian untuk seluruh grup.
+# Tidak bergantung pada tkinter.
+import math
+
+import affine
+
+
+# Fungsi untuk menghitung titik tengah (centroid) dari sebuah bentuk.
+def get_shape_center(points):
+    return affine.centroid(points)
+
+# Fungsi untuk memutar sekumpulan titik mengelilingi sebuah pusat (center).
+def rotate_points(points, center, angle):
+    return affine.apply(affine.rotation(angle, center), points)
+
+# Fungsi untuk menghitung sudut rotasi dari gerakan mouse di sekitar pusat objek.
+def drag_rotation_angle(center, prev_pos, current_pos):
+    cx, cy = center
+    # Hitung sudut dari pusat ke posisi mouse sebelumnya dan saat ini.
+    start_angle = math.atan2(prev_pos[1] - cy, prev_pos[0] - cx)
+    current_angle = math.atan2(current_pos[1] - cy, current_pos[0] - cx)
+    # Selisih sudut adalah besar rotasi yang harus diterapkan.
+    return current_angle - start_angle
+
+# Fungsi untuk menentukan faktor skala dari total gerakan vertikal sejak awal drag.
+# Bentuk eksponensial sama dengan mengalikan (1 + dy/100) untuk langkah-langkah kecil,
+# tetapi selalu positif dan kembali tepat ke 1.0 saat mouse kembali ke posisi awal.
+def drag_total_scale_factor(total_dy):
+    return math.exp(total_dy / 100.0)
+
+# Fungsi untuk menerapkan matriks affine ke sebuah objek (secara malas).
+def transform_shape(shape, matrix):
+    shape.apply_transform(matrix)
+
+# Fungsi untuk menggeser (translasi) sebuah objek.
+def translate_shape(shape, dx, dy):
+    transform_shape(shape, affine.translation(dx, dy))
+
+# Fungsi untuk memutar sebuah objek sebesar 'angle' radian mengelilingi 'center'.
+def rotate_shape(shape, angle, center=None):
+    if center is None: center = shape.center
+    # Akumulasi total sudut rotasi.
+    shape.rotation_angle += angle
+    # Putar semua titik objek.
+    transform_shape(shape, affine.rotation(angle, center))
+
+# Fungsi untuk mengubah skala sebuah objek terhadap pusatnya. Ketebalan garis ikut
+# berubah karena diturunkan dari skala matriks (untuk titik, hanya ketebalannya yang
+# terlihat berubah karena pusatnya tetap).
+def scale_shape(shape, scale_factor):
+    transform_shape(shape, affine.scaling(scale_factor, shape.center))
+
+
+# --- Transformasi Grup ---
+# Titik tengah grup: rata-rata titik tengah objek-objeknya.
+def group_center(shapes):
+    centers = [shape.center for shape in shapes]
+    if not centers: return 0.0, 0.0
+    return (sum(c[0] for c in centers) / len(centers), sum(c[1] for c in centers) / len(centers))
+
+# Bounding box gabungan (xmin, ymin, xmax, ymax) sekelompok objek, atau None.
+def group_bbox(shapes):
+    boxes = [box for box in (shape.bbox for shape in shapes) if box is not None]
+    if not boxes: return None
+    return (min(b[0] for b in boxes), min(b[1] for b in boxes),
+            max(b[2] for b in boxes), max(b[3] for b in boxes))
+
+# Titik-titik (koordinat nyata) sekelompok objek yang dikemas berurutan ke satu buffer,
+# beserta matriks setiap objek saat dikemas. Elips analitik dan objek tanpa titik tidak
+# dikemas ('others'); matriksnya cukup digabung tanpa menghitung titik.
+class PackedPoints:
+    def __init__(self, shapes):
+        self.shapes, self.others = [], []
+        for shape in shapes:
+            if shape.ellipse is None and len(shape.points): self.shapes.append(shape)
+            else: self.others.append(shape)
+        self.matrices = [shape.matrix for shape in self.shapes]
+        self.offsets = [0]
+        for shape in self.shapes: self.offsets.append(self.offsets[-1] + len(shape.points))
+        if affine.HAVE_NUMPY:
+            arrays = [affine.as_array(shape.points) for shape in self.shapes]
+            self.buffer = affine.np.concatenate(arrays) if arrays else affine.np.zeros((0, 2))
+        else:
+            self.buffer = [p for shape in self.shapes for p in affine.as_list(shape.points)]
+
+    # Menerapkan 'delta' setelah matriks awal setiap objek. Titik seluruh grup dihitung
+    # dalam satu perkalian, lalu setiap objek menerima potongannya sebagai cache.
+    def transform(self, delta):
+        points, offsets = affine.apply(delta, self.buffer), self.offsets
+        for i, (shape, start) in enumerate(zip(self.shapes, self.matrices)):
+            shape.set_transform(affine.compose(delta, start), points[offsets[i]:offsets[i + 1]])
+
+# Menerapkan matriks 'matrix' ke sekelompok objek sekaligus lalu mem-bake hasilnya.
+def transform_shapes(shapes, matrix):
+    packed = PackedPoints(shapes)
+    packed.transform(matrix)
+    for shape in packed.others: shape.apply_transform(matrix)
+    for shape in shapes: shape.bake()
+
+
+# --- Kelas DragTransform ---
+# Satu sesi drag transformasi (Translate, Rotate, atau Scale) pada sebuah objek.
+# Setiap event mouse menghitung transformasi TOTAL dari posisi awal drag, lalu
+# menggabungkannya dengan matriks objek saat drag dimulai. Tidak ada titik yang
+# ditulis ulang per event, tidak ada galat yang menumpuk, dan menggerakkan mouse
+# kembali ke posisi awal mengembalikan objek tepat ke keadaan semula.
+class DragTransform:
+    def __init__(self, shape, mode, start_pos):
+        self.shape = shape
+        # Mode transformasi: 'Translate', 'Rotate', atau 'Scale'.
+        self.mode = mode
+        self.start_pos = start_pos
+        # Keadaan objek saat drag dimulai.
+        self.start_matrix = shape.matrix
+        self.start_rotation = shape.rotation_angle
+        # Pusat rotasi/skala ditetapkan saat drag dimulai.
+        self.center = shape.center
+        # Posisi mouse terakhir dan total sudut rotasi (dibuka agar tidak melompat 2*pi).
+        self.last_pos = start_pos
+        self.angle = 0.0
+        # Matriks transformasi total sejak awal drag.
+        self.delta = affine.IDENTITY
+
+    # Menghitung matriks transformasi total untuk posisi mouse 'pos'.
+    def _delta_matrix(self, pos):
+        x0, y0 = self.start_pos
+        if self.mode == 'Translate':
+            return affine.translation(pos[0] - x0, pos[1] - y0)
+        if self.mode == 'Rotate':
+            step = drag_rotation_angle(self.center, self.last_pos, pos)
+            # Normalisasi langkah ke (-pi, pi] agar sudut total tetap kontinu.
+            step = (step + math.pi) % (2 * math.pi) - math.pi
+            self.angle += step
+            return affine.rotation(self.angle, self.center)
+        if self.mode == 'Scale':
+            return affine.scaling(drag_total_scale_factor(pos[1] - y0), self.center)
+        return affine.IDENTITY
+
+    # Memperbarui objek untuk posisi mouse terbaru. Biayanya O(1): hanya matriks yang diganti.
+    def update(self, pos):
+        self.delta = self._delta_matrix(pos)
+        self.last_pos = pos
+        if self.mode == 'Rotate': self.shape.rotation_angle = self.start_rotation + self.angle
+        self.shape.set_transform(affine.compose(self.delta, self.start_matrix))
+
+    # Mengakhiri drag: matriks di-bake ke titik sumber. Mengembalikan matriks total drag.
+    def commit(self):
+        self.shape.bake()
+        return self.delta
+
+
+# --- Kelas GroupDragTransform ---
+# Sesi drag transformasi untuk beberapa objek sekaligus. Rotasi dan skala berpusat di
+# titik tengah grup. Titik semua objek dikemas sekali saat drag dimulai; setiap event
+# mouse menerapkan matriks total ke buffer itu dalam satu perkalian.
+class GroupDragTransform(DragTransform):
+    def __init__(self, shapes, mode, start_pos):
+        self.shapes = list(shapes)
+        self.mode = mode
+        self.start_pos = start_pos
+        # Keadaan objek saat drag dimulai.
+        self.packed = PackedPoints(self.shapes)
+        self.start_matrices = [shape.matrix for shape in self.packed.others]
+        self.start_rotations = [shape.rotation_angle for shape in self.shapes]
+        self.center = group_center(self.shapes)
+        self.last_pos = start_pos
+        self.angle = 0.0
+        self.delta = affine.IDENTITY
+
+    # Memperbarui semua objek grup untuk posisi mouse terbaru.
+    def update(self, pos):
+        self.delta = self._delta_matrix(pos)
+        self.last_pos = pos
+        if self.mode == 'Rotate':
+            for shape, rotation in zip(self.shapes, self.start_rotations):
+                shape.rotation_angle = rotation + self.angle
+        self.packed.transform(self.delta)
+        for shape, start in zip(self.packed.others, self.start_matrices):
+            shape.set_transform(affine.compose(self.delta, start))
+
+    # Mengakhiri drag: matriks semua objek di-bake (titiknya sudah ada di cache).
+    def commit(self):
+        for shape in self.shapes: shape.bake()
+        return self.delta
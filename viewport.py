@@ -0,0 +1,81 @@
+# --- Viewport (Transformasi Dunia ke Layar) ---
+# Objek adegan disimpan dalam koordinat dunia. Viewport memetakan koordinat dunia ke
+# koordinat kanvas (layar) dengan skala seragam dan pergeseran:
+#     layar = dunia * scale + offset
+# sehingga adegan bisa di-zoom dan digeser (pan) tanpa mengubah titik objek.
+# Renderer memakai world_rect() untuk menentukan objek mana yang terlihat (culling),
+# dan DrawingApp memakai to_world() untuk memetakan event mouse kembali ke dunia.
+# Tidak bergantung pada tkinter.
+import affine
+
+# Batas skala zoom.
+MIN_SCALE = 0.02
+MAX_SCALE = 50.0
+# Faktor zoom untuk satu langkah roda mouse.
+ZOOM_STEP = 1.2
+
+
+# --- Kelas Viewport ---
+class Viewport:
+    def __init__(self, scale=1.0, offset=(0.0, 0.0)):
+        self.scale = scale
+        self.offset_x, self.offset_y = offset
+
+    # Matriks affine dunia -> layar.
+    @property
+    def matrix(self):
+        return (self.scale, 0.0, self.offset_x, 0.0, self.scale, self.offset_y)
+
+    # Mengecek apakah viewport tidak mengubah koordinat (dunia = layar).
+    def is_identity(self):
+        return self.matrix == affine.IDENTITY
+
+    # Memetakan titik layar (x, y) ke koordinat dunia.
+    def to_world(self, x, y):
+        return (x - self.offset_x) / self.scale, (y - self.offset_y) / self.scale
+
+    # Memetakan titik dunia (x, y) ke koordinat layar.
+    def to_screen(self, x, y):
+        return x * self.scale + self.offset_x, y * self.scale + self.offset_y
+
+    # Memetakan kumpulan titik dunia ke layar.
+    def points_to_screen(self, points):
+        if self.is_identity(): return points
+        return affine.apply(self.matrix, points)
+
+    # Memetakan bounding box dunia ke bounding box layar (atau None).
+    def screen_bbox(self, bbox):
+        if bbox is None or self.is_identity(): return bbox
+        x0, y0 = self.to_screen(bbox[0], bbox[1])
+        x1, y1 = self.to_screen(bbox[2], bbox[3])
+        return (x0, y0, x1, y1)
+
+    # Memetakan persegi layar (xmin, ymin, xmax, ymax) ke persegi dunia.
+    def world_bbox(self, rect):
+        x0, y0 = self.to_world(rect[0], rect[1])
+        x1, y1 = self.to_world(rect[2], rect[3])
+        return (x0, y0, x1, y1)
+
+    # Area dunia yang terlihat pada kanvas berukuran 'width' x 'height' piksel.
+    def world_rect(self, width, height):
+        return self.world_bbox((0, 0, width, height))
+
+    # Menggeser tampilan sebesar (dx, dy) piksel layar.
+    def pan(self, dx, dy):
+        self.offset_x += dx
+        self.offset_y += dy
+
+    # Mengubah skala sebesar 'factor' dengan titik layar (x, y) tetap di tempatnya
+    # (misalnya posisi kursor). Mengembalikan False jika skala sudah mencapai batas.
+    def zoom_at(self, factor, x, y):
+        scale = min(MAX_SCALE, max(MIN_SCALE, self.scale * factor))
+        if scale == self.scale: return False
+        wx, wy = self.to_world(x, y)
+        self.scale = scale
+        self.offset_x, self.offset_y = x - wx * scale, y - wy * scale
+        return True
+
+    # Mengembalikan tampilan ke skala 1 tanpa pergeseran.
+    def reset(self):
+        self.scale = 1.0
+        self.offset_x = self.offset_y = 0.0
@@ -0,0 +1,85 @@
+# --- Logika Windowing ---
+# Efek windowing: objek yang bersinggungan dengan window diberi warna sorotan.
+# Tidak bergantung pada tkinter.
+from scene import bbox_intersects
+
+# Warna default yang digunakan untuk menyorot objek saat windowing.
+DEFAULT_HIGHLIGHT_COLOR = "red"
+
+
+# Fungsi untuk menerapkan efek windowing (mengubah warna objek) pada adegan.
+# 'previous' adalah kumpulan objek yang disorot pada pemanggilan sebelumnya; jika
+# diberikan, hanya objek tersebut dan kandidat dari query window yang disentuh.
+# Mengembalikan set objek yang kini disorot.
+def apply_windowing_effect(scene, window_coords, highlight_color=DEFAULT_HIGHLIGHT_COLOR,
+                           previous=None):
+    # Tanpa informasi sorotan sebelumnya, semua objek perlu diperiksa.
+    if previous is None: previous = scene
+    # Jika tidak ada window aktif, kembalikan semua warna ke aslinya.
+    if not window_coords:
+        for shape in previous: shape.color = shape.original_color
+        return set()
+    # Objek yang bersinggungan dengan window diberi warna sorotan.
+    highlighted = set(scene.query(window_coords))
+    for shape in highlighted: shape.color = highlight_color
+    # Objek yang sebelumnya disorot tetapi kini di luar window dikembalikan ke warna asli.
+    for shape in previous:
+        if shape not in highlighted: shape.color = shape.original_color
+    return highlighted
+
+
+# --- Kelas WindowHighlighter ---
+# Menyimpan keanggotaan window (objek yang bersinggungan dengan window) sebagai set yang
+# dipelihara secara inkremental lewat event Scene:
+#   - window berganti   : keanggotaan dihitung ulang lewat query indeks,
+#   - objek masuk/berubah: hanya objek tersebut yang diuji ulang saat update(),
+#   - objek keluar      : dihapus dari set dan warnanya dikembalikan ke warna asli, agar
+#                         objek yang dimasukkan kembali (undo/redo) tidak membawa sorotan.
+# Warna hanya ditulis untuk objek yang keanggotaannya berubah, sehingga biaya sebuah frame
+# drag sebanding dengan jumlah objek yang bergerak, bukan dengan besar adegan.
+class WindowHighlighter:
+    def __init__(self, scene, highlight_color=DEFAULT_HIGHLIGHT_COLOR):
+        self.scene = scene
+        self.highlight_color = highlight_color
+        # Window aktif (xmin, ymin, xmax, ymax) atau None.
+        self.window = None
+        # Objek yang sedang disorot.
+        self.members = set()
+        # Objek yang masuk atau geometrinya berubah sejak update() terakhir.
+        self._dirty = set()
+        scene.subscribe(self._on_scene_event)
+
+    # Pendengar perubahan Scene.
+    def _on_scene_event(self, event, shape):
+        if event in ('added', 'geometry'):
+            if self.window is not None: self._dirty.add(shape)
+        elif event == 'removed':
+            if shape in self.members:
+                self.members.discard(shape)
+                shape.color = shape.original_color
+            self._dirty.discard(shape)
+
+    # Mengganti window (None = tidak ada window) dan menghitung ulang seluruh keanggotaan.
+    def set_window(self, window):
+        self.window = window
+        self._dirty = set()
+        members = set(self.scene.query(window)) if window else set()
+        for shape in self.members - members: shape.color = shape.original_color
+        for shape in members - self.members: shape.color = self.highlight_color
+        self.members = members
+        return members
+
+    # Menguji ulang hanya objek yang masuk/berubah sejak pemanggilan sebelumnya.
+    def update(self):
+        if not self._dirty: return
+        dirty, self._dirty = self._dirty, set()
+        window, members = self.window, self.members
+        for shape in dirty:
+            bbox = shape.bbox
+            inside = bbox is not None and bbox_intersects(bbox, window)
+            if inside and shape not in members:
+                members.add(shape)
+                shape.color = self.highlight_color
+            elif not inside and shape in members:
+                members.discard(shape)
+                shape.color = shape.original_color